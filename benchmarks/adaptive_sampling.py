@@ -0,0 +1,74 @@
+"""
+Count the points batch_adaptive_scan needs compared with a uniform scan.
+
+For some benchmark peak shapes, run the refinement of
+``bluesky.plans.batch_adaptive_scan`` (without a RunEngine) and then find the
+smallest evenly spaced scan that interpolates the curve as accurately. Also
+report the number of rounds, i.e. of sweeps of the motor.
+
+    python benchmarks/adaptive_sampling.py [tolerance] [batch_size]
+"""
+
+import sys
+
+import numpy as np
+
+from bluesky.plan_patterns import refine_points
+
+START, STOP, MIN_STEP, MAX_STEP = -10.0, 10.0, 0.001, 2.0
+
+SHAPES = {
+    "gaussian": lambda x: np.exp(-(x**2) / (2 * 0.3**2)),
+    "lorentzian": lambda x: 1 / (1 + (x / 0.2) ** 2),
+    "edge": lambda x: 1 / (1 + np.exp(-x / 0.1)),
+    "two peaks": lambda x: np.exp(-((x + 3) ** 2) / 0.5) + 0.5 * np.exp(-((x - 4) ** 2) / 0.05),
+}
+
+
+def adaptive(shape, tolerance, batch_size, num_initial=5):
+    positions = list(np.linspace(START, STOP, num_initial))
+    rounds = 1
+    while True:
+        batch = refine_points(
+            positions,
+            shape(np.array(positions)),
+            num=batch_size,
+            min_step=MIN_STEP,
+            max_step=MAX_STEP,
+            tolerance=tolerance,
+        )
+        if not len(batch):
+            return np.sort(positions), rounds
+        positions.extend(batch)
+        rounds += 1
+
+
+def interpolation_error(shape, positions):
+    fine = np.linspace(START, STOP, 200_001)
+    return np.max(np.abs(np.interp(fine, positions, shape(positions)) - shape(fine)))
+
+
+def uniform_points_for(shape, error):
+    # smallest evenly spaced scan at least as accurate, by bisection
+    low, high = 2, int((STOP - START) / MIN_STEP) + 1
+    while low < high:
+        mid = (low + high) // 2
+        if interpolation_error(shape, np.linspace(START, STOP, mid)) <= error:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def main(tolerance=0.01, batch_size=4):
+    print(f"{'shape':>10} {'adaptive':>9} {'rounds':>7} {'uniform':>8} {'saved':>7} {'max error':>10}")
+    for name, shape in SHAPES.items():
+        positions, rounds = adaptive(shape, tolerance, batch_size)
+        error = interpolation_error(shape, positions)
+        uniform = uniform_points_for(shape, error)
+        saved = 1 - len(positions) / uniform
+        print(f"{name:>10} {len(positions):>9} {rounds:>7} {uniform:>8} {saved:>7.0%} {error:>10.4f}")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if i == 0 else int(arg) for i, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,51 @@
+"""
+Compare the time the RunEngine spends on a count with a BestEffortCallback
+processing each document as it is emitted and with one processing them in
+the background at a fixed refresh rate.
+
+    python benchmarks/bec_refresh.py [num] [refresh_rate]
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from ophyd.sim import SynAxis, SynGauss  # noqa: E402
+
+from bluesky import RunEngine  # noqa: E402
+from bluesky.callbacks.best_effort import BestEffortCallback  # noqa: E402
+from bluesky.plans import scan  # noqa: E402
+
+
+def run(num, **kwargs):
+    motor = SynAxis(name="motor")
+    det = SynGauss("det", motor, "motor", center=0, Imax=1, sigma=1)
+    RE = RunEngine({})
+    bec = BestEffortCallback(**kwargs)
+    RE.subscribe(bec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        RE(scan([det], motor, -5, 5, num))
+        elapsed = time.perf_counter() - start
+        bec.flush()
+        total = time.perf_counter() - start
+    return elapsed, total
+
+
+def main(num=2000, refresh_rate=10.0):
+    print(f"scan of {num} points")
+    for label, kwargs in [("synchronous", {}), (f"refresh_rate={refresh_rate:g}", {"refresh_rate": refresh_rate})]:
+        elapsed, total = run(num, **kwargs)
+        print(
+            f"  {label:>17}: RE {elapsed:6.2f} s ({elapsed / num * 1e3:.2f} ms/event), "
+            f"until rendered {total:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if i == 0 else float(arg) for i, arg in enumerate(sys.argv[1:])))
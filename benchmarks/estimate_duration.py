@@ -0,0 +1,46 @@
+"""
+Measure how fast ``bluesky.simulators.estimate_duration`` processes messages,
+separately for generating a long grid scan and for the virtual clock itself.
+
+    python benchmarks/estimate_duration.py [num_points_per_axis]
+"""
+
+import sys
+import time
+
+from ophyd.sim import SynAxis, SynGauss
+
+from bluesky.plans import grid_scan
+from bluesky.simulators import ExposureModel, MotionModel, estimate_duration
+
+
+def main(num=300):
+    motor1 = SynAxis(name="motor1")
+    motor2 = SynAxis(name="motor2")
+    det = SynGauss("det", motor1, "motor1", center=0, Imax=1, sigma=1)
+    models = {
+        motor1: MotionModel(velocity=1, acceleration=5, settle_time=0.01),
+        motor2: MotionModel(velocity=2, acceleration=5, settle_time=0.01),
+        det: ExposureModel(exposure_time=0.1, readout_time=0.005),
+    }
+
+    def plan():
+        return grid_scan([det], motor1, -1, 1, num, motor2, -1, 1, num, snake_axes=True)
+
+    start = time.perf_counter()
+    estimate = estimate_duration(plan(), models)
+    end_to_end = time.perf_counter() - start
+
+    messages = list(plan())
+    start = time.perf_counter()
+    estimate_duration(messages, models)
+    clock_only = time.perf_counter() - start
+
+    n = estimate.num_messages
+    print(estimate)
+    print(f"plan generation + estimate: {end_to_end:8.3f} s ({n / end_to_end * 60:,.0f} messages/minute)")
+    print(f"virtual clock only:         {clock_only:8.3f} s ({n / clock_only * 60:,.0f} messages/minute)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,59 @@
+"""
+Measure the per-event cost of re-emitting a derived stream with a
+LiveDispatcher, fed Events one at a time and as EventPages.
+
+    python benchmarks/live_dispatcher_events.py [num_columns] [num_events] [page_size]
+"""
+
+import sys
+import time
+
+from event_model import compose_run, pack_event_page
+
+from bluesky.callbacks.stream import LiveDispatcher
+
+
+class ScaledStream(LiveDispatcher):
+    """Derived stream with every reading doubled"""
+
+    def event(self, doc):
+        doc = dict(doc, data={key: 2 * value for key, value in doc["data"].items()})
+        return super().event(doc)
+
+
+def documents(num_columns, num_events):
+    run = compose_run()
+    keys = [f"det{i}" for i in range(num_columns)]
+    desc = run.compose_descriptor(
+        name="primary", data_keys={k: {"source": "", "dtype": "number", "shape": []} for k in keys}
+    )
+    events = [
+        desc.compose_event(data={k: float(i) for k in keys}, timestamps=dict.fromkeys(keys, 0.0))
+        for i in range(num_events)
+    ]
+    return run.start_doc, desc.descriptor_doc, events, run.compose_stop()
+
+
+def main(num_columns=5, num_events=20_000, page_size=100):
+    start_doc, descriptor_doc, events, stop_doc = documents(num_columns, num_events)
+    pages = [pack_event_page(*events[i : i + page_size]) for i in range(0, num_events, page_size)]
+    print(f"{num_events} events of {num_columns} columns")
+    for label, docs in [
+        ("event", [("event", event) for event in events]),
+        (f"event_page of {page_size}", [("event_page", page) for page in pages]),
+    ]:
+        received = []
+        stream = ScaledStream()
+        stream.subscribe(lambda name, doc, received=received: received.append(name))
+        stream("start", start_doc)
+        stream("descriptor", descriptor_doc)
+        start = time.perf_counter()
+        for name, doc in docs:
+            stream(name, doc)
+        elapsed = time.perf_counter() - start
+        stream("stop", stop_doc)
+        print(f"  {label:>18}: {elapsed / num_events * 1e6:7.2f} us/event, {len(received)} documents out")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Measure how long LiveFit holds up event dispatch on a long scan, fitting in
+the dispatching thread or in the background, with and without warm starts.
+Events arrive every ``interval`` milliseconds, as from a detector.
+
+    python benchmarks/live_fit_background.py [num_events] [update_every] [interval]
+"""
+
+import sys
+import time
+
+import lmfit
+import numpy as np
+
+from bluesky.callbacks.fitting import LiveFit
+
+
+def gaussian(x, A, sigma, x0):
+    return A * np.exp(-((x - x0) ** 2) / (2 * sigma**2))
+
+
+def events(num_events):
+    rng = np.random.default_rng(0)
+    for i, x in enumerate(np.linspace(-5, 5, num_events)):
+        y = gaussian(x, 1, 1, 0) + rng.normal(scale=0.01)
+        yield {"descriptor": "d", "seq_num": i + 1, "data": {"motor": float(x), "det": float(y)}}
+
+
+def run(num_events, update_every, interval, **kwargs):
+    init_guess = {"A": 2, "sigma": lmfit.Parameter("sigma", 3, min=0), "x0": -0.2}
+    cb = LiveFit(lmfit.Model(gaussian), "det", {"x": "motor"}, init_guess, update_every=update_every, **kwargs)
+    cb("start", {"uid": "s", "time": 0})
+    docs = list(events(num_events))
+    dispatch = slowest = 0
+    for doc in docs:
+        time.sleep(interval / 1000)
+        start = time.perf_counter()
+        cb("event", doc)
+        elapsed = time.perf_counter() - start
+        dispatch += elapsed
+        slowest = max(slowest, elapsed)
+    start = time.perf_counter()
+    cb("stop", {"uid": "e", "run_start": "s", "time": 0, "exit_status": "success"})
+    return dispatch, slowest, time.perf_counter() - start, cb.result.nfev
+
+
+def main(num_events=2000, update_every=10, interval=1):
+    print(f"{num_events} events {interval} ms apart, fit every {update_every}")
+    print(f"{'':>22} {'in events':>9} {'slowest event':>14} {'in stop':>8} {'final nfev':>11}")
+    for label, kwargs in [
+        ("in dispatch thread", {}),
+        ("warm start", {"warm_start": True}),
+        ("background", {"background": True}),
+        ("background, warm", {"background": True, "warm_start": True}),
+    ]:
+        dispatch, slowest, stop, nfev = run(num_events, update_every, interval, **kwargs)
+        print(f"{label:>22} {dispatch:8.2f}s {slowest * 1e3:12.1f}ms {stop * 1e3:6.1f}ms {nfev:>11}")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if i == 2 else int(arg) for i, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,46 @@
+"""
+Measure the time LiveGrid spends handling a fast stream of events into a
+large raster, with and without blitting and the redraw frame-rate cap.
+
+    python benchmarks/live_grid_redraw.py [num_events] [side]
+"""
+
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+from bluesky.callbacks.mpl_plotting import LiveGrid  # noqa: E402
+
+
+def feed(grid, num_events):
+    rng = np.random.default_rng(0)
+    grid("start", {"time": 0, "uid": "start", "scan_id": 1})
+    start = time.perf_counter()
+    for i, value in enumerate(rng.random(num_events)):
+        grid("event", {"data": {"det": value}, "seq_num": i + 1, "time": i * 0.01})
+    grid("stop", {"time": 0, "uid": "stop", "run_start": "start", "exit_status": "success"})
+    return time.perf_counter() - start
+
+
+def main(num_events=2000, side=500):
+    for label, kwargs in [
+        ("every event, full redraw", {"max_fps": None, "blit": False}),
+        ("every event, blit", {"max_fps": None, "blit": True}),
+        ("max_fps=30, blit", {"max_fps": 30, "blit": True}),
+    ]:
+        grid = LiveGrid((side, side), "det", **kwargs)
+        elapsed = feed(grid, num_events)
+        stats = grid.frame_stats
+        print(
+            f"{label:>25}: {elapsed:7.2f} s, {num_events / elapsed:8.0f} events/s, "
+            f"{stats['redraws']} redraws, {stats['dropped']} dropped"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""
+Measure the time LivePlot spends handling a fast stream of events, with and
+without the redraw frame-rate cap and display decimation.
+
+    python benchmarks/live_plot_redraw.py [num_events]
+"""
+
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from bluesky.callbacks.mpl_plotting import LivePlot  # noqa: E402
+
+
+def feed(lplot, num_events):
+    lplot("start", {"time": 0, "uid": "start", "scan_id": 1})
+    start = time.perf_counter()
+    for i in range(num_events):
+        lplot("event", {"data": {"det": float(i % 100)}, "seq_num": i + 1, "time": i * 0.01})
+    lplot("stop", {"time": 0, "uid": "stop", "run_start": "start", "exit_status": "success"})
+    return time.perf_counter() - start
+
+
+def main(num_events=5000):
+    for label, kwargs in [
+        ("every event", {"max_fps": None, "max_display_points": None}),
+        ("max_fps=30", {"max_fps": 30, "max_display_points": None}),
+        ("max_fps=30, max_display_points=2000", {"max_fps": 30, "max_display_points": 2000}),
+    ]:
+        lplot = LivePlot("det", **kwargs)
+        elapsed = feed(lplot, num_events)
+        stats = lplot.frame_stats
+        print(
+            f"{label:>36}: {elapsed:7.2f} s, {num_events / elapsed:8.0f} events/s, "
+            f"{stats['redraws']} redraws, {stats['dropped']} dropped"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
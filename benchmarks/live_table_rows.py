@@ -0,0 +1,55 @@
+"""
+Measure the time LiveTable takes per row for a wide table, fed Events one at
+a time and as EventPages.
+
+    python benchmarks/live_table_rows.py [num_columns] [num_events] [page_size]
+"""
+
+import sys
+import time
+
+from event_model import compose_run, pack_event_page
+
+from bluesky.callbacks import LiveTable
+
+
+def documents(num_columns, num_events):
+    run = compose_run()
+    keys = [f"det{i}" for i in range(num_columns)]
+    desc = run.compose_descriptor(
+        name="primary",
+        data_keys={k: {"source": "", "dtype": "number", "shape": [], "precision": 4} for k in keys},
+    )
+    t0 = time.time()
+    events = [
+        desc.compose_event(
+            data={k: i * 0.001 + j for j, k in enumerate(keys)},
+            timestamps=dict.fromkeys(keys, t0),
+            time=t0 + i * 0.01,
+        )
+        for i in range(num_events)
+    ]
+    return keys, run.start_doc, desc.descriptor_doc, events
+
+
+def main(num_columns=20, num_events=20_000, page_size=100):
+    keys, start_doc, descriptor_doc, events = documents(num_columns, num_events)
+    pages = [pack_event_page(*events[i : i + page_size]) for i in range(0, num_events, page_size)]
+    print(f"{num_events} rows of {num_columns} columns")
+    for label, docs, kwargs in [
+        ("event", [("event", event) for event in events], {}),
+        (f"event_page of {page_size}", [("event_page", page) for page in pages], {}),
+        ("  with batch_output", [("event_page", page) for page in pages], {"batch_output": True}),
+    ]:
+        table = LiveTable(keys, out=lambda line: None, **kwargs)
+        table("start", start_doc)
+        table("descriptor", descriptor_doc)
+        start = time.perf_counter()
+        for name, doc in docs:
+            table(name, doc)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:>20}: {elapsed / num_events * 1e6:7.2f} us/row")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""
+Measure the per-event cost and memory of PeakStats on a long scan, and the
+cost of getting statistics mid-run.
+
+    python benchmarks/peak_stats_streaming.py [num_events]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from event_model import compose_run
+
+from bluesky.callbacks.fitting import PeakStats
+
+
+def documents(num_events):
+    run = compose_run()
+    yield "start", run.start_doc
+    desc = run.compose_descriptor(
+        name="primary",
+        data_keys={
+            "motor": {"source": "", "dtype": "number", "shape": []},
+            "det": {"source": "", "dtype": "number", "shape": []},
+        },
+    )
+    yield "descriptor", desc.descriptor_doc
+    for x in np.linspace(-5, 5, num_events):
+        x = float(x)
+        y = float(np.exp(-(x**2) / 2))
+        yield "event", desc.compose_event(data={"motor": x, "det": y}, timestamps={"motor": 0, "det": 0})
+    yield "stop", run.compose_stop()
+
+
+def feed(ps, num_events):
+    # Documents are made as they are fed, as in a run, so that only what
+    # PeakStats keeps stays in memory.
+    for name, doc in documents(num_events):
+        if name == "stop":
+            return doc
+        ps(name, doc)
+
+
+def main(num_events=50_000):
+    ps = PeakStats("motor", "det")
+    tracemalloc.start()
+    feed(ps, num_events)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ps = PeakStats("motor", "det")
+    docs = list(documents(num_events))
+    start = time.perf_counter()
+    for name, doc in docs[:-1]:
+        ps(name, doc)
+    per_event = (time.perf_counter() - start) / num_events
+    del docs[:-1]
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        ps.snapshot(full=False)
+    quick = (time.perf_counter() - start) / 1000
+    start = time.perf_counter()
+    ps.snapshot()
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    ps(*docs[-1])
+    stop = time.perf_counter() - start
+
+    print(f"{num_events} events")
+    print(f"  per event:              {per_event * 1e6:8.2f} us")
+    print(f"  memory held during run: {peak / 1e6:8.2f} MB")
+    print(f"  snapshot(full=False):   {quick * 1e6:8.2f} us")
+    print(f"  snapshot():             {full * 1e3:8.2f} ms")
+    print(f"  stop:                   {stop * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Compare the per-message overhead of stacked plan preprocessors.
+
+For 0 to 6 no-op message processors, time a long plan pushed through nested
+``plan_mutator`` calls and through a single ``fused_plan_mutator``, without a
+RunEngine in the way.
+
+    python benchmarks/plan_mutator_overhead.py [num_messages]
+"""
+
+import sys
+import time
+
+from bluesky.preprocessors import fused_plan_mutator, plan_mutator
+from bluesky.utils import Msg
+
+
+def null_msg_proc(msg):
+    return None, None
+
+
+def plan(num):
+    for _ in range(num):
+        yield Msg("null")
+
+
+def consume(gen):
+    ret = None
+    try:
+        while True:
+            gen.send(ret)
+    except StopIteration:
+        pass
+
+
+def nested(num, depth):
+    gen = plan(num)
+    for _ in range(depth):
+        gen = plan_mutator(gen, null_msg_proc)
+    return gen
+
+
+def fused(num, depth):
+    return fused_plan_mutator(plan(num), [null_msg_proc] * depth)
+
+
+def per_message(factory, num, depth, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        gen = factory(num, depth)
+        start = time.perf_counter()
+        consume(gen)
+        best = min(best, time.perf_counter() - start)
+    return best / num
+
+
+def main(num=100_000):
+    print(f"{'preprocessors':>13} {'nested (us/msg)':>16} {'fused (us/msg)':>15}")
+    for depth in range(7):
+        nested_time = per_message(nested, num, depth)
+        fused_time = per_message(fused, num, depth)
+        print(f"{depth:>13} {nested_time * 1e6:>16.2f} {fused_time * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
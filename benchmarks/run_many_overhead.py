@@ -0,0 +1,39 @@
+"""
+Compare the per-run time of many short count runs executed one RunEngine call
+each with the same runs executed by ``RE.run_many``.
+
+    python benchmarks/run_many_overhead.py [num_runs]
+"""
+
+import sys
+import time
+
+from ophyd.sim import SynAxis, SynGauss
+
+from bluesky import RunEngine
+from bluesky.plans import count
+
+
+def main(num_runs=500):
+    motor = SynAxis(name="motor")
+    det = SynGauss("det", motor, "motor", center=0, Imax=1, sigma=1)
+    RE = RunEngine({})
+    RE(count([det]))  # warm up
+
+    start = time.perf_counter()
+    for _ in range(num_runs):
+        RE(count([det]))
+    separate = (time.perf_counter() - start) / num_runs
+
+    start = time.perf_counter()
+    RE.run_many(count([det]) for _ in range(num_runs))
+    batched = (time.perf_counter() - start) / num_runs
+
+    print(f"{num_runs} runs of count([det])")
+    print(f"  one call per run: {separate * 1e3:8.3f} ms/run")
+    print(f"  RE.run_many:      {batched * 1e3:8.3f} ms/run")
+    print(f"  overhead saved:   {(separate - batched) * 1e3:8.3f} ms/run ({1 - batched / separate:.0%})")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""
+Compare RunEngineSimulator's indexed handler lookup with the linear scan over
+all handler predicates that it replaced, on a plan of a million messages
+and a few dozen handlers.
+
+    python benchmarks/simulator_handler_lookup.py [num_messages] [num_devices]
+"""
+
+import sys
+import time
+from types import SimpleNamespace
+
+from bluesky import Msg
+from bluesky.simulators import RunEngineSimulator
+
+
+def make_messages(devices, num_messages):
+    commands = ("set", "wait", "trigger", "wait", "read", "save")
+    messages = []
+    for i in range(num_messages):
+        obj = devices[(i // len(commands)) % len(devices)]
+        command = commands[i % len(commands)]
+        messages.append(Msg(command, obj if command not in ("wait", "save") else None, group="g"))
+    return messages
+
+
+def plan(messages):
+    # a generator, as simulate_plan sends responses into the plan
+    yield from (msg for msg in messages)
+
+
+def make_simulator(devices):
+    sim = RunEngineSimulator()
+    sim.add_handler_for_callback_subscribes()
+    for obj in devices:
+        sim.add_read_handler_for(obj, 1.0)
+        sim.add_handler("set", lambda msg: None, obj.name)
+        sim.add_handler("trigger", lambda msg: None, obj.name)
+    sim.add_wait_handler(lambda msg: None, "g")
+    return sim
+
+
+def legacy_lookup(sim):
+    # the linear scan and predicates used before handlers were indexed
+    def predicate(h):
+        commands, obj_name, msg_filter = h.commands, h.obj_name, h.predicate
+        return lambda msg: (
+            msg.command in commands
+            and (
+                (msg_filter is None and obj_name is None)
+                or (callable(msg_filter) and msg_filter(msg))
+                or (msg.obj and msg.obj.name == obj_name)
+            )
+        )
+
+    handlers = [SimpleNamespace(predicate=predicate(h), runnable=h.runnable) for h in sim.message_handlers]
+    return lambda msg: next((h for h in handlers if h.predicate(msg)), None)
+
+
+def main(num_messages=1_000_000, num_devices=10):
+    devices = [SimpleNamespace(name=f"det{i}") for i in range(num_devices)]
+    messages = make_messages(devices, num_messages)
+
+    sim = make_simulator(devices)
+    sim._find_handler = legacy_lookup(sim)
+    start = time.perf_counter()
+    sim.simulate_plan(plan(messages))
+    linear = time.perf_counter() - start
+
+    sim = make_simulator(devices)
+    start = time.perf_counter()
+    sim.simulate_plan(plan(messages))
+    indexed = time.perf_counter() - start
+
+    print(f"{num_messages} messages, {len(sim.message_handlers)} handlers")
+    print(f"  linear scan: {linear:7.2f} s")
+    print(f"  indexed:     {indexed:7.2f} s ({linear / indexed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""
+Time building and iterating large scan trajectories.
+
+For 1e4 to 1e7 points, compare a Fermat spiral and a snaked 2D raster built
+as a NumPy-backed ``Trajectory`` with the same points as a ``Cycler``. The
+cycler is skipped above ``max_cycler_points`` because it holds one dict per
+point.
+
+    python benchmarks/trajectory_generation.py [max_points] [max_cycler_points]
+"""
+
+import sys
+import time
+
+import numpy as np
+from cycler import cycler
+
+from bluesky.plan_patterns import Trajectory, snake_trajectories, spiral_fermat_trajectory
+from bluesky.utils import snake_cyclers
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+def fermat(num):
+    # dr chosen so that the spiral has about `num` points inside a unit square
+    dr = 1 / np.sqrt(num / 0.4)
+    return spiral_fermat_trajectory("x", "y", 0, 0, 1, 1, dr, 1)
+
+
+def raster(num):
+    side = int(np.sqrt(num))
+    axes = [np.linspace(0, 1, side), np.linspace(0, 1, side)]
+    return snake_trajectories([Trajectory({"x": axes[0]}), Trajectory({"y": axes[1]})], [False, True])
+
+
+def raster_cycler(num):
+    side = int(np.sqrt(num))
+    return snake_cyclers(
+        [cycler("x", np.linspace(0, 1, side)), cycler("y", np.linspace(0, 1, side))], [False, True]
+    )
+
+
+def main(max_points=10_000_000, max_cycler_points=1_000_000):
+    header = f"{'pattern':>8} {'points':>10} {'build (s)':>10} {'iterate (s)':>12} {'as cycler (s)':>14}"
+    print(header)
+    num = 10_000
+    while num <= max_points:
+        for name, build in (("fermat", fermat), ("raster", raster)):
+            traj, build_time = timed(build, num)
+            _, iter_time = timed(consume, traj)
+            if len(traj) <= max_cycler_points:
+                cycler_builder = raster_cycler if name == "raster" else (lambda n: fermat(n).to_cycler())
+                _, cycler_time = timed(cycler_builder, num)
+                cycler_time = f"{cycler_time:14.3f}"
+            else:
+                cycler_time = f"{'skipped':>14}"
+            print(f"{name:>8} {len(traj):>10} {build_time:>10.3f} {iter_time:>12.3f} {cycler_time}")
+        num *= 10
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
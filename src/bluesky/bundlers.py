@@ -45,6 +45,7 @@ from .utils import (
     IllegalMessageSequence,
     Msg,
     _rearrange_into_parallel_dicts,
+    _TokenCache,
     iterate_maybe_async,
     maybe_await,
     maybe_collect_asset_docs,
@@ -71,6 +72,33 @@ def _describe_collect_dict_is_valid(
     )
 
 
+class DescribeCache(_TokenCache):
+    """
+    Cache of describe and describe_configuration output that the RunEngine
+    keeps across runs.
+
+    By default every run asks each device for these again. Assign an instance
+    to ``RE.describe_cache`` to reuse them in later runs instead. Configuration
+    values are not cached: ``read_configuration`` is still called in every
+    run, so changes made with 'set' are always recorded. The entries
+    for an object are dropped when it is configured with a 'configure'
+    message and, for objects implementing
+    :class:`~bluesky.protocols.HasCacheToken`, whenever their token changes.
+    Call :meth:`invalidate` or :meth:`clear` after changing a device by other
+    means.
+    """
+
+    def get(self, obj, method: str):
+        """Return the cached output of ``obj.<method>()``; raise KeyError if there is none."""
+        value = self._current_entries(obj)[method]
+        # Hand out copies so documents from different runs do not share dicts.
+        return {key: dict(item) for key, item in value.items()}
+
+    def put(self, obj, method: str, value: dict):
+        """Cache the output of ``obj.<method>()``."""
+        self._store(obj, method, {key: dict(item) for key, item in value.items()})
+
+
 class RunBundler:
     def __init__(
         self,
@@ -81,6 +109,7 @@ class RunBundler:
         log: LoggerAdapter,
         *,
         strict_pre_declare: bool,
+        describe_cache: Optional[DescribeCache] = None,
     ):
         # if create can YOLO implicitly create a stream
         self._strict_pre_declare = strict_pre_declare
@@ -89,9 +118,12 @@ class RunBundler:
         self._bundle_name = None  # name given to event descriptor
         self._run_start_uid = None  # The (future) runstart uid
         self._objs_read: deque[HasName] = deque()  # objects read in one Event
+        self._objs_read_set: set[HasName] = set()  # " as a set, for comparison with descriptor objects
+        self._keys_read: set[str] = set()  # data keys of all objects read in one Event
         self._read_cache: deque[dict[str, Reading]] = deque()  # cache of obj.read() in one Event
         self._asset_docs_cache: deque[Union[Asset, StreamAsset]] = deque()  # cache of obj.collect_asset_docs()
         self._describe_cache: ObjDict[DataKey] = dict()  # cache of all obj.describe() output  # noqa: C408
+        self._describe_keys_cache: dict[Any, frozenset[str]] = dict()  # " obj.describe() keys  # noqa: C408
         self._describe_collect_cache: dict[Any, Union[dict[str, DataKey], dict[str, dict[str, DataKey]]]] = dict()  # noqa: C408  # cache of all obj.describe() output
 
         self._config_desc_cache: ObjDict[DataKey] = dict()  # " obj.describe_configuration()  # noqa: C408
@@ -100,6 +132,9 @@ class RunBundler:
         # cache of {name: (doc, compose_event, compose_event_page)}
         self._descriptors: dict[Any, ComposeDescriptorBundle] = dict()  # noqa: C408
         self._descriptor_objs: dict[str, dict[HasName, dict[str, DataKey]]] = dict()  # noqa: C408
+        self._descriptor_obj_sets: dict[str, frozenset[HasName]] = dict()  # noqa: C408
+        # cache of {name: template of the 'filled' dict of every Event in that stream}
+        self._filled_templates: dict[str, dict[str, bool]] = dict()  # noqa: C408
         # cache of {obj: {objs_frozen_set: (doc, compose_event, compose_event_page)}
         self._local_descriptors: dict[Any, dict[frozenset[str], ComposeDescriptorBundle]] = dict()  # noqa: C408
         # a seq_num counter per stream
@@ -119,6 +154,8 @@ class RunBundler:
         self.emit = emit
         self.emit_sync = emit_sync
         self.log = log
+        # the RunEngine's cross-run cache of describe and configuration output, if any
+        self._shared_describe_cache = describe_cache
         # Map of set of collect objects to list of stream names that they can be collected into
         self._declared_stream_names: dict[frozenset, list[str]] = {}
 
@@ -240,6 +277,13 @@ class RunBundler:
             extra={"doc_name": "descriptor", "run_uid": self._run_start_uid, "data_keys": data_keys.keys()},
         )
         self._descriptor_objs[desc_key] = objs_dks
+        self._descriptor_obj_sets[desc_key] = frozenset(objs_dks)
+        # Mark all externally-stored data as not filled so that consumers
+        # know that the corresponding data are identifiers, not dereferenced
+        # data.
+        self._filled_templates[desc_key] = {
+            k: False for k, v in data_keys.items() if "external" in v and v["external"] != "STREAM:"
+        }
         if desc_key not in self._sequence_counters:
             self._sequence_counters[desc_key] = 1
             self._sequence_counters_copy[desc_key] = 1
@@ -320,6 +364,8 @@ class RunBundler:
         self._read_cache.clear()
         self._asset_docs_cache.clear()
         self._objs_read.clear()
+        self._objs_read_set.clear()
+        self._keys_read.clear()
         self.bundling = True
         command, obj, args, kwargs, _ = msg
         try:
@@ -354,25 +400,10 @@ class RunBundler:
             # against it. Reading multiple devices concurrently works fine.
             await self._ensure_cached(obj)
 
-            # check that current read collides with nothing else in
-            # current event
-            cur_keys = set(self._describe_cache[obj].keys())
-            for read_obj in self._objs_read:
-                # that is, field names
-                known_keys = self._describe_cache[read_obj].keys()
-                if set(known_keys) & cur_keys:
-                    raise ValueError(
-                        f"Data keys (field names) from {obj!r} "
-                        f"collide with those from {read_obj!r}. "
-                        f"The colliding keys are {set(known_keys) & cur_keys}"
-                    )
+            self._check_no_collisions(obj)
 
             # add this object to the cache of things we have read
-            self._objs_read.append(obj)
-
-            # Stash the results, which will be emitted the next time _save is
-            # called --- or never emitted if _drop is called instead.
-            self._read_cache.append(reading)
+            self._add_to_bundle(obj, reading)
             # Ask the object for any resource or datum documents is has cached
             # and cache them as well. Likewise, these will be emitted if and
             # when _save is called.
@@ -381,16 +412,88 @@ class RunBundler:
 
         return reading
 
+    async def read_many(self, msg, objs, readings):
+        """
+        Add the readings of several objects to the open event bundle at once.
+
+        Expected message object is::
+
+            Msg('read_many', None, obj1, ..., objn)
+
+        The readings are added in the order of *objs*, which sets the order
+        of the objects in the Event Descriptor. Nothing is added if the data
+        keys of any of the objects collide.
+        """
+        if self.bundling:
+            await asyncio.gather(*[self._ensure_cached(obj) for obj in objs])
+
+            # check every object against those already read and against each
+            # other before adding any of them to the bundle
+            keys_read = set(self._keys_read)
+            objs_read = list(self._objs_read)
+            for obj in objs:
+                self._check_no_collisions(obj, keys_read, objs_read)
+                keys_read.update(self._describe_keys_cache[obj])
+                objs_read.append(obj)
+
+            for obj, reading in zip(objs, readings):
+                self._add_to_bundle(obj, reading)
+            for obj in objs:
+                asset_docs_collected = [x async for x in maybe_collect_asset_docs(msg, obj)]
+                self._asset_docs_cache.extend(asset_docs_collected)
+
+        return readings
+
+    def _check_no_collisions(self, obj, keys_read=None, objs_read=None):
+        "Check that the data keys of obj collide with nothing else in the current event."
+        if keys_read is None:
+            keys_read = self._keys_read
+        if objs_read is None:
+            objs_read = self._objs_read
+        cur_keys = self._describe_keys_cache[obj]
+        if keys_read.isdisjoint(cur_keys):
+            return
+        for read_obj in objs_read:
+            # that is, field names
+            colliding_keys = self._describe_keys_cache[read_obj] & cur_keys
+            if colliding_keys:
+                raise ValueError(
+                    f"Data keys (field names) from {obj!r} "
+                    f"collide with those from {read_obj!r}. "
+                    f"The colliding keys are {set(colliding_keys)}"
+                )
+
+    def _add_to_bundle(self, obj, reading):
+        "Add the reading of obj to the current event."
+        self._objs_read.append(obj)
+        self._objs_read_set.add(obj)
+        self._keys_read.update(self._describe_keys_cache[obj])
+        # Stash the results, which will be emitted the next time _save is
+        # called --- or never emitted if _drop is called instead.
+        self._read_cache.append(reading)
+
+    async def _shared_or_call(self, obj, method: str):
+        "Return the output of obj.<method>(), from the RunEngine's describe_cache if possible."
+        if self._shared_describe_cache is None:
+            return await maybe_await(getattr(obj, method)())
+        try:
+            return self._shared_describe_cache.get(obj, method)
+        except KeyError:
+            value = await maybe_await(getattr(obj, method)())
+            self._shared_describe_cache.put(obj, method, value)
+            return value
+
     async def _cache_describe(self, obj):
         "Read the object's describe and cache it."
         obj = check_supports(obj, Readable)
-        self._describe_cache[obj] = await maybe_await(obj.describe())
+        self._describe_cache[obj] = await self._shared_or_call(obj, "describe")
+        self._describe_keys_cache[obj] = frozenset(self._describe_cache[obj])
 
     async def _cache_describe_config(self, obj):
         "Read the object's describe_configuration and cache it."
 
         if isinstance(obj, Configurable):
-            conf_keys = await maybe_await(obj.describe_configuration())
+            conf_keys = await self._shared_or_call(obj, "describe_configuration")
         else:
             conf_keys = {}
 
@@ -539,7 +642,7 @@ class RunBundler:
             return
         # The Event Descriptor is uniquely defined by the set of objects
         # read in this Event grouping.
-        objs_read = frozenset(self._objs_read)
+        objs_read = self._objs_read_set
 
         # Event Descriptor key
         desc_key = self._bundle_name
@@ -567,8 +670,11 @@ class RunBundler:
             descriptor_doc, compose_event, d_objs = await self._prepare_stream(desc_key, objs_dks)
 
         # do have the descriptor cached
-        elif frozenset(d_objs) != objs_read:
-            raise RuntimeError(f"Mismatched objects read, expected {frozenset(d_objs)!s}, got {objs_read!s}")
+        elif self._descriptor_obj_sets[desc_key] != objs_read:
+            raise RuntimeError(
+                f"Mismatched objects read, expected {self._descriptor_obj_sets[desc_key]!s}, "
+                f"got {frozenset(objs_read)!s}"
+            )
 
         # Resource and Datum documents
         indices_generated = await self._pack_external_assets(self._asset_docs_cache, message_stream_name=desc_key)
@@ -579,21 +685,17 @@ class RunBundler:
                 "in a `read()` `save()`."
             )
 
-        # Merge list of readings into single dict.
-        readings = {k: v for d in self._read_cache for k, v in d.items()}
-        data, timestamps = _rearrange_into_parallel_dicts(readings)
-        # Mark all externally-stored data as not filled so that consumers
-        # know that the corresponding data are identifiers, not dereferenced
-        # data.
-        filled = {
-            k: False
-            for k, v in self._descriptors[desc_key].descriptor_doc["data_keys"].items()
-            if "external" in v and v["external"] != "STREAM:"
-        }
+        # Merge list of readings into parallel data and timestamps dicts.
+        data = {}
+        timestamps = {}
+        for reading in self._read_cache:
+            for key, payload in reading.items():
+                data[key] = payload["value"]
+                timestamps[key] = payload["timestamp"]
         event_doc = compose_event(
             data=data,
             timestamps=timestamps,
-            filled=filled,
+            filled=dict(self._filled_templates[desc_key]),
         )
         await self.emit(DocumentNames.event, event_doc)
         doc_logger.debug(
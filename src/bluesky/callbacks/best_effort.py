@@ -11,6 +11,7 @@ import sys
 import threading
 import time
 import weakref
+from collections import deque
 from collections.abc import Mapping
 from datetime import datetime
 from functools import partial
@@ -19,9 +20,11 @@ from pprint import pformat
 from typing import Any, Literal
 from warnings import warn
 
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 from cycler import cycler
+from event_model import pack_event_page, unpack_event_page
 from matplotlib.axes import Axes
 from matplotlib.axis import Axis
 from matplotlib.figure import Figure
@@ -35,7 +38,33 @@ logger = logging.getLogger(__name__)
 
 @make_class_safe(logger=logger)
 class BestEffortCallback(QtAwareCallback):
-    def __init__(self, *, fig_factory=None, table_enabled=True, calc_derivative_and_stats=False, **kwargs):
+    """
+    Print a table and make plots for any run, guided by hints.
+
+    Parameters
+    ----------
+    fig_factory : callable, optional
+        Called with a figure name to get the Figure to plot on.
+    table_enabled : bool, optional
+        Print a LiveTable of the 'primary' stream. True by default.
+    calc_derivative_and_stats : bool, optional
+        Also compute the statistics of the derivative in PeakStats.
+    refresh_rate : float, optional
+        If given, process documents in the background: the RunEngine only
+        queues each document, and a worker thread processes the queue in
+        batches at most this many times per second. Consecutive events of a
+        stream are processed together as an event page, and plots redraw at
+        most at this rate. Output and plots then trail the RunEngine a
+        little; call :meth:`flush` to process the queue right away. By
+        default (None), each document is processed as the RunEngine emits it.
+        Matplotlib is not thread-safe, so this is only honored with the Qt
+        teleporter or a non-interactive backend (e.g. Agg); with any other
+        backend a warning is issued and documents are processed as emitted.
+    """
+
+    def __init__(
+        self, *, fig_factory=None, table_enabled=True, calc_derivative_and_stats=False, refresh_rate=None, **kwargs
+    ):
         super().__init__(**kwargs)
         # internal state
         self._start_doc = None
@@ -68,6 +97,22 @@ class BestEffortCallback(QtAwareCallback):
         self._buffer = StringIO()
         self._baseline_toggle = True
 
+        # background processing, if refresh_rate is set
+        if refresh_rate is not None and not (self._uses_teleporter or _backend_is_non_interactive()):
+            warn(
+                f"refresh_rate is ignored with the {matplotlib.get_backend()!r} backend: Matplotlib is not "
+                "thread-safe, so documents are processed as the RunEngine emits them.",
+                stacklevel=2,
+            )
+            refresh_rate = None
+        self._refresh_rate = refresh_rate
+        self._queue = deque()
+        self._queue_lock = threading.Lock()  # guards _queue, _worker and _stopped
+        self._process_lock = threading.Lock()  # serializes batches
+        self._wake = threading.Event()
+        self._worker = None
+        self._stopped = False  # whether the last batch taken from the queue ended a run
+
     def enable_heading(self):
         "Print timestamp and IDs at the top of a run."
         self._heading_enabled = True
@@ -103,7 +148,51 @@ class BestEffortCallback(QtAwareCallback):
     def __call__(self, name, doc, *args, **kwargs):
         if not (self._table_enabled or self._baseline_enabled or self._plots_enabled):
             return
-        super().__call__(name, doc, *args, **kwargs)
+        if self._refresh_rate is None or kwargs.get("escape"):
+            super().__call__(name, doc, *args, **kwargs)
+            return
+        with self._queue_lock:
+            self._queue.append((name, doc))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._process_queue, name="bec-refresh", daemon=True)
+                self._worker.start()
+        if name == "stop":
+            self._wake.set()
+
+    def flush(self):
+        """
+        Process all the queued documents now.
+
+        This only has an effect if ``refresh_rate`` is set. With a Qt backend
+        the documents are handed to the GUI thread, which processes them
+        once it is free.
+        """
+        with self._process_lock:
+            with self._queue_lock:
+                batch = list(self._queue)
+                self._queue.clear()
+                if batch:
+                    self._stopped = batch[-1][0] == "stop"
+            for name, doc in _batch_events(batch):
+                try:
+                    super().__call__(name, doc)
+                except Exception:
+                    logger.exception("BestEffortCallback failed to process a %r document", name)
+            return batch[-1][0] if batch else None
+
+    def _process_queue(self):
+        interval = 1 / self._refresh_rate
+        while True:
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
+            with self._queue_lock:
+                # Let the thread end between runs, even if the 'stop' document
+                # was taken by a call to flush() from elsewhere; the next
+                # document starts a new one.
+                if self._stopped and not self._queue:
+                    self._worker = None
+                    return
 
     def start(self, doc):
         self.clear()
@@ -199,7 +288,9 @@ class BestEffortCallback(QtAwareCallback):
                     )
                     continue
                 # Create an instance of LivePlot and an instance of PeakStats.
-                live_plot = LivePlotPlusPeaks(y=y_key, x=x_key, ax=ax, peak_results=self.peaks)
+                live_plot = LivePlotPlusPeaks(
+                    y=y_key, x=x_key, ax=ax, peak_results=self.peaks, **self._throttle_kwargs()
+                )
                 live_plot("start", self._start_doc)
                 live_plot("descriptor", doc)
                 peak_stats = PeakStats(x=x_key, y=y_key, calc_derivative_and_stats=self._calc_derivative_and_stats)
@@ -256,6 +347,7 @@ class BestEffortCallback(QtAwareCallback):
                             extent=adjusted_extent,
                             aspect=aspect,
                             ax=ax,
+                            **self._throttle_kwargs(),
                         )
 
                         live_grid("start", self._start_doc)
@@ -287,6 +379,9 @@ class BestEffortCallback(QtAwareCallback):
         else:
             raise NotImplementedError("we do not support 3D+ in BEC yet (and it should have bailed above)")
 
+    def _throttle_kwargs(self):
+        return {} if self._refresh_rate is None else {"max_fps": self._refresh_rate}
+
     def _generate_axes(self, columns, ndims, figure: Figure) -> list[Axes]:
         if not figure.axes:
             if len(columns) < 5:
@@ -397,7 +492,11 @@ class BestEffortCallback(QtAwareCallback):
         if stream_name == self.dim_stream:
             if self._table_enabled:
                 # plot everything, independent or dependent variables
-                self._table = LiveTable(list(self.all_dim_fields) + columns, separator_lines=False)
+                self._table = LiveTable(
+                    list(self.all_dim_fields) + columns,
+                    separator_lines=False,
+                    batch_output=self._refresh_rate is not None,
+                )
                 self._table("start", self._start_doc)
                 self._table("descriptor", doc)
 
@@ -406,7 +505,18 @@ class BestEffortCallback(QtAwareCallback):
         if descriptor.get("name") == "primary":
             if self._table is not None:
                 self._table("event", doc)
+        self._update_baseline_and_plots(doc, descriptor)
+
+    def event_page(self, doc):
+        descriptor = self._descriptors[doc["descriptor"]]
+        if descriptor.get("name") == "primary":
+            if self._table is not None:
+                # The table formats all of the rows in one go.
+                self._table("event_page", doc)
+        for event in unpack_event_page(doc):
+            self._update_baseline_and_plots(event, descriptor)
 
+    def _update_baseline_and_plots(self, doc, descriptor):
         # Show the baseline readings.
         if descriptor.get("name") == "baseline":
             columns = hinted_fields(descriptor)
@@ -656,3 +766,35 @@ def hinted_fields(descriptor):
             fields = descriptor["object_keys"][obj_name]
         columns.extend(fields)
     return columns
+
+
+def _batch_events(docs):
+    """
+    Yield the (name, doc) pairs, packing consecutive events that share a
+    descriptor into event pages.
+    """
+    events = []
+    for name, doc in docs:
+        if name == "event" and (not events or events[-1]["descriptor"] == doc["descriptor"]):
+            events.append(doc)
+            continue
+        if events:
+            yield ("event", events[0]) if len(events) == 1 else ("event_page", pack_event_page(*events))
+            events = []
+        if name == "event":
+            events.append(doc)
+        else:
+            yield name, doc
+    if events:
+        yield ("event", events[0]) if len(events) == 1 else ("event_page", pack_event_page(*events))
+
+
+def _backend_is_non_interactive():
+    "Whether the current Matplotlib backend only renders to files or buffers, never to a GUI."
+    try:
+        from matplotlib.backends import BackendFilter, backend_registry
+
+        non_interactive = backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+    except ImportError:  # Matplotlib < 3.9
+        from matplotlib.rcsetup import non_interactive_bk as non_interactive
+    return matplotlib.get_backend().lower() in {backend.lower() for backend in non_interactive}
@@ -2,7 +2,9 @@
 Useful callbacks for the Run Engine
 """
 
+import itertools
 import logging
+import math
 import os
 import time as ttime
 import warnings
@@ -13,6 +15,7 @@ from functools import partial as _partial
 from functools import wraps as _wraps
 from itertools import count
 
+import numpy as np
 from event_model import DocumentRouter
 
 from ..utils import ensure_uid
@@ -199,6 +202,33 @@ def get_obj_fields(fields):
     return string_fields
 
 
+class _GrowableArray:
+    # A 1D array with amortized O(1) appends. Values that do not fit in a
+    # float array (e.g. strings) switch it to an object array.
+
+    def __init__(self, data=None):
+        if data is None:
+            self._data = np.empty(256)
+            self._len = 0
+        else:
+            self._data = np.asarray(data)
+            self._len = len(self._data)
+
+    def append(self, value):
+        if self._len == len(self._data):
+            self._data = np.concatenate([self._data, np.empty_like(self._data, shape=max(256, self._len))])
+        try:
+            self._data[self._len] = value
+        except (TypeError, ValueError):
+            self._data = self._data.astype(object)
+            self._data[self._len] = value
+        self._len += 1
+
+    @property
+    def values(self):
+        return self._data[: self._len]
+
+
 class CollectThenCompute(CallbackBase):
     def __init__(self):
         self._start_doc = None
@@ -233,6 +263,13 @@ class CollectThenCompute(CallbackBase):
         raise NotImplementedError("This method must be defined by a subclass.")
 
 
+# placeholder for a LiveTable cell with no value
+_BLANK = object()
+# Types of values that LiveTable formats as they are, to begin with; each
+# table learns more as its rows come in.
+_PLAIN_TYPES = frozenset({int, float, str})
+
+
 @make_class_safe(logger=logger)
 class LiveTable(CallbackBase):
     """Live updating table
@@ -268,6 +305,10 @@ class LiveTable(CallbackBase):
 
     out : callable, optional
         Function to call to 'print' a line.  Defaults to `print`
+
+    batch_output : bool, optional
+        Pass all the rows of an EventPage to ``out`` in one call, joined by
+        newlines, instead of one call per row. False by default.
     """
 
     _FMTLOOKUP = {
@@ -298,6 +339,7 @@ class LiveTable(CallbackBase):
         separator_lines=True,
         logbook=None,
         out=print,
+        batch_output=False,
     ):
         super().__init__()
         self._header_interval = print_header_interval
@@ -322,6 +364,9 @@ class LiveTable(CallbackBase):
         self.logbook = logbook
         self._sep_format = None
         self._out = out
+        self._batch_output = batch_output
+        self._last_second = None
+        self._last_hms = None
 
     def descriptor(self, doc):
         def patch_up_precision(p):
@@ -375,7 +420,7 @@ class LiveTable(CallbackBase):
             (
                 k,
                 self._FMTLOOKUP[f.dtype].format(
-                    k=f"h{str(hash(k))}",
+                    k="",
                     width=f.width - 2 * self._pad_len,
                     prec=f.prec,
                     dtype=f.dtype,
@@ -384,6 +429,11 @@ class LiveTable(CallbackBase):
             )
             for k, f in self._format_info.items()
         )
+        # One format string for a whole row, with a positional field per
+        # column: seq_num, time, then the data keys.
+        self._row_format = "|" + "|".join(self._data_formats.values()) + "|"
+        self._data_keys = [k for k in self._format_info if k not in ("seq_num", self.ev_time_key)]
+        self._plain_types = set(_PLAIN_TYPES)
 
         self._count = 0
 
@@ -395,43 +445,86 @@ class LiveTable(CallbackBase):
         super().descriptor(doc)
 
     def event(self, doc):
-        try:
-            if ensure_uid(doc["descriptor"]) not in self._descriptors:
-                return
-            # shallow copy so we can mutate
-            data = dict(doc["data"])
+        if ensure_uid(doc["descriptor"]) not in self._descriptors:
+            return
+        data = doc["data"]
+        filled = doc.get("filled") or {}
+        # Show data[k] if k exists in this Event and is 'filled'. (The latter
+        # is only applicable if the data is externally-stored -- hence the
+        # fallback to `True`.) Otherwise use a placeholder of whitespace.
+        values = [data[k] if k in data and filled.get(k, True) else _BLANK for k in self._data_keys]
+        for line in self._format_rows([(doc["seq_num"], doc["time"], values)]):
+            self._print(line)
+        super().event(doc)
+
+    def event_page(self, doc):
+        if ensure_uid(doc["descriptor"]) not in self._descriptors:
+            return
+        data = doc["data"]
+        filled = doc.get("filled") or {}
+        num_rows = len(doc["seq_num"])
+        columns = []
+        for k in self._data_keys:
+            if k not in data:
+                columns.append(itertools.repeat(_BLANK, num_rows))
+            elif k in filled:
+                columns.append([v if f else _BLANK for v, f in zip(data[k], filled[k])])
+            else:
+                columns.append(data[k])
+        rows = zip(doc["seq_num"], doc["time"], zip(*columns) if columns else itertools.repeat(()))
+        lines = self._format_rows(rows)
+        if self._batch_output and lines:
+            self._rows.extend(lines)
+            self._out("\n".join(lines))
+        else:
+            for line in lines:
+                self._print(line)
+
+    def _format_rows(self, rows):
+        # rows: (seq_num, time, values) with a value per data key, _BLANK
+        # for none. Returns the lines to print, with repeated headers.
+        lines = []
+        for seq_num, time, values in rows:
             self._count += 1
             if not self._count % self._header_interval:
-                self._print(self._sep_format)
-                self._print(self._header)
-                self._print(self._sep_format)
-            fmt_time = str(datetime.fromtimestamp(doc["time"]).time())
-            data[self.ev_time_key] = fmt_time
-            data["seq_num"] = doc["seq_num"]
-            cols = [
-                # If we have a bool, just `str` it.
-                f.format(**{f"h{str(hash(k))}": str(data[k])})
-                if ((k in data) and isinstance(data[k], (bool)))
-                # If we have an enum, format with it's value
-                else f.format(**{f"h{str(hash(k))}": data[k].value})
-                if ((k in data) and isinstance(data[k], (Enum)))
-                else f.format(**{f"h{str(hash(k))}": data[k]})
-                # Show data[k] if k exists in this Event and is 'filled'.
-                # (The latter is only applicable if the data is
-                # externally-stored -- hence the fallback to `True`.)
-                if ((k in data) and doc.get("filled", {}).get(k, True))
-                # Otherwise use a placeholder of whitespace.
-                else " " * self._format_info[k].width
-                for k, f in self._data_formats.items()
-            ]
-            self._print("|" + "|".join(cols) + "|")
-        except Exception as ex:
-            if self.log is not None:
-                self.log.exception(ex)
-            self._print(f"{{k:*^{self._min_width}}}".format(k=" failed to format row "))
-            if os.environ.get("BLUESKY_DEBUG_CALLBACKS", False):
-                raise ex
-        super().event(doc)
+                lines.extend((self._sep_format, self._header, self._sep_format))
+            try:
+                if self._plain_types.issuperset(map(type, values)):
+                    lines.append(self._row_format.format(seq_num, self._format_time(time), *values))
+                    continue
+                # If we have a bool, just `str` it. If we have an enum,
+                # format with its value.
+                values = [str(v) if isinstance(v, bool) else v.value if isinstance(v, Enum) else v for v in values]
+                cols = [
+                    " " * self._format_info[k].width if v is _BLANK else f.format(v)
+                    for (k, f), v in zip(self._data_formats.items(), [seq_num, self._format_time(time), *values])
+                ]
+                lines.append("|" + "|".join(cols) + "|")
+                self._plain_types.update(
+                    t for t in map(type, values) if t is not object and not issubclass(t, (bool, Enum))
+                )
+            except Exception as ex:
+                if self.log is not None:
+                    self.log.exception(ex)
+                lines.append(f"{{k:*^{self._min_width}}}".format(k=" failed to format row "))
+                if os.environ.get("BLUESKY_DEBUG_CALLBACKS", False):
+                    raise ex
+        return lines
+
+    def _format_time(self, timestamp):
+        # Same as str(datetime.fromtimestamp(timestamp).time()), but only
+        # converts to local time once per second.
+        fraction, second = math.modf(timestamp)
+        microsecond = round(fraction * 1e6)
+        if microsecond >= 1_000_000:
+            second += 1
+            microsecond -= 1_000_000
+        if second != self._last_second:
+            self._last_second = second
+            self._last_hms = datetime.fromtimestamp(second).strftime("%H:%M:%S")
+        if microsecond:
+            return f"{self._last_hms}.{microsecond:06d}"
+        return self._last_hms
 
     def stop(self, doc):
         if ensure_uid(doc["run_start"]) != self._start["uid"]:
@@ -1,11 +1,16 @@
 import copy
+import functools
+import logging
 import pprint
+import threading
 import warnings
 from collections import namedtuple
 
 import numpy as np
 
-from .core import CallbackBase, CollectThenCompute
+from .core import CallbackBase, CollectThenCompute, _GrowableArray
+
+logger = logging.getLogger(__name__)
 
 
 class LiveFit(CallbackBase):
@@ -26,17 +31,34 @@ class LiveFit(CallbackBase):
     update_every : int or None, optional
         How often to recompute the fit. If `None`, do not compute until the
         end. Default is 1 (recompute after each new point).
+    warm_start : bool, optional
+        Start each fit from the parameters of the previous fit in the run,
+        instead of from ``init_guess``. Fits late in a scan then need fewer
+        iterations. False by default.
+    background : bool, optional
+        Do the fits during the run in a worker thread, so that they do not
+        hold up the other callbacks. Each fit uses the data received up to
+        the moment it was requested; if several are requested while one is
+        running, only the newest is done. ``result`` is updated when a fit
+        finishes. The final fit, at the end of the run, is always done before
+        ``stop`` returns. False by default.
 
     Attributes
     ----------
     result : lmfit.ModelResult
     """
 
-    def __init__(self, model, y, independent_vars, init_guess=None, *, update_every=1):
-        self.ydata = []
-        self.independent_vars_data = {}
-        self.__stale = False
+    def __init__(
+        self, model, y, independent_vars, init_guess=None, *, update_every=1, warm_start=False, background=False
+    ):
+        self._y_buffer = _GrowableArray()
+        self._independent_vars_buffers = {}
         self.result = None
+        self._result_num_points = 0
+        self._generation = 0  # counts resets, to discard fits of old data
+        self._fit_lock = threading.Lock()  # guards the three attributes below
+        self._pending_fit = None
+        self._fit_worker = None
         self._model = model
         self.y = y
         self.independent_vars = independent_vars
@@ -44,12 +66,22 @@ class LiveFit(CallbackBase):
             init_guess = {}
         self.init_guess = init_guess
         self.update_every = update_every
+        self.warm_start = warm_start
+        self.background = background
 
     @property
     def model(self):
         # Make this a property so it can't be updated.
         return self._model
 
+    @property
+    def ydata(self):
+        return self._y_buffer.values
+
+    @property
+    def independent_vars_data(self):
+        return {k: v.values for k, v in self._independent_vars_buffers.items()}
+
     @property
     def independent_vars(self):
         return self._independent_vars
@@ -63,16 +95,16 @@ class LiveFit(CallbackBase):
                 )
             )
         self._independent_vars = val
-        self.independent_vars_data.clear()
-        self.independent_vars_data.update({k: [] for k in val})
         self._reset()
 
     def _reset(self):
-        self.result = None
-        self.__stale = False
-        self.ydata.clear()
-        for v in self.independent_vars_data.values():
-            v.clear()
+        with self._fit_lock:
+            self._generation += 1
+            self._pending_fit = None
+            self.result = None
+            self._result_num_points = 0
+        self._y_buffer = _GrowableArray()
+        self._independent_vars_buffers = {k: _GrowableArray() for k in self.independent_vars}
 
     def start(self, doc):
         self._reset()
@@ -86,7 +118,6 @@ class LiveFit(CallbackBase):
 
         # Always stash the data for the next time the fit is updated.
         self.update_caches(y, idv)
-        self.__stale = True
 
         # Maybe update the fit or maybe wait.
         if self.update_every is not None:
@@ -96,18 +127,26 @@ class LiveFit(CallbackBase):
                 # not enough points to fit yet
                 pass
             elif (i == N) or ((i - 1) % self.update_every == 0):
-                self.update_fit()
+                if self.background:
+                    self._submit_fit()
+                else:
+                    self.update_fit()
         super().event(doc)
 
     def stop(self, doc):
-        # Update the fit if it was not updated by the last event.
-        if self.__stale:
+        # Update the fit if the last one did not include all the data.
+        with self._fit_lock:
+            # Discard queued and running fits; the one below supersedes them.
+            self._generation += 1
+            self._pending_fit = None
+            stale = self._result_num_points != len(self.ydata)
+        if stale:
             self.update_fit()
         super().stop(doc)
 
     def update_caches(self, y, independent_vars):
-        self.ydata.append(y)
-        for k, v in self.independent_vars_data.items():
+        self._y_buffer.append(y)
+        for k, v in self._independent_vars_buffers.items():
             v.append(independent_vars[k])
 
     def update_fit(self):
@@ -118,11 +157,48 @@ class LiveFit(CallbackBase):
                 stacklevel=1,
             )
         else:
-            kwargs = {}
-            kwargs.update(self.independent_vars_data)
+            ydata = self.ydata
+            result = self._fit(ydata, self.independent_vars_data)
+            with self._fit_lock:
+                self.result = result
+                self._result_num_points = len(ydata)
+
+    def _fit(self, ydata, independent_vars_data):
+        kwargs = dict(independent_vars_data)
+        previous = self.result
+        if self.warm_start and previous is not None:
+            kwargs["params"] = previous.params
+        else:
             kwargs.update(self.init_guess)
-            self.result = self.model.fit(self.ydata, **kwargs)
-            self.__stale = False
+        return self.model.fit(ydata, **kwargs)
+
+    def _submit_fit(self):
+        # The buffers only ever grow, so these views keep showing the data
+        # received so far; no copy is needed.
+        data = (self._generation, self.ydata, self.independent_vars_data)
+        with self._fit_lock:
+            self._pending_fit = data  # replaces any fit not yet started
+            if self._fit_worker is None:
+                self._fit_worker = threading.Thread(target=self._run_fits, name="live-fit", daemon=True)
+                self._fit_worker.start()
+
+    def _run_fits(self):
+        while True:
+            with self._fit_lock:
+                if self._pending_fit is None:
+                    self._fit_worker = None
+                    return
+                generation, ydata, independent_vars_data = self._pending_fit
+                self._pending_fit = None
+            try:
+                result = self._fit(ydata, independent_vars_data)
+            except Exception:
+                logger.exception("LiveFit failed to fit %d data points", len(ydata))
+                continue
+            with self._fit_lock:
+                if generation == self._generation:
+                    self.result = result
+                    self._result_num_points = len(ydata)
 
 
 # This function is vendored from scipy v0.16.1 to avoid adding a scipy
@@ -176,6 +252,11 @@ def center_of_mass(input, labels=None, index=None):
     return [tuple(v) for v in np.array(results).T]
 
 
+@functools.lru_cache
+def _stats_type(field_names):
+    return namedtuple("Stats", field_names=field_names)
+
+
 class PeakStats(CollectThenCompute):
     """
     Compute peak statsitics after a run finishes.
@@ -199,6 +280,11 @@ class PeakStats(CollectThenCompute):
     It is assumed that the two fields, x and y, are recorded in the same
     Event stream.
 
+    Only the x and y columns are kept, not the Event documents, and the
+    location of the minimum, the maximum and the center of mass are updated
+    as each Event arrives. Use :meth:`snapshot` to get statistics while a run
+    is in progress.
+
     Attributes
     ----------
     com : center of mass
@@ -250,6 +336,80 @@ class PeakStats(CollectThenCompute):
             setattr(self, field, value)
 
         super().__init__()
+        self._clear_data()
+
+    def _clear_data(self):
+        self._x_buffer = _GrowableArray()
+        self._y_buffer = _GrowableArray()
+        # running totals for min, max and com
+        self._argmin = self._argmax = self._min_y = self._max_y = None
+        self._sum_y = self._sum_iy = 0.0
+
+    def event(self, doc):
+        try:
+            x = doc["data"][self.x]
+            y = doc["data"][self.y]
+        except KeyError:
+            pass
+        else:
+            i = len(self._y_buffer.values)
+            self._x_buffer.append(x)
+            self._y_buffer.append(y)
+            if self._argmin is None or y < self._min_y:
+                self._argmin, self._min_y = i, y
+            if self._argmax is None or y > self._max_y:
+                self._argmax, self._max_y = i, y
+            self._sum_y += y
+            self._sum_iy += i * y
+        # Skip CollectThenCompute.event: the documents themselves are not kept.
+        CallbackBase.event(self, doc)
+
+    def reset(self):
+        super().reset()
+        self._clear_data()
+
+    def snapshot(self, *, full=True):
+        """
+        Compute statistics of the data received so far.
+
+        This may be called while a run is in progress, for example by a plan
+        that ends a scan early once it has passed the peak. It does not change
+        the attributes, which are set when the run stops.
+
+        Parameters
+        ----------
+        full : bool, optional
+            If True (default), compute all the statistics from the buffered
+            data, as is done at the end of the run. If False, only give min,
+            max and com, which are kept up to date as Events arrive so this
+            takes constant time, and leave the other fields None. If
+            edge_count is set, the background depends on all the data, so all
+            the statistics are computed regardless.
+
+        Returns
+        -------
+        stats : namedtuple or None
+            Has the same fields as the ``stats`` attribute. None if no data
+            has been received.
+        """
+        x = self._x_buffer.values
+        y = self._y_buffer.values
+        if not len(y):
+            return None
+        fields = dict.fromkeys(self._stats_fields)
+        if full or self._edge_count is not None:
+            return self._calc_stats(x, y, fields, edge_count=self._edge_count)
+
+        fields["min"] = (x[self._argmin], y[self._argmin])
+        fields["max"] = (x[self._argmax], y[self._argmax])
+        if self._sum_y:
+            # np.interp(center_of_mass(y), np.arange(len(x)), x), in constant time
+            position = min(max(self._sum_iy / self._sum_y, 0), len(x) - 1)
+            i = int(position)
+            fields["com"] = np.float64(x[i] if i == len(x) - 1 else x[i] + (position - i) * (x[i + 1] - x[i]))
+        else:
+            fields["com"] = np.float64(np.nan)
+        return _stats_type(tuple(fields))(**fields)
 
     def __getitem__(self, key):
         if key in ["x", "y", "stats", "derivative_stats"] + list(self._stats_fields.keys()):
@@ -309,9 +469,7 @@ class PeakStats(CollectThenCompute):
             if len(_cen_list) >= 2:
                 fields["fwhm"] = np.abs(fields["crossings"][-1] - fields["crossings"][0], dtype=float)
 
-        Stats = namedtuple("Stats", field_names=fields.keys())
-        stats = Stats(**fields)
-        return stats
+        return _stats_type(tuple(fields))(**fields)
 
     def compute(self):
         "This method is called at run-stop time by the superclass."
@@ -319,19 +477,9 @@ class PeakStats(CollectThenCompute):
         for field, value in self._stats_fields.items():
             setattr(self, field, value)
 
-        x = []
-        y = []
-        for event in self._events:
-            try:
-                _x = event["data"][self.x]
-                _y = event["data"][self.y]
-            except KeyError:
-                pass
-            else:
-                x.append(_x)
-                y.append(_y)
-        x = np.array(x)
-        y = np.array(y)
+        # copies, so that the attributes do not share memory with the buffers
+        x = np.array(self._x_buffer.values)
+        y = np.array(self._y_buffer.values)
 
         if not len(x):
             # nothing to do
@@ -353,6 +501,3 @@ class PeakStats(CollectThenCompute):
             stats_fields = copy.deepcopy(self._stats_fields)
             stats_fields.update({"x": x_der, "y": y_der})
             self.derivative_stats = self._calc_stats(x_der, y_der, stats_fields, edge_count=self._edge_count)
-
-        # reset y data
-        y = self.y_data
@@ -1,13 +1,14 @@
 import functools
 import logging
 import threading
+import time
 import warnings
 from collections import ChainMap
 
 import numpy as np
 from cycler import cycler
 
-from .core import CallbackBase, get_obj_fields, make_class_safe
+from .core import CallbackBase, _GrowableArray, get_obj_fields, make_class_safe
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +74,11 @@ class QtAwareCallback(CallbackBase):
             self.__teleporter = None
         super().__init__(*args, **kwargs)
 
+    @property
+    def _uses_teleporter(self):
+        "Whether documents are handed to the Qt GUI thread to be processed."
+        return self.__teleporter is not None
+
     def __call__(self, name, doc, *, escape=False):
         if not escape and self.__teleporter is not None:
             self.__teleporter.name_doc_escape.emit(name, doc, self)
@@ -80,8 +86,80 @@ class QtAwareCallback(CallbackBase):
             return CallbackBase.__call__(self, name, doc)
 
 
+def _envelope(x, y, max_points):
+    """
+    Decimate a series to about max_points points for display, keeping the
+    minimum and maximum of y in each bin of consecutive points so that peaks
+    and spikes stay visible.
+    """
+    n = len(y)
+    if max_points is None or n <= max_points or y.dtype == object or x.dtype == object:
+        return x, y
+    size = -(-2 * n // max_points)  # ceil, so that there are at most max_points / 2 bins
+    full = (n // size) * size
+    bins = y[:full].reshape(-1, size)
+    if np.isnan(bins).any():
+        lo = np.argmin(np.where(np.isnan(bins), np.inf, bins), axis=1)
+        hi = np.argmax(np.where(np.isnan(bins), -np.inf, bins), axis=1)
+    else:
+        lo, hi = bins.argmin(axis=1), bins.argmax(axis=1)
+    offsets = np.arange(0, full, size)
+    index = np.sort(np.stack([lo, hi], axis=1), axis=1) + offsets[:, None]
+    index = np.concatenate([index.ravel(), np.arange(full, n)])
+    return x[index], y[index]
+
+
+class _RedrawThrottle:
+    # Coalesces redraws to at most max_fps per second. Classes using this call
+    # _request_redraw() when their data changes, implement _draw_frame(), and
+    # call _flush() at the end of a run to draw any pending update.
+
+    def _init_throttle(self, max_fps):
+        self._min_frame_interval = 1 / max_fps if max_fps else 0
+        self._reset_frame_stats()
+
+    @property
+    def frame_stats(self):
+        stats = dict(self._frame_stats)
+        stats["dropped"] = stats["updates"] - stats["redraws"]
+        return stats
+
+    def _reset_frame_stats(self):
+        self._frame_stats = {"updates": 0, "redraws": 0, "draw_time": 0.0}
+        self._last_redraw = None
+        self._redraw_pending = False
+
+    def _request_redraw(self):
+        self._frame_stats["updates"] += 1
+        if self._last_redraw is not None and time.monotonic() - self._last_redraw < self._min_frame_interval:
+            if not self._redraw_pending:
+                self._redraw_pending = True
+                self._start_flush_timer(self._min_frame_interval - (time.monotonic() - self._last_redraw))
+            return
+        self._redraw()
+
+    def _redraw(self):
+        start = self._last_redraw = time.monotonic()
+        self._redraw_pending = False
+        self._draw_frame()
+        self._frame_stats["redraws"] += 1
+        self._frame_stats["draw_time"] += time.monotonic() - start
+
+    def _start_flush_timer(self, delay):
+        # Timers are no-ops in non-interactive backends; stop() flushes anyway.
+        timer = self.ax.figure.canvas.new_timer(interval=max(1, int(delay * 1000)))
+        timer.single_shot = True
+        timer.add_callback(self._flush)
+        timer.start()
+        self._flush_timer = timer  # keep a reference until it fires
+
+    def _flush(self):
+        if self._redraw_pending:
+            self._redraw()
+
+
 @make_class_safe(logger=logger)
-class LivePlot(QtAwareCallback):
+class LivePlot(_RedrawThrottle, QtAwareCallback):
     """
     Build a function that updates a plot from a stream of Events.
 
@@ -113,8 +191,25 @@ class LivePlot(QtAwareCallback):
     epoch : {'run', 'unix'}, optional
         If 'run' t=0 is the time recorded in the RunStart document. If 'unix',
         t=0 is 1 Jan 1970 ("the UNIX epoch"). Default is 'run'.
+    max_fps : float or None, optional
+        Redraw at most this many times per second. Events that arrive sooner
+        are drawn together with the next redraw, which keeps fast monitors
+        from saturating the GUI. None redraws on every event. Default is 30.
+    max_display_points : int or None, optional
+        If a line has more points than this, display a decimated version that
+        keeps the minimum and maximum of each bin of consecutive points. The
+        full data is kept in ``x_data`` and ``y_data``. None never decimates.
+        Default is 20000.
     All additional keyword arguments are passed through to ``Axes.plot``.
 
+    Attributes
+    ----------
+    frame_stats : dict
+        For the current run: the number of 'updates' (redraws requested by
+        new data), 'redraws' (redraws done) and 'dropped' (updates merged
+        into another redraw because of ``max_fps``), and the total
+        'draw_time' in seconds spent redrawing.
+
     Examples
     --------
     >>> my_plotter = LivePlot('det', 'motor', legend_keys=['sample'])
@@ -122,11 +217,27 @@ class LivePlot(QtAwareCallback):
     """
 
     def __init__(
-        self, y, x=None, *, legend_keys=None, xlim=None, ylim=None, ax=None, fig=None, epoch="run", **kwargs
+        self,
+        y,
+        x=None,
+        *,
+        legend_keys=None,
+        xlim=None,
+        ylim=None,
+        ax=None,
+        fig=None,
+        epoch="run",
+        max_fps=30,
+        max_display_points=20_000,
+        **kwargs,
     ):
         super().__init__(use_teleporter=kwargs.pop("use_teleporter", None))
         self.__setup_lock = threading.Lock()
         self.__setup_event = threading.Event()
+        self._init_throttle(max_fps)
+        self.max_display_points = max_display_points
+        self._x_buffer = _GrowableArray()
+        self._y_buffer = _GrowableArray()
 
         def setup():
             # Run this code in start() so that it runs on the correct thread.
@@ -179,7 +290,8 @@ class LivePlot(QtAwareCallback):
         self.__setup()
         # The doc is not used; we just use the signal that a new run began.
         self._epoch_offset = doc["time"]  # used if self.x == 'time'
-        self.x_data, self.y_data = [], []
+        self._x_buffer, self._y_buffer = _GrowableArray(), _GrowableArray()
+        self._reset_frame_stats()
         label = " :: ".join([str(doc.get(name, name)) for name in self.legend_keys])
         kwargs = ChainMap(self.kwargs, {"label": label})
         (self.current_line,) = self.ax.plot([], [], **kwargs)
@@ -223,21 +335,50 @@ class LivePlot(QtAwareCallback):
         self.update_plot()
         super().event(doc)
 
+    @property
+    def x_data(self):
+        return self._x_buffer.values
+
+    @x_data.setter
+    def x_data(self, value):
+        self._x_buffer = _GrowableArray(value)
+
+    @property
+    def y_data(self):
+        return self._y_buffer.values
+
+    @y_data.setter
+    def y_data(self, value):
+        self._y_buffer = _GrowableArray(value)
+
     def update_caches(self, x, y):
-        self.y_data.append(y)
-        self.x_data.append(x)
+        self._y_buffer.append(y)
+        self._x_buffer.append(x)
 
     def update_plot(self):
-        self.current_line.set_data(self.x_data, self.y_data)
+        """
+        Redraw the plot, or only mark it for redrawing if the last redraw was
+        less than ``1 / max_fps`` ago. A pending redraw is done by the next
+        update that is due, at the end of the run, or by a timer in GUI
+        backends.
+        """
+        self._request_redraw()
+
+    def _draw_frame(self):
+        self._update_lines()
         # Rescale and redraw.
         self.ax.relim(visible_only=True)
         self.ax.autoscale_view(tight=True)
         self.ax.figure.canvas.draw_idle()
 
+    def _update_lines(self):
+        self.current_line.set_data(*_envelope(self.x_data, self.y_data, self.max_display_points))
+
     def stop(self, doc):
-        if not self.x_data:
+        self._flush()
+        if not len(self.x_data):
             print(f"LivePlot did not get any data that corresponds to the x axis. {self.x}")
-        if not self.y_data:
+        if not len(self.y_data):
             print(f"LivePlot did not get any data that corresponds to the y axis. {self.y}")
         if len(self.y_data) != len(self.x_data):
             print(
@@ -404,7 +545,7 @@ class LiveMesh(LiveScatter):
 
 
 @make_class_safe(logger=logger)
-class LiveGrid(QtAwareCallback):
+class LiveGrid(_RedrawThrottle, QtAwareCallback):
     """Plot gridded 2D data in a "heat map".
 
     This assumes that readings are placed on a regular grid and can be placed
@@ -454,6 +595,23 @@ class LiveGrid(QtAwareCallback):
         Override title of plot. If None (default), title is generated from the scan
         ID. Set to empty string to remove title.
 
+    max_fps : float or None, optional
+        Redraw at most this many times per second; pixels that arrive sooner
+        are drawn with the next redraw. None redraws on every event. Default
+        is 30.
+
+    blit : bool, optional
+        If True (default) and the canvas supports it, redraw only the image
+        while the color limits are unchanged, instead of the whole figure.
+
+    Attributes
+    ----------
+    frame_stats : dict
+        For the current run: the number of 'updates' (redraws requested by
+        new data), 'redraws' (redraws done) and 'dropped' (updates merged
+        into another redraw because of ``max_fps``), and the total
+        'draw_time' in seconds spent redrawing.
+
     See Also
     --------
     :class:`bluesky.callbacks.mpl_plotting.LiveScatter`.
@@ -474,11 +632,15 @@ class LiveGrid(QtAwareCallback):
         x_positive="right",
         y_positive="up",
         title=None,
+        max_fps=30,
+        blit=True,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.__setup_lock = threading.Lock()
         self.__setup_event = threading.Event()
+        self._init_throttle(max_fps)
+        self._blit = blit
 
         def setup():
             # Run this code in start() so that it runs on the correct thread.
@@ -499,7 +661,7 @@ class LiveGrid(QtAwareCallback):
             ax.set_ylabel(ylabel)
             ax.set_aspect(aspect)
             self.ax = ax
-            self._Idata = np.ones(raster_shape) * np.nan
+            self._Idata = np.full(raster_shape, np.nan)
             self._norm = mcolors.Normalize()
             if clim is not None:
                 self._norm.vmin, self._norm.vmax = clim
@@ -519,7 +681,10 @@ class LiveGrid(QtAwareCallback):
         self.__setup()
         if self.im is not None:
             raise RuntimeError("Can not re-use LiveGrid")
-        self._Idata = np.ones(self.raster_shape) * np.nan
+        self._Idata = np.full(self.raster_shape, np.nan)
+        self._data_limits = self._drawn_limits = (np.nan, np.nan)
+        self._background = None
+        self._reset_frame_stats()
         # The user can control origin by specific 'extent'.
         extent = self.extent
         # origin must be 'lower' for the plot to fill in correctly
@@ -563,6 +728,13 @@ class LiveGrid(QtAwareCallback):
 
         cb = self.ax.figure.colorbar(im, ax=self.ax)
         cb.set_label(self.I)
+        canvas = self.ax.figure.canvas
+        self._blitting = self._blit and canvas.supports_blit
+        if self._blitting:
+            # Leave the image out of full redraws, so that the rest of the
+            # axes can be saved as the background to blit it onto.
+            im.set_animated(True)
+            self._draw_cid = canvas.mpl_connect("draw_event", self._on_draw)
         super().start(doc)
 
     def event(self, doc):
@@ -579,12 +751,51 @@ class LiveGrid(QtAwareCallback):
         super().event(doc)
 
     def update(self, pos, I):  # noqa: E741
+        previous = self._Idata[pos]
         self._Idata[pos] = I
         if self.clim is None:
-            self.im.set_clim(np.nanmin(self._Idata), np.nanmax(self._Idata))
-
+            # Track the data limits as pixels arrive rather than scanning the
+            # whole image; only overwriting an extreme needs a full scan.
+            vmin, vmax = self._data_limits
+            value = self._Idata[pos]
+            if previous == vmin or previous == vmax:
+                finite = self._Idata[np.isfinite(self._Idata)]
+                self._data_limits = (finite.min(), finite.max()) if finite.size else (np.nan, np.nan)
+            elif np.isfinite(value):
+                self._data_limits = (value if not value >= vmin else vmin, value if not value <= vmax else vmax)
+        self._request_redraw()
+
+    def _draw_frame(self):
+        canvas = self.ax.figure.canvas
         self.im.set_array(self._Idata)
-        self.ax.figure.canvas.draw_idle()
+        full = not self._blitting or self._background is None
+        if self.clim is None and self._data_limits != self._drawn_limits and np.isfinite(self._data_limits[0]):
+            # the colorbar changes too
+            self.im.set_clim(*self._data_limits)
+            self._drawn_limits = self._data_limits
+            full = True
+        if full:
+            self._background = None
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(self._background)
+            self.ax.draw_artist(self.im)
+            canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        canvas = self.ax.figure.canvas
+        self._background = canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.im)
+
+    def stop(self, doc):
+        self._flush()
+        if self._blitting:
+            # Draw the image normally again, e.g. when the figure is saved.
+            self.ax.figure.canvas.mpl_disconnect(self._draw_cid)
+            self.im.set_animated(False)
+            self._background = None
+            self.ax.figure.canvas.draw_idle()
+        super().stop(doc)
 
 
 @make_class_safe(logger=logger)
@@ -636,6 +847,7 @@ class LiveFitPlot(LivePlot):
         self._livefit = livefit
         self._xlim = xlim
         self._has_been_run = False
+        self._plotted_result = None
 
     @property
     def livefit(self):
@@ -657,33 +869,31 @@ class LiveFitPlot(LivePlot):
 
     def event(self, doc):
         self.livefit.event(doc)
-        if self.livefit.result is not None:
-            # Evaluate the model function at equally-spaced points.
-            # To determine the domain of x, use xlim if availabe. Otherwise,
-            # use the range of x points measured up to this point.
-            if self._xlim is None:
-                x_data = self.livefit.independent_vars_data[self.__x_key]
-                xmin, xmax = np.min(x_data), np.max(x_data)
-            else:
-                xmin, xmax = self._xlim
-            x_points = np.linspace(xmin, xmax, self.num_points)
-            kwargs = {self.__x_key: x_points}
-            kwargs.update(self.livefit.result.values)
-            self.y_data = self.livefit.result.model.eval(**kwargs)
-            self.x_data = x_points
-            # update kwargs to inital guess
-            kwargs.update(self.livefit.result.init_values)
-            self.y_guess = self.livefit.result.model.eval(**kwargs)
+        # LiveFit only refits every few events; redraw when the result changes.
+        if self.livefit.result is not None and self.livefit.result is not self._plotted_result:
             self.update_plot()
         # Intentionally override LivePlot.event. Do not call super().
 
-    def update_plot(self):
+    def _update_lines(self):
+        result = self._plotted_result = self.livefit.result
+        # Evaluate the model function at equally-spaced points.
+        # To determine the domain of x, use xlim if availabe. Otherwise,
+        # use the range of x points measured up to this point.
+        if self._xlim is None:
+            x_data = self.livefit.independent_vars_data[self.__x_key]
+            xmin, xmax = np.min(x_data), np.max(x_data)
+        else:
+            xmin, xmax = self._xlim
+        x_points = np.linspace(xmin, xmax, self.num_points)
+        kwargs = {self.__x_key: x_points}
+        kwargs.update(result.values)
+        self.y_data = result.model.eval(**kwargs)
+        self.x_data = x_points
+        # update kwargs to inital guess
+        kwargs.update(result.init_values)
+        self.y_guess = result.model.eval(**kwargs)
         self.current_line.set_data(self.x_data, self.y_data)
         self.init_guess_line.set_data(self.x_data, self.y_guess)
-        # Rescale and redraw.
-        self.ax.relim(visible_only=True)
-        self.ax.autoscale_view(tight=True)
-        self.ax.figure.canvas.draw_idle()
 
     def descriptor(self, doc):
         self.livefit.descriptor(doc)
@@ -691,6 +901,10 @@ class LiveFitPlot(LivePlot):
 
     def stop(self, doc):
         self.livefit.stop(doc)
+        if self.livefit.result is not None and self.livefit.result is not self._plotted_result:
+            self._redraw()
+        else:
+            self._flush()
         # Intentionally override LivePlot.stop. Do not call super().
 
 
@@ -3,7 +3,7 @@ from collections import ChainMap
 from collections.abc import Iterable
 
 import numpy as np
-from event_model import DocumentNames, schema_validators
+from event_model import DocumentNames, pack_event_page, schema_validators, unpack_event_page
 
 from ..run_engine import Dispatcher
 from ..utils import new_uid
@@ -43,6 +43,12 @@ class LiveDispatcher(CallbackBase):
         self.raw_descriptors = dict()  # Store raw descriptors for use later  # noqa: C408
         self._stream_start_uid = None  # Generated start doc uid
         self._descriptors = dict()  # Dictionary of sent descriptors  # noqa: C408
+        # (stream_name, id_args) -> (data keys, uid) of the descriptor used last
+        self._descriptor_cache = {}
+        # descriptor uid -> keys of an Event that passed schema validation
+        self._validated_event_keys = {}
+        # Events waiting to be emitted as an EventPage, while in event_page
+        self._page_buffer = None
 
     def start(self, doc, _md=None):
         """Receive a raw start document, re-emit it for the modified stream"""
@@ -77,7 +83,26 @@ class LiveDispatcher(CallbackBase):
             All keyword arguments are passed to :meth:`.process_event`
         """
         self.process_event(doc, **kwargs)
-        return super().event(doc)
+        super().event(doc)
+
+    def event_page(self, doc):
+        """
+        Receive an EventPage from the raw stream.
+
+        Each of its Events is passed to :meth:`.event`, and the Events this
+        produces are emitted together as EventPages, one per descriptor.
+
+        Parameters
+        ----------
+        doc : event_page
+        """
+        self._page_buffer = []
+        try:
+            for event in unpack_event_page(doc):
+                self.event(event)
+        finally:
+            self._emit_page_buffer()
+            self._page_buffer = None
 
     def process_event(self, doc, stream_name="primary", id_args=None, config=None):
         """
@@ -110,9 +135,48 @@ class LiveDispatcher(CallbackBase):
         anywhere.
         """
         id_args = id_args or (doc["descriptor"],)
+        data = doc["data"]
+        # Most events have the same keys as the last one from the same source;
+        # then the descriptor is known without building its id.
+        cached = self._descriptor_cache.get((stream_name, id_args))
+        if cached is not None and cached[0] == data.keys():
+            desc_uid = cached[1]
+        else:
+            desc_uid = self._get_descriptor(doc, stream_name, id_args, config)
+        self.seq_count += 1
+
+        # Clean the Event document produced by graph network. The data is left
+        # untouched, but the relevant uids, timestamps, seq_num are modified so
+        # that this event is not confused with the raw data stream
+        current_time = ttime.time()
+        evt = dict(doc)
+        evt["uid"] = new_uid()
+        evt["descriptor"] = desc_uid
+        evt["timestamps"] = dict.fromkeys(data, current_time)
+        evt["seq_num"] = self.seq_count
+        evt["time"] = current_time
+        self._validate_event(evt)
+        if self._page_buffer is not None:
+            self._page_buffer.append(evt)
+            return
+        # Emit the event document
+        self._emit_validated(DocumentNames.event, evt)
+
+    def _validate_event(self, evt):
+        """Check the schema of an Event made by process_event"""
+        # Only the first Event of a descriptor needs validating: the fields
+        # set by process_event always have valid types, and the data is
+        # unconstrained. Check again if the Event has other keys or any
+        # 'filled' values.
+        if self._validated_event_keys.get(evt["descriptor"]) != evt.keys() or evt.get("filled"):
+            schema_validators[DocumentNames.event].validate(evt)
+            self._validated_event_keys[evt["descriptor"]] = frozenset(evt)
+
+    def _get_descriptor(self, doc, stream_name, id_args, config):
+        """Find the descriptor for an event, emitting a new one if need be"""
         config = config or dict()  # noqa: C408
         # Determine the descriptor id
-        desc_id = frozenset((tuple(doc["data"].keys()), stream_name, id_args))
+        desc_id = (frozenset(doc["data"]), stream_name, id_args)
         # If we haven't described this configuration
         # Send a new document to our subscribers
         if stream_name not in self._descriptors or desc_id not in self._descriptors[stream_name]:
@@ -157,27 +221,25 @@ class LiveDispatcher(CallbackBase):
             if stream_name not in self._descriptors:
                 self._descriptors[stream_name] = dict()  # noqa: C408
             self._descriptors[stream_name][desc_id] = desc
+            # Events already processed must go out before the new descriptor
+            self._emit_page_buffer()
             # Emit the document to all subscribers
             self.emit(DocumentNames.descriptor, desc)
+        desc = self._descriptors[stream_name][desc_id]
+        self._descriptor_cache[stream_name, id_args] = (frozenset(desc["data_keys"]), desc["uid"])
+        return desc["uid"]
 
-        # Clean the Event document produced by graph network. The data is left
-        # untouched, but the relevant uids, timestamps, seq_num are modified so
-        # that this event is not confused with the raw data stream
-        self.seq_count += 1
-        desc_uid = self._descriptors[stream_name][desc_id]["uid"]
-        current_time = ttime.time()
-        evt = ChainMap(
-            {
-                "uid": new_uid(),
-                "descriptor": desc_uid,
-                "timestamps": dict((key, current_time) for key in doc["data"].keys()),  # noqa: C402
-                "seq_num": self.seq_count,
-                "time": current_time,
-            },
-            doc,
-        )
-        # Emit the event document
-        self.emit(DocumentNames.event, dict(evt))
+    def _emit_page_buffer(self):
+        """Emit the buffered Events as EventPages of consecutive Events"""
+        if not self._page_buffer:
+            return
+        events, self._page_buffer = self._page_buffer, []
+        start = 0
+        for i in range(1, len(events) + 1):
+            if i == len(events) or events[i]["descriptor"] != events[start]["descriptor"]:
+                # The Events were validated, so the page is valid.
+                self._emit_validated(DocumentNames.event_page, pack_event_page(*events[start:i]))
+                start = i
 
     def stop(self, doc, _md=None):
         """Receive a raw stop document, re-emit it for the modified stream"""
@@ -195,14 +257,25 @@ class LiveDispatcher(CallbackBase):
         self.seq_count = 0
         self.raw_descriptors.clear()
         self._descriptors.clear()
+        self._descriptor_cache.clear()
+        self._validated_event_keys.clear()
         self._stream_start_uid = None
         super().stop(doc)
 
-    def emit(self, name, doc):
+    def emit(self, name, doc, *, _validate=True):
         """Check the document schema and send to the dispatcher"""
-        schema_validators[name].validate(doc)
+        if _validate:
+            schema_validators[name].validate(doc)
         self.dispatcher.process(name, doc)
 
+    def _emit_validated(self, name, doc):
+        """Emit a document whose schema has already been checked"""
+        if type(self).emit is LiveDispatcher.emit:
+            self.emit(name, doc, _validate=False)
+        else:
+            # An override of emit may not take _validate.
+            self.emit(name, doc)
+
     def subscribe(self, func, name="all"):
         """Convenience function for dispatcher subscription"""
         return self.dispatcher.subscribe(func, name)
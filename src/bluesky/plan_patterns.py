@@ -1,5 +1,6 @@
 import collections
 import functools
+import hashlib
 import operator
 from enum import Enum
 
@@ -12,7 +13,361 @@ try:
 except ImportError:
     from toolz import partition
 
-from .utils import is_movable, snake_cyclers
+from .utils import is_movable, snake_cyclers, snake_indices
+
+
+class Trajectory:
+    """
+    Positions of one or more motors moving together, stored as NumPy arrays.
+
+    This is a compact alternative to a :class:`cycler.Cycler` for long
+    trajectories: the positions are held as one array per motor and the
+    per-point dictionaries are only made while iterating. It can be passed
+    to :func:`bluesky.plans.scan_nd` in place of a cycler.
+
+    Parameters
+    ----------
+    positions : dict
+        mapping each motor to a 1-D sequence of positions; all of the same
+        length
+    shape : tuple, optional
+        the shape of the scan, e.g. ``(num_rows, num_columns)`` for a
+        raster; ``(num_points,)`` by default
+    spec : dict, optional
+        a compact, JSON-serializable description of how the positions were
+        generated, recorded in the metadata by :meth:`describe`
+
+    Examples
+    --------
+    >>> traj = Trajectory({motor1: np.linspace(0, 1, 11)}) * Trajectory({motor2: [1, 2, 3]})
+    >>> len(traj)
+    33
+    >>> RE(scan_nd([det], traj))
+    """
+
+    # Number of points converted to Python objects at a time while iterating.
+    chunk_size = 4096
+
+    def __init__(self, positions, *, shape=None, spec=None):
+        self._positions = {}
+        length = None
+        for motor, pos in dict(positions).items():
+            arr = np.asarray(pos)
+            if arr.ndim != 1:
+                raise ValueError(f"The positions of {motor!r} must be one-dimensional, not of shape {arr.shape}.")
+            if length is None:
+                length = len(arr)
+            elif len(arr) != length:
+                raise ValueError("All motors in a Trajectory must have the same number of positions.")
+            self._positions[motor] = arr
+        self._length = length or 0
+        if shape is None:
+            shape = (self._length,)
+        if int(np.prod(shape)) != self._length:
+            raise ValueError(f"A Trajectory of shape {tuple(shape)} can not have {self._length} points.")
+        self.shape = tuple(int(n) for n in shape)
+        self.spec = spec
+        self._hash = None
+
+    @classmethod
+    def from_cycler(cls, cyc):
+        """Make a Trajectory with the same points as a cycler."""
+        return cls(cyc.by_key())
+
+    def to_cycler(self):
+        """Make a cycler with the same points as this Trajectory."""
+        return functools.reduce(operator.add, (cycler(motor, pos) for motor, pos in self._positions.items()))
+
+    @property
+    def keys(self):
+        "The motors, in order"
+        return list(self._positions)
+
+    def by_key(self):
+        """Map each motor to its array of positions, like ``Cycler.by_key``."""
+        return dict(self._positions)
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def num_points(self):
+        "The number of points in the trajectory"
+        return self._length
+
+    @property
+    def hash(self):
+        "A SHA-256 hex digest of the motor names and positions"
+        if self._hash is None:
+            h = hashlib.sha256()
+            for motor, pos in self._positions.items():
+                h.update(str(getattr(motor, "name", motor)).encode())
+                if pos.dtype.hasobject:
+                    h.update(repr(pos.tolist()).encode())
+                else:
+                    h.update(pos.dtype.str.encode())
+                    h.update(np.ascontiguousarray(pos).tobytes())
+            self._hash = h.hexdigest()
+        return self._hash
+
+    def describe(self):
+        """
+        Describe the trajectory compactly, for metadata.
+
+        Unlike the repr of a cycler, the size of this does not grow with the
+        number of points.
+
+        Returns
+        -------
+        description : dict
+            with the keys 'spec', 'shape', 'num_points', 'motors', 'bounds'
+            (the minimum and maximum position of each numeric motor) and
+            'hash'
+        """
+        bounds = {}
+        for motor, pos in self._positions.items():
+            if len(pos) and np.issubdtype(pos.dtype, np.number):
+                bounds[str(getattr(motor, "name", motor))] = [pos.min().item(), pos.max().item()]
+        return {
+            "spec": self.spec,
+            "shape": list(self.shape),
+            "num_points": self.num_points,
+            "motors": [str(getattr(motor, "name", motor)) for motor in self._positions],
+            "bounds": bounds,
+            "hash": self.hash,
+        }
+
+    def __iter__(self):
+        keys = list(self._positions)
+        arrays = list(self._positions.values())
+        for start in range(0, self._length, self.chunk_size):
+            stop = start + self.chunk_size
+            for point in zip(*(arr[start:stop].tolist() for arr in arrays)):
+                yield dict(zip(keys, point))
+
+    def take(self, indices):
+        """
+        Make a Trajectory of the points at ``indices``, in that order.
+
+        Parameters
+        ----------
+        indices : sequence of int
+
+        Returns
+        -------
+        traj : Trajectory
+        """
+        indices = np.asarray(indices)
+        spec = None if self.spec is None else {"pattern": "take", "parts": [self.spec]}
+        return Trajectory({motor: pos[indices] for motor, pos in self._positions.items()}, spec=spec)
+
+    def __add__(self, other):
+        # inner product, like Cycler.__add__
+        if not isinstance(other, Trajectory):
+            other = Trajectory.from_cycler(other)
+        if len(self) != len(other):
+            raise ValueError(f"Can not add Trajectories of unequal length: {len(self)} and {len(other)}")
+        if set(self._positions) & set(other._positions):
+            raise ValueError("Can not add Trajectories with overlapping motors")
+        return Trajectory(
+            {**self._positions, **other._positions},
+            shape=self.shape if self.shape == other.shape else None,
+            spec=_combined_spec("inner_product", [self, other]),
+        )
+
+    def __mul__(self, other):
+        # outer product, like Cycler.__mul__: self is the slower axis
+        if not isinstance(other, Trajectory):
+            other = Trajectory.from_cycler(other)
+        return snake_trajectories([self, other], [False, False])
+
+    def __repr__(self):
+        positions = ", ".join(
+            f"{getattr(motor, 'name', motor)!s}: {pos!r}" for motor, pos in self._positions.items()
+        )
+        return f"{type(self).__name__}({{{positions}}})"
+
+
+def snake_trajectories(trajectories, snake_booleans):
+    """
+    Combine trajectories with a 'snaking' back-and-forth order.
+
+    This is the vectorized counterpart of :func:`bluesky.utils.snake_cyclers`.
+
+    Parameters
+    ----------
+    trajectories : List[Trajectory]
+        A list of trajectories to be "snaked", slowest first.
+    snake_booleans : List[bool]
+        A list of the same length as trajectories indicating whether each one
+        should 'snake' (True) or not (False).
+
+    Returns
+    -------
+    result : Trajectory
+    """
+    if len(trajectories) != len(snake_booleans):
+        raise ValueError("number of trajectories does not match number of booleans")
+    lengths = [len(traj) for traj in trajectories]
+    positions = {}
+    for traj, indices in zip(trajectories, snake_indices(lengths, snake_booleans)):
+        for motor, pos in traj.by_key().items():
+            if motor in positions:
+                raise ValueError("Can not combine Trajectories with overlapping motors")
+            positions[motor] = pos[indices]
+    spec = _combined_spec("outer_product", trajectories)
+    if spec is not None and any(snake_booleans[1:]):
+        spec["snake"] = list(snake_booleans)
+    return Trajectory(positions, shape=sum((traj.shape for traj in trajectories), ()), spec=spec)
+
+
+def optimize_path(positions, velocities=None, *, max_passes=20):
+    """
+    Find an order of the points that reduces the time spent moving.
+
+    The order is built with a nearest-neighbor heuristic starting from the
+    first point and then improved with 2-opt moves (reversing sections of the
+    path) until no reversal helps or ``max_passes`` passes have been made.
+    The first point stays first.
+
+    The time to move between two points is that of the slowest motor, as the
+    motors move concurrently: the largest ``abs(difference) / velocity``.
+
+    Parameters
+    ----------
+    positions : dict
+        mapping motors to 1-D arrays of numeric positions of the same length,
+        e.g. ``Trajectory.by_key()`` or ``Cycler.by_key()``
+    velocities : dict, optional
+        mapping (some of) the motors to their velocities; 1 by default
+    max_passes : int, optional
+        the maximum number of 2-opt passes over the path
+
+    Returns
+    -------
+    order : np.ndarray
+        The new order as indices into the original points: the i-th point
+        visited is the ``order[i]``-th original point.
+    """
+    velocities = velocities or {}
+    motors = list(positions)
+    points = np.column_stack([np.asarray(positions[motor], dtype=float) for motor in motors])
+    points = points / np.array([float(velocities.get(motor, 1)) for motor in motors])
+    num_points = len(points)
+    if num_points < 3:
+        return np.arange(num_points)
+
+    def move_time(a, b):
+        return np.max(np.abs(a - b), axis=-1)
+
+    # nearest neighbor
+    order = np.empty(num_points, dtype=int)
+    visited = np.zeros(num_points, dtype=bool)
+    current = 0
+    for i in range(num_points):
+        order[i] = current
+        visited[current] = True
+        if i == num_points - 1:
+            break
+        times = move_time(points, points[current])
+        times[visited] = np.inf
+        current = int(np.argmin(times))
+
+    # 2-opt: reversing order[i:j + 1] replaces the moves (i - 1 -> i) and
+    # (j -> j + 1) by (i - 1 -> j) and (i -> j + 1). The path is open, so when
+    # j is the last point there is no second move to replace.
+    path = points[order]
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, num_points - 1):
+            before, first, rest = path[i - 1], path[i], path[i + 1 :]
+            after_rest = path[i + 2 :]
+            old = move_time(before, first) + np.append(move_time(rest[:-1], after_rest), 0)
+            new = move_time(before, rest) + np.append(move_time(first, after_rest), 0)
+            gain = old - new
+            k = int(np.argmax(gain))
+            if gain[k] > 1e-12 * max(1.0, old[k]):
+                j = i + 1 + k
+                order[i : j + 1] = order[i : j + 1][::-1]
+                path[i : j + 1] = path[i : j + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return order
+
+
+def refine_points(positions, values, *, num, min_step, max_step=None, tolerance=0.01, focus="shape"):
+    """
+    Choose where to measure next to refine a 1-D scan.
+
+    The data are modelled by quadratics through each three neighboring
+    points. The deviation of those quadratics from the straight line joining
+    two neighboring points estimates the error of interpolating linearly
+    between them, in units of the range of ``values``. The midpoints of the
+    ``num`` intervals with the largest error above ``tolerance`` are chosen,
+    except that intervals wider than ``max_step`` are always split first and
+    intervals narrower than ``2 * min_step`` never are.
+
+    Parameters
+    ----------
+    positions : array-like
+        positions measured so far, in any order
+    values : array-like
+        values measured at ``positions``
+    num : int
+        the largest number of positions to return
+    min_step : float
+        no two positions are chosen closer than this
+    max_step : float, optional
+        intervals wider than this are split regardless of the error
+    tolerance : float, optional
+        the error, relative to the range of ``values``, below which an
+        interval is not split; 0.01 by default
+    focus : {'shape', 'peak'}, optional
+        With 'shape' (the default) the errors are refined uniformly. With
+        'peak' they are weighted by the square of the height of the interval
+        relative to the range of ``values``, concentrating points on the
+        maximum.
+
+    Returns
+    -------
+    positions : np.ndarray
+        sorted positions to measure next; empty once the scan has converged
+    """
+    if focus not in ("shape", "peak"):
+        raise ValueError(f"focus must be 'shape' or 'peak', not {focus!r}")
+    x = np.asarray(positions, dtype=float)
+    y = np.asarray(values, dtype=float)
+    x, index = np.unique(x, return_index=True)
+    y = y[index]
+    if len(x) < 2:
+        return np.empty(0)
+    dx = np.diff(x)
+    yscale = np.ptp(y) or 1.0
+    curvature = np.zeros(len(dx))
+    if len(x) > 2:
+        # The leading coefficient of the quadratic through three points is
+        # their second divided difference; it deviates from the chord by
+        # |a| * dx**2 / 4 at the middle of an interval between its nodes.
+        second = np.abs(np.diff(np.diff(y) / dx) / (x[2:] - x[:-2]))
+        curvature[:-1] = second
+        curvature[1:] = np.maximum(curvature[1:], second)
+    error = curvature * dx**2 / 4 / yscale
+    if focus == "peak":
+        error *= ((np.maximum(y[:-1], y[1:]) - y.min()) / yscale) ** 2
+    forced = dx > max_step if max_step is not None else np.zeros(len(dx), dtype=bool)
+    candidates = np.flatnonzero(forced | ((dx >= 2 * min_step) & (error > tolerance)))
+    # forced intervals first, then the largest errors
+    candidates = candidates[np.lexsort((-error[candidates], ~forced[candidates]))][:num]
+    return np.sort(x[candidates] + dx[candidates] / 2)
+
+
+def _combined_spec(combination, trajectories):
+    # The spec of a combination of trajectories, if they all have one.
+    specs = [traj.spec for traj in trajectories]
+    if any(spec is None for spec in specs):
+        return None
+    return {"pattern": combination, "parts": specs}
 
 
 def spiral(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, nth, *, dr_y=None, tilt=0.0):
@@ -45,6 +400,25 @@ def spiral(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, nth, *, dr_
     Returns
     -------
     cyc : cycler
+
+    See Also
+    --------
+    :func:`bluesky.plan_patterns.spiral_trajectory`
+    """
+    return spiral_trajectory(
+        x_motor, y_motor, x_start, y_start, x_range, y_range, dr, nth, dr_y=dr_y, tilt=tilt
+    ).to_cycler()
+
+
+def spiral_trajectory(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, nth, *, dr_y=None, tilt=0.0):
+    """Spiral trajectory, centered around (x_start, y_start)
+
+    The parameters and points are the same as those of :func:`spiral`, but
+    the points are computed with vectorized NumPy operations.
+
+    Returns
+    -------
+    traj : Trajectory
     """
     if dr_y is None:
         dr_aspect = 1
@@ -58,23 +432,33 @@ def spiral(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, nth, *, dr_
     num_ring = 1 + int(r_max / dr)
     tilt_tan = np.tan(tilt + np.pi / 2.0)
 
-    x_points, y_points = [], []
-
-    for i_ring in range(1, num_ring + 2):
-        radius = i_ring * dr
-        angle_step = 2.0 * np.pi / (i_ring * nth)
-
-        for i_angle in range(int(i_ring * nth)):
-            angle = i_angle * angle_step
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle) * dr_aspect
-            if (abs(x - (y / dr_aspect) / tilt_tan) <= half_x) and (abs(y / dr_aspect) <= half_y):
-                x_points.append(x_start + x)
-                y_points.append(y_start + y)
-
-    cyc = cycler(x_motor, x_points)
-    cyc += cycler(y_motor, y_points)
-    return cyc
+    rings = np.arange(1, num_ring + 2)
+    points_per_ring = (rings * nth).astype(int)
+    # ring number and angle index of every candidate point, ring by ring
+    i_ring = np.repeat(rings, points_per_ring)
+    i_angle = np.arange(len(i_ring)) - np.repeat(np.cumsum(points_per_ring) - points_per_ring, points_per_ring)
+
+    radius = i_ring * dr
+    angle_step = 2.0 * np.pi / (i_ring * nth)
+    angle = i_angle * angle_step
+    x = radius * np.cos(angle)
+    y = radius * np.sin(angle) * dr_aspect
+    keep = (np.abs(x - (y / dr_aspect) / tilt_tan) <= half_x) & (np.abs(y / dr_aspect) <= half_y)
+
+    spec = {
+        "pattern": "spiral",
+        "args": {
+            "x_start": x_start,
+            "y_start": y_start,
+            "x_range": x_range,
+            "y_range": y_range,
+            "dr": dr,
+            "nth": nth,
+            "dr_y": dr_y,
+            "tilt": tilt,
+        },
+    }
+    return Trajectory({x_motor: x_start + x[keep], y_motor: y_start + y[keep]}, spec=spec)
 
 
 def spiral_square_pattern(x_motor, y_motor, x_center, y_center, x_range, y_range, x_num, y_num):
@@ -102,9 +486,28 @@ def spiral_square_pattern(x_motor, y_motor, x_center, y_center, x_range, y_range
     Returns
     -------
     cyc : cycler
+
+    See Also
+    --------
+    :func:`bluesky.plan_patterns.spiral_square_trajectory`
+    """
+    return spiral_square_trajectory(
+        x_motor, y_motor, x_center, y_center, x_range, y_range, x_num, y_num
+    ).to_cycler()
+
+
+def spiral_square_trajectory(x_motor, y_motor, x_center, y_center, x_range, y_range, x_num, y_num):
     """
-    x_points, y_points = [], []
+    Square spiral trajectory, centered around (x_start, y_start)
+
+    The parameters and points are the same as those of
+    :func:`spiral_square_pattern`, but the points are computed with
+    vectorized NumPy operations.
 
+    Returns
+    -------
+    traj : Trajectory
+    """
     # checks if x_num/y_num is even or odd and sets the required offset
     # parameter for the start point from the centre point.
     if x_num % 2 == 0:
@@ -120,81 +523,58 @@ def spiral_square_pattern(x_motor, y_motor, x_center, y_center, x_range, y_range
     num_ring = max(x_num, y_num)
     x_delta = x_range / (x_num - 1)
     y_delta = y_range / (y_num - 1)
+    num_points = x_num * y_num
 
-    # include the first point, as it is the first 'ring' to include.
-    x_points.append(x_center - x_delta * x_offset)
-    y_points.append(y_center - y_delta * y_offset)
-
-    # set the number of found points to 0
-    num_pnts_fnd = 1
+    # Grid indices (relative to the first point) of the points, ring by ring,
+    # starting with the first point as the first 'ring'.
+    x_indices = [np.zeros(1, dtype=int)]
+    y_indices = [np.zeros(1, dtype=int)]
 
     # step through each of the rings required to map out the entire area.
     for i_ring in range(2, num_ring + 1, 1):
-        # step through each of the 'sides' of the ring if the constant value
-        # for each side is within the range to plot and
-        # that we have not already found all the required points.
+        down = np.arange(i_ring - 2, -i_ring, -1)
+        up = np.arange(-i_ring + 2, i_ring, 1)
+        # Each side of the ring is included if its constant index is within
+        # the range to plot, keeping the points whose variable index is too.
         # SIDE 1
-        if (abs(i_ring - 1 - x_offset) <= x_num / 2) and (num_pnts_fnd < x_num * y_num):
-            for n in range(i_ring - 2, -i_ring, -1):
-                # Ensure that the variable value for this side is within the
-                # range to plot and that we have not already
-                # found all the required points.
-                if (abs(n - y_offset) < y_num / 2) and (num_pnts_fnd < y_num * x_num):
-                    x = x_center - x_delta * x_offset + x_delta * (i_ring - 1)
-                    y = y_center - y_delta * y_offset + y_delta * n
-                    num_pnts_fnd += 1
-
-                    x_points.append(x)
-                    y_points.append(y)
-
+        if abs(i_ring - 1 - x_offset) <= x_num / 2:
+            n = down[np.abs(down - y_offset) < y_num / 2]
+            x_indices.append(np.full(len(n), i_ring - 1))
+            y_indices.append(n)
         # SIDE 2
-        if (abs(-i_ring + 1 - y_offset) < y_num / 2) and (num_pnts_fnd < x_num * y_num):
-            for n in range(i_ring - 2, -i_ring, -1):
-                # Ensure that the variable value for this side is within the
-                # range to plot and that we have not already
-                # found all the required points.
-                if (abs(n - x_offset) < x_num / 2) and (num_pnts_fnd < y_num * x_num):
-                    x = x_center - x_delta * x_offset + x_delta * n
-                    y = y_center - y_delta * y_offset + y_delta * (-i_ring + 1)
-
-                    num_pnts_fnd += 1
-
-                    x_points.append(x)
-                    y_points.append(y)
-
+        if abs(-i_ring + 1 - y_offset) < y_num / 2:
+            n = down[np.abs(down - x_offset) < x_num / 2]
+            x_indices.append(n)
+            y_indices.append(np.full(len(n), -i_ring + 1))
         # SIDE 3
-        if (abs(-i_ring + 1 - x_offset) < x_num / 2) and (num_pnts_fnd < x_num * y_num):
-            for n in range(-i_ring + 2, i_ring, 1):
-                # Ensure that the variable value for this side is within the
-                # range to plot and that we have not already
-                # found all the required points.
-                if (abs(n - y_offset) < y_num / 2) and (num_pnts_fnd < y_num * x_num):
-                    x = x_center - x_delta * x_offset + x_delta * (-i_ring + 1)
-                    y = y_center - y_delta * y_offset + y_delta * n
-                    num_pnts_fnd += 1
-
-                    x_points.append(x)
-                    y_points.append(y)
-
+        if abs(-i_ring + 1 - x_offset) < x_num / 2:
+            n = up[np.abs(up - y_offset) < y_num / 2]
+            x_indices.append(np.full(len(n), -i_ring + 1))
+            y_indices.append(n)
         # SIDE 4
-        if (abs(i_ring - 1 - y_offset) < y_num / 2) and (num_pnts_fnd < x_num * y_num):
-            for n in range(-i_ring + 2, i_ring, 1):
-                # Ensure that the variable value for this side is within the
-                # range to plot and that we have not already
-                # found all the required points.
-                if (abs(n - x_offset) < x_num / 2) and (num_pnts_fnd < y_num * x_num):
-                    x = x_center - x_delta * x_offset + x_delta * n
-                    y = y_center - y_delta * y_offset + y_delta * (i_ring - 1)
-
-                    num_pnts_fnd += 1
-
-                    x_points.append(x)
-                    y_points.append(y)
-
-    cyc = cycler(x_motor, x_points)
-    cyc += cycler(y_motor, y_points)
-
-    return cyc
+        if abs(i_ring - 1 - y_offset) < y_num / 2:
+            n = up[np.abs(up - x_offset) < x_num / 2]
+            x_indices.append(n)
+            y_indices.append(np.full(len(n), i_ring - 1))
+
+    # stop once all the required points have been found
+    x_index = np.concatenate(x_indices)[:num_points]
+    y_index = np.concatenate(y_indices)[:num_points]
+    x_points = x_center - x_delta * x_offset + x_delta * x_index
+    y_points = y_center - y_delta * y_offset + y_delta * y_index
+
+    spec = {
+        "pattern": "spiral_square",
+        "args": {
+            "x_center": x_center,
+            "y_center": y_center,
+            "x_range": x_range,
+            "y_range": y_range,
+            "x_num": x_num,
+            "y_num": y_num,
+        },
+    }
+    return Trajectory({x_motor: x_points, y_motor: y_points}, spec=spec)
 
 
 def spiral_fermat(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, factor, *, dr_y=None, tilt=0.0):
@@ -226,6 +606,27 @@ def spiral_fermat(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, fact
     Returns
     -------
     cyc : cycler
+
+    See Also
+    --------
+    :func:`bluesky.plan_patterns.spiral_fermat_trajectory`
+    """
+    return spiral_fermat_trajectory(
+        x_motor, y_motor, x_start, y_start, x_range, y_range, dr, factor, dr_y=dr_y, tilt=tilt
+    ).to_cycler()
+
+
+def spiral_fermat_trajectory(
+    x_motor, y_motor, x_start, y_start, x_range, y_range, dr, factor, *, dr_y=None, tilt=0.0
+):
+    """Absolute fermat spiral trajectory, centered around (x_start, y_start)
+
+    The parameters and points are the same as those of :func:`spiral_fermat`,
+    but the points are computed with vectorized NumPy operations.
+
+    Returns
+    -------
+    traj : Trajectory
     """
     if dr_y is None:
         dr_aspect = 1
@@ -238,23 +639,29 @@ def spiral_fermat(x_motor, y_motor, x_start, y_start, x_range, y_range, dr, fact
     half_y = y_range / (2 * dr_aspect)
     tilt_tan = np.tan(tilt + np.pi / 2.0)
 
-    x_points, y_points = [], []
-
     diag = np.sqrt(half_x**2 + half_y**2)
     num_rings = int((1.5 * diag / (dr / factor)) ** 2)
-    for i_ring in range(1, num_rings):
-        radius = np.sqrt(i_ring) * dr / factor
-        angle = phi * i_ring
-        x = radius * np.cos(angle)
-        y = radius * np.sin(angle) * dr_aspect
-
-        if (abs(x - (y / dr_aspect) / tilt_tan) <= half_x) and (abs(y) <= half_y):
-            x_points.append(x_start + x)
-            y_points.append(y_start + y)
-
-    cyc = cycler(x_motor, x_points)
-    cyc += cycler(y_motor, y_points)
-    return cyc
+    i_ring = np.arange(1, max(num_rings, 1))
+    radius = np.sqrt(i_ring) * dr / factor
+    angle = phi * i_ring
+    x = radius * np.cos(angle)
+    y = radius * np.sin(angle) * dr_aspect
+    keep = (np.abs(x - (y / dr_aspect) / tilt_tan) <= half_x) & (np.abs(y) <= half_y)
+
+    spec = {
+        "pattern": "spiral_fermat",
+        "args": {
+            "x_start": x_start,
+            "y_start": y_start,
+            "x_range": x_range,
+            "y_range": y_range,
+            "dr": dr,
+            "factor": factor,
+            "dr_y": dr_y,
+            "tilt": tilt,
+        },
+    }
+    return Trajectory({x_motor: x_start + x[keep], y_motor: y_start + y[keep]}, spec=spec)
 
 
 def inner_list_product(args):
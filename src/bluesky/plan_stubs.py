@@ -168,6 +168,34 @@ def read(obj: Readable) -> MsgGenerator[Reading]:
     return (yield Msg("read", obj))
 
 
+@plan
+def read_many(*objs: Readable) -> MsgGenerator[list[Reading]]:
+    """
+    Read several objects concurrently and add the readings to the current
+    bundle of readings.
+
+    Parameters
+    ----------
+    objs : Device or Signal
+        obj1, obj2, obj3, ...
+
+    Yields
+    ------
+    msg : Msg
+        Msg('read_many', None, obj1, ..., objn)
+
+    Returns
+    -------
+    readings :
+        list of Reading objects, in the order the objects were given
+
+    See Also
+    --------
+    :func:`bluesky.plan_stubs.read`
+    """
+    return (yield Msg("read_many", None, *objs))
+
+
 @typing.overload
 def locate(obj: Locatable, squeeze: Literal[True] = True) -> Location: ...  # type: ignore[overload-overlap]
 @typing.overload
@@ -301,6 +329,58 @@ def abs_set(
     return ret
 
 
+@plan
+def set_many(
+    *args: Union[Movable, Any],
+    group: Optional[Hashable] = None,
+    wait: bool = False,
+) -> MsgGenerator[Status]:
+    """
+    Set several devices at once, getting back one status for all of them.
+
+    Unlike a series of 'set' messages, the RunEngine handles all of the
+    setpoints in one message and tracks them with a single
+    :class:`~bluesky.utils.AggregateStatus`. Devices still moving to the same
+    value because of an earlier 'set_many' are not set again; the move in
+    progress is tracked instead.
+
+    Parameters
+    ----------
+    args :
+        device1, value1, device2, value2, ...
+    group : string (or any hashable object), optional
+        identifier used by 'wait'
+    wait : boolean, optional
+        If True, wait for completion before processing any more messages.
+        False by default.
+
+    Yields
+    ------
+    msg : Msg
+        Msg('set_many', None, device1, value1, ..., group=group)
+
+    Returns
+    -------
+    status :
+        AggregateStatus that completes when all of the devices are set. If
+        `wait` is True, this will always be complete by the time it is
+        returned.
+
+    See Also
+    --------
+    :func:`bluesky.plan_stubs.abs_set`
+    :func:`bluesky.plan_stubs.mv`
+    """
+    if len(args) % 2:
+        raise ValueError("set_many expects pairs of devices and values")
+    if wait and group is None:
+        group = str(uuid.uuid4())
+    ret = yield Msg("set_many", None, *args, group=group)
+    if wait:
+        yield Msg("wait", None, group=group)
+    return ret
+
+
 @plan
 def rel_set(
     obj: Movable,
@@ -1010,7 +1090,9 @@ def collect(
 
 
 @plan
-def collect_while_completing(flyers, dets, flush_period=None, stream_name=None, watch: Sequence[str] = ()):
+def collect_while_completing(
+    flyers, dets, flush_period=None, stream_name=None, watch: Sequence[str] = (), return_payload: bool = True
+):
     """
     Collect data from one or more fly-scanning devices and emit documents, then collect and emit
     data from one or more Collectable detectors until all are done.
@@ -1028,6 +1110,10 @@ def collect_while_completing(flyers, dets, flush_period=None, stream_name=None,
         on all streams.
     watch: set of watch groups, optional
         Additional groups to monitor while collecting from flyers.
+    return_payload: boolean, optional
+        Passed to each 'collect' message. If False, the collected data is only
+        emitted as documents, not also returned to the plan, which keeps
+        long scans from accumulating it. True by default.
     Yields
     ------
     msg : Msg
@@ -1043,7 +1129,7 @@ def collect_while_completing(flyers, dets, flush_period=None, stream_name=None,
     done = False
     while not done:
         done = yield from wait(group=group, timeout=flush_period, error_on_timeout=False, watch=watch)
-        yield from collect(*dets, name=stream_name)
+        yield from collect(*dets, name=stream_name, return_payload=return_payload)
 
 
 @plan
@@ -1130,6 +1216,7 @@ def stage(
 def stage_all(
     *args: Stageable,
     group: Optional[Hashable] = None,
+    concurrent: bool = False,
 ) -> MsgGenerator[None]:
     """
     'Stage' one or more devices (i.e., prepare them for use, 'arm' them).
@@ -1140,6 +1227,10 @@ def stage_all(
         device1, device2, device3, ...
     group : string (or any hashable object), optional
         identifier used by 'wait'; None by default
+    concurrent : boolean, optional
+        If True, stage the devices concurrently with a single 'stage_all'
+        message (parents are still staged before their children) instead of
+        one 'stage' message per device. False by default.
 
     Yields
     ------
@@ -1151,12 +1242,16 @@ def stage_all(
     :func:`bluesky.plan_stubs.unstage_all`
     """
     group = group or str(uuid.uuid4())
-    status_objects = []
+    status_objects: list[Status] = []
 
-    for obj in args:
-        ret = yield Msg("stage", obj, group=group)
-        if isinstance(ret, Status):
-            status_objects.append(ret)
+    if concurrent:
+        rets = yield Msg("stage_all", None, *args, group=group)
+        status_objects.extend(ret for ret in rets or () if isinstance(ret, Status))
+    else:
+        for obj in args:
+            ret = yield Msg("stage", obj, group=group)
+            if isinstance(ret, Status):
+                status_objects.append(ret)
 
     if status_objects:
         yield Msg("wait", None, group=group)
@@ -1212,7 +1307,9 @@ def unstage(
 
 
 @plan
-def unstage_all(*args: Stageable, group: Optional[Hashable] = None) -> MsgGenerator[None]:
+def unstage_all(
+    *args: Stageable, group: Optional[Hashable] = None, concurrent: bool = False
+) -> MsgGenerator[None]:
     """
     'Unstage' one or more devices (i.e., put them in standby, 'disarm' them).
 
@@ -1222,6 +1319,10 @@ def unstage_all(*args: Stageable, group: Optional[Hashable] = None) -> MsgGenera
         device1, device2, device3, ...
     group : string (or any hashable object), optional
         identifier used by 'wait'; None by default
+    concurrent : boolean, optional
+        If True, unstage the devices concurrently with a single 'unstage_all'
+        message (children are still unstaged before their parents) instead of
+        one 'unstage' message per device. False by default.
 
     Yields
     ------
@@ -1233,12 +1334,16 @@ def unstage_all(*args: Stageable, group: Optional[Hashable] = None) -> MsgGenera
     :func:`bluesky.plan_stubs.stage_all`
     """
     group = group or str(uuid.uuid4())
-    status_objects = []
+    status_objects: list[Status] = []
 
-    for obj in args:
-        ret = yield Msg("unstage", obj, group=group)
-        if isinstance(ret, Status):
-            status_objects.append(ret)
+    if concurrent:
+        rets = yield Msg("unstage_all", None, *args, group=group)
+        status_objects.extend(ret for ret in rets or () if isinstance(ret, Status))
+    else:
+        for obj in args:
+            ret = yield Msg("unstage", obj, group=group)
+            if isinstance(ret, Status):
+                status_objects.append(ret)
 
     if status_objects:
         yield Msg("wait", None, group=group)
@@ -1420,7 +1525,9 @@ def wait_for(futures: Iterable[Callable[[], Awaitable[Any]]], **kwargs) -> MsgGe
 
 
 @plan
-def trigger_and_read(devices: Sequence[Readable], name: str = "primary") -> MsgGenerator[Mapping[str, Reading]]:
+def trigger_and_read(
+    devices: Sequence[Readable], name: str = "primary", *, concurrent_reads: bool = False
+) -> MsgGenerator[Mapping[str, Reading]]:
     """
     Trigger and read a list of detectors and bundle readings into one Event.
 
@@ -1431,6 +1538,9 @@ def trigger_and_read(devices: Sequence[Readable], name: str = "primary") -> MsgG
     name : string, optional
         event stream name, a convenient human-friendly identifier; default
         name is 'primary'
+    concurrent_reads : bool, optional
+        If True, read all the devices concurrently with a single 'read_many'
+        message instead of one 'read' message per device. False by default.
 
     Returns
     -------
@@ -1464,8 +1574,13 @@ def trigger_and_read(devices: Sequence[Readable], name: str = "primary") -> MsgG
 
         def read_plan():
             ret = {}  # collect and return readings to give plan access to them
-            for obj in devices:
-                reading = yield from read(obj)
+            if concurrent_reads:
+                readings = yield from read_many(*devices)
+            else:
+                readings = []
+                for obj in devices:
+                    readings.append((yield from read(obj)))
+            for reading in readings or ():
                 if reading is not None:
                     ret.update(reading)
             return ret
@@ -1675,7 +1790,9 @@ def one_1d_step(
 
 
 @plan
-def move_per_step(step: Mapping[Movable, Any], pos_cache: dict[Movable, Any]) -> MsgGenerator[None]:
+def move_per_step(
+    step: Mapping[Movable, Any], pos_cache: dict[Movable, Any], *, concurrent: bool = False
+) -> MsgGenerator[None]:
     """
     Inner loop of an N-dimensional step scan without any readings
 
@@ -1687,6 +1804,9 @@ def move_per_step(step: Mapping[Movable, Any], pos_cache: dict[Movable, Any]) ->
         mapping motors to positions in this step
     pos_cache : dict
         mapping motors to their last-set positions
+    concurrent : boolean, optional
+        If True, move the motors with a single 'set_many' message instead of
+        one 'set' message per motor. False by default.
 
     Yields
     ------
@@ -1694,12 +1814,19 @@ def move_per_step(step: Mapping[Movable, Any], pos_cache: dict[Movable, Any]) ->
     """
     yield Msg("checkpoint")
     grp = _short_uid("set")
+    moves = []
     for motor, pos in step.items():
         if pos == pos_cache[motor]:
             # This step does not move this motor.
             continue
-        yield Msg("set", motor, pos, group=grp)
+        moves.append((motor, pos))
         pos_cache[motor] = pos
+    if concurrent:
+        if moves:
+            yield Msg("set_many", None, *itertools.chain.from_iterable(moves), group=grp)
+    else:
+        for motor, pos in moves:
+            yield Msg("set", motor, pos, group=grp)
     yield Msg("wait", None, group=grp)
 
 
@@ -1709,6 +1836,8 @@ def one_nd_step(
     step: Mapping[Movable, Any],
     pos_cache: dict[Movable, Any],
     take_reading: Optional[TakeReading] = None,
+    *,
+    concurrent: bool = False,
 ) -> MsgGenerator[None]:
     """
     Inner loop of an N-dimensional step scan
@@ -1732,6 +1861,9 @@ def one_nd_step(
         Callable[List[OphydObj], Optional[str]] -> Generator[Msg], optional
 
         Defaults to `trigger_and_read`
+    concurrent : boolean, optional
+        If True, move the motors with a single 'set_many' message. See
+        :func:`move_per_step`. False by default.
 
     Yields
     ------
@@ -1739,7 +1871,7 @@ def one_nd_step(
     """
     take_reading = trigger_and_read if take_reading is None else take_reading
     motors = step.keys()
-    yield from move_per_step(step, pos_cache)
+    yield from move_per_step(step, pos_cache, concurrent=concurrent)
     yield from take_reading(list(detectors) + list(motors))  # type: ignore  # Movable issue
 
 
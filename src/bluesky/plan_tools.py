@@ -43,7 +43,7 @@ def print_summary_wrapper(plan):
     yield from _bs.print_summary_wrapper(plan)
 
 
-def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2):
+def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2, label_points=False):
     """Plot the raster path for this plan
 
     Parameters
@@ -62,9 +62,15 @@ def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2):
 
     lw : float, optional
         Width of lines drawn between points
+
+    label_points : bool, optional
+        If True, label each point with its index in the order the points were
+        given to the plan (see :func:`bluesky.simulators.plot_raster_path`)
     """
     warn(
         "The bluesky.plan_tools module is deprecated. Use bluesky.simulators instead.",
         stacklevel=1,
     )
-    return _bs.plot_raster_path(plan, x_motor, y_motor, ax=ax, probe_size=probe_size, lw=lw)
+    return _bs.plot_raster_path(
+        plan, x_motor, y_motor, ax=ax, probe_size=probe_size, lw=lw, label_points=label_points
+    )
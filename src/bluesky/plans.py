@@ -21,12 +21,13 @@ except ImportError:
 from . import plan_patterns, utils
 from . import plan_stubs as bps
 from . import preprocessors as bpp
-from .protocols import Flyable, Movable, NamedMovable, Readable
+from .protocols import Collectable, Flyable, Movable, NamedMovable, Preparable, Readable
 from .utils import (
     CustomPlanMetadata,
     Msg,
     MsgGenerator,
     ScalarOrIterableFloat,
+    device_repr,
     get_hinted_fields,
 )
 
@@ -55,6 +56,16 @@ def _check_detectors_type_input(detectors):
         raise TypeError("The input argument must be either as a list or a tuple of Readable objects.")
 
 
+def _optimize_point_order(cyc: Cycler, optimize_path: Union[bool, Mapping], md: dict) -> plan_patterns.Trajectory:
+    # Reorder the points of `cyc` to reduce the time spent moving, recording
+    # the order in md["point_order"] so that the data can be re-sorted.
+    traj = plan_patterns.Trajectory.from_cycler(cyc)
+    velocities = optimize_path if isinstance(optimize_path, Mapping) else None
+    order = plan_patterns.optimize_path(traj.by_key(), velocities)
+    md["point_order"] = order.tolist()
+    return traj.take(order)
+
+
 def derive_default_hints(motors: list[Any]) -> dict[str, Sequence]:
     x_fields = [field for motor in motors for field in get_hinted_fields(motor)]
 
@@ -108,7 +119,7 @@ def count(
         "detectors": [det.name for det in detectors],
         "num_points": num,
         "num_intervals": num_intervals,
-        "plan_args": {"detectors": list(map(repr, detectors)), "num": num, "delay": delay},
+        "plan_args": {"detectors": list(map(device_repr, detectors)), "num": num, "delay": delay},
         "plan_name": "count",
         "hints": {},
     }
@@ -133,6 +144,7 @@ def list_scan(
     detectors: Sequence[Readable],
     *args: tuple[Union[Movable, Any], list[Any]],
     per_step: Optional[PerStep] = None,
+    optimize_path: Union[bool, Mapping] = False,
     md: Optional[CustomPlanMetadata] = None,
 ) -> MsgGenerator[str]:
     """
@@ -159,6 +171,13 @@ def list_scan(
         hook for customizing action of inner loop (messages per step)
         Expected signature:
         ``f(detectors, motor, step) -> plan (a generator)``
+    optimize_path : bool or dict, optional
+        If truthy, visit the points in an order that reduces the time spent
+        moving (see :func:`bluesky.plan_patterns.optimize_path`) and record
+        the order in the 'point_order' metadata: the i-th event is at the
+        ``point_order[i]``-th point as given. A dict maps motors to their
+        velocities, which weight the time to move between points.
+        False by default.
     md : dict, optional
         metadata
 
@@ -193,7 +212,7 @@ def list_scan(
             f"The lengths of all lists in *args must be the same. However the lengths in args are : {lengths}"
         )
 
-    md_args = list(chain(*((repr(motor), pos_list) for motor, pos_list in partition(2, args))))
+    md_args = list(chain(*((device_repr(motor), pos_list) for motor, pos_list in partition(2, args))))
     motor_names = list(lengths.keys())
 
     num_intervals: int = (length or 1) - 1
@@ -202,7 +221,7 @@ def list_scan(
         "motors": motor_names,
         "num_points": length,
         "num_intervals": num_intervals,
-        "plan_args": {"detectors": list(map(repr, detectors)), "args": md_args, "per_step": repr(per_step)},
+        "plan_args": {"detectors": list(map(device_repr, detectors)), "args": md_args, "per_step": repr(per_step)},
         "plan_name": "list_scan",
         "plan_pattern": "inner_list_product",
         "plan_pattern_module": plan_patterns.__name__,
@@ -218,6 +237,8 @@ def list_scan(
     _md["hints"].update(md.get("hints", {}))
 
     full_cycler = plan_patterns.inner_list_product(args)
+    if optimize_path:
+        full_cycler = _optimize_point_order(full_cycler, optimize_path, _md)
 
     return (yield from scan_nd(detectors, full_cycler, per_step=per_step, md=_md))
 
@@ -226,6 +247,7 @@ def rel_list_scan(
     detectors: Sequence[Readable],
     *args: Union[Movable, Any],
     per_step: Optional[PerStep] = None,
+    optimize_path: Union[bool, Mapping] = False,
     md: Optional[CustomPlanMetadata] = None,
 ) -> MsgGenerator[str]:
     """
@@ -256,6 +278,13 @@ def rel_list_scan(
     per_step : callable, optional
         hook for customizing action of inner loop (messages per step)
         Expected signature: ``f(detectors, motor, step)``
+    optimize_path : bool or dict, optional
+        If truthy, visit the points in an order that reduces the time spent
+        moving (see :func:`bluesky.plan_patterns.optimize_path`) and record
+        the order in the 'point_order' metadata: the i-th event is at the
+        ``point_order[i]``-th point as given. A dict maps motors to their
+        velocities, which weight the time to move between points.
+        False by default.
     md : dict, optional
         metadata
 
@@ -274,7 +303,7 @@ def rel_list_scan(
     @bpp.reset_positions_decorator(motors)
     @bpp.relative_set_decorator(motors)
     def inner_relative_list_scan():
-        return (yield from list_scan(detectors, *args, per_step=per_step, md=_md))
+        return (yield from list_scan(detectors, *args, per_step=per_step, optimize_path=optimize_path, md=_md))
 
     return (yield from inner_relative_list_scan())
 
@@ -284,6 +313,7 @@ def list_grid_scan(
     *args: Union[Movable, Any],
     snake_axes: bool = False,
     per_step: Optional[PerStep] = None,
+    optimize_path: Union[bool, Mapping] = False,
     md: Optional[CustomPlanMetadata] = None,
 ) -> MsgGenerator[str]:
     """
@@ -314,6 +344,13 @@ def list_grid_scan(
         hook for customizing action of inner loop (messages per step).
         See docstring of :func:`bluesky.plan_stubs.one_nd_step` (the default)
         for details.
+    optimize_path: bool or dict, optional
+        If truthy, visit the points in an order that reduces the time spent
+        moving (see :func:`bluesky.plan_patterns.optimize_path`) and record
+        the order in the 'point_order' metadata: the i-th event is at the
+        ``point_order[i]``-th point as given. A dict maps motors to their
+        velocities, which weight the time to move between points.
+        False by default.
     md: dict, optional
         metadata
 
@@ -330,14 +367,14 @@ def list_grid_scan(
     motor_names = []
     motors = []
     for i, (motor, pos_list) in enumerate(partition(2, args)):  # noqa: B007
-        md_args.extend([repr(motor), pos_list])
+        md_args.extend([device_repr(motor), pos_list])
         motor_names.append(motor.name)
         motors.append(motor)
     _md = {
         "shape": tuple(len(pos_list) for motor, pos_list in partition(2, args)),
         "extents": tuple([min(pos_list), max(pos_list)] for motor, pos_list in partition(2, args)),
         "snake_axes": repr(snake_axes),
-        "plan_args": {"detectors": list(map(repr, detectors)), "args": md_args, "per_step": repr(per_step)},
+        "plan_args": {"detectors": list(map(device_repr, detectors)), "args": md_args, "per_step": repr(per_step)},
         "plan_name": "list_grid_scan",
         "plan_pattern": "outer_list_product",
         "plan_pattern_args": dict(args=md_args, snake_axes=repr(snake_axes)),  # noqa: C408
@@ -352,6 +389,8 @@ def list_grid_scan(
         _md["hints"].setdefault("dimensions", motor_hints)
     except (AttributeError, KeyError):
         ...
+    if optimize_path:
+        full_cycler = _optimize_point_order(full_cycler, optimize_path, _md)
 
     return (yield from scan_nd(detectors, full_cycler, per_step=per_step, md=_md))
 
@@ -361,6 +400,7 @@ def rel_list_grid_scan(
     *args: Union[Movable, Any],
     snake_axes: bool = False,
     per_step: Optional[PerStep] = None,
+    optimize_path: Union[bool, Mapping] = False,
     md: Optional[CustomPlanMetadata] = None,
 ) -> MsgGenerator[str]:
     """
@@ -395,6 +435,13 @@ def rel_list_grid_scan(
         hook for customizing action of inner loop (messages per step).
         See docstring of :func:`bluesky.plan_stubs.one_nd_step` (the default)
         for details.
+    optimize_path : bool or dict, optional
+        If truthy, visit the points in an order that reduces the time spent
+        moving (see :func:`bluesky.plan_patterns.optimize_path`) and record
+        the order in the 'point_order' metadata: the i-th event is at the
+        ``point_order[i]``-th point as given. A dict maps motors to their
+        velocities, which weight the time to move between points.
+        False by default.
     md : dict, optional
         metadata
 
@@ -413,7 +460,11 @@ def rel_list_grid_scan(
     @bpp.reset_positions_decorator(motors)
     @bpp.relative_set_decorator(motors)
     def inner_relative_list_grid_scan():
-        return (yield from list_grid_scan(detectors, *args, snake_axes=snake_axes, per_step=per_step, md=_md))
+        return (
+            yield from list_grid_scan(
+                detectors, *args, snake_axes=snake_axes, per_step=per_step, optimize_path=optimize_path, md=_md
+            )
+        )
 
     return (yield from inner_relative_list_grid_scan())
 
@@ -460,9 +511,9 @@ def _scan_1d(
         "num_points": num,
         "num_intervals": num - 1,
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
+            "detectors": list(map(device_repr, detectors)),
             "num": num,
-            "motor": repr(motor),
+            "motor": device_repr(motor),
             "start": start,
             "stop": stop,
             "per_step": repr(per_step),
@@ -584,11 +635,11 @@ def log_scan(
         "num_points": num,
         "num_intervals": num - 1,
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
+            "detectors": list(map(device_repr, detectors)),
             "num": num,
             "start": start,
             "stop": stop,
-            "motor": repr(motor),
+            "motor": device_repr(motor),
             "per_step": repr(per_step),
         },
         "plan_name": "log_scan",
@@ -724,8 +775,8 @@ def adaptive_scan(
         "detectors": [det.name for det in detectors],
         "motors": [motor.name],
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
-            "motor": repr(motor),
+            "detectors": list(map(device_repr, detectors)),
+            "motor": device_repr(motor),
             "start": start,
             "stop": stop,
             "min_step": min_step,
@@ -870,6 +921,248 @@ def rel_adaptive_scan(
     return (yield from inner_relative_adaptive_scan())
 
 
+def batch_adaptive_scan(
+    detectors: Sequence[Readable],
+    target_field: str,
+    motor: NamedMovable,
+    start: float,
+    stop: float,
+    min_step: float,
+    max_step: float,
+    *,
+    num_initial: int = 5,
+    batch_size: int = 4,
+    tolerance: float = 0.01,
+    focus: str = "shape",
+    max_points: Optional[int] = None,
+    md: Optional[CustomPlanMetadata] = None,
+) -> MsgGenerator[str]:
+    """
+    Scan over one variable, refining where a local model of the data is worst.
+
+    After ``num_initial`` evenly spaced points from start to stop, each round
+    fits quadratics through neighboring points and measures a batch of up to
+    ``batch_size`` new points where they predict that linear interpolation is
+    least accurate (see :func:`bluesky.plan_patterns.refine_points`). Each
+    batch is measured in one sweep, starting from the end nearest the motor.
+    The scan ends when no interval needs refining or ``max_points`` points
+    have been taken.
+
+    Batching saves model fits and motor travel, not per-move overhead: every
+    point is still its own move followed by its own trigger and read, as in
+    :func:`adaptive_scan`. The points saved come from placing them where the
+    data needs them.
+
+    With ``focus='peak'``, the refinement concentrates on the maximum of
+    ``target_field`` and, at the end, the motor is moved to the vertex of the
+    parabola through the highest point and its neighbors.
+
+    Parameters
+    ----------
+    detectors : list or tuple
+        list of 'readable' objects
+    target_field : string
+        data field whose output is the focus of the adaptive tuning
+    motor : object
+        any 'settable' object (motor, temp controller, etc.)
+    start : float
+        starting position of motor
+    stop : float
+        ending position of motor
+    min_step : float
+        smallest distance between points
+    max_step : float
+        largest distance between points
+    num_initial : int, optional
+        number of evenly spaced points in the first pass, default is 5
+    batch_size : int, optional
+        largest number of points measured per round, default is 4
+    tolerance : float, optional
+        acceptable interpolation error, relative to the range of
+        ``target_field``, default is 0.01
+    focus : {'shape', 'peak'}, optional
+        refine the whole curve ('shape', the default) or the maximum ('peak')
+    max_points : int, optional
+        stop after this many points
+    md : dict, optional
+        metadata
+
+    See Also
+    --------
+    :func:`bluesky.plans.adaptive_scan`
+    :func:`bluesky.plans.tune_centroid`
+    :func:`bluesky.plans.rel_batch_adaptive_scan`
+    """
+    _check_detectors_type_input(detectors)
+    if not 0 < min_step < max_step:
+        raise ValueError("min_step and max_step must meet condition of max_step > min_step > 0")
+    if num_initial < 3:
+        raise ValueError("num_initial must be at least 3")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if focus not in ("shape", "peak"):
+        raise ValueError(f"focus must be 'shape' or 'peak', not {focus!r}")
+
+    _md = {
+        "detectors": [det.name for det in detectors],
+        "motors": [motor.name],
+        "plan_args": {
+            "detectors": list(map(device_repr, detectors)),
+            "motor": device_repr(motor),
+            "start": start,
+            "stop": stop,
+            "min_step": min_step,
+            "max_step": max_step,
+            "num_initial": num_initial,
+            "batch_size": batch_size,
+            "tolerance": tolerance,
+            "focus": focus,
+            "max_points": max_points,
+        },
+        "plan_name": "batch_adaptive_scan",
+        "hints": {},
+    }
+    _md.update(md or {})
+    try:
+        dimensions = [(motor.hints["fields"], "primary")]
+    except (AttributeError, KeyError):
+        pass
+    else:
+        _md["hints"].setdefault("dimensions", dimensions)  # type: ignore
+
+    @bpp.stage_decorator(list(detectors) + [motor])
+    @bpp.run_decorator(md=_md)
+    def batch_adaptive_core():
+        positions: list[float] = []
+        values: list[float] = []
+        devices = tuple(utils.separate_devices(list(detectors) + [motor]))
+        if os.environ.get("BLUESKY_PREDECLARE", False):
+            yield from bps.declare_stream(*devices, name="primary")
+        batch = np.linspace(start, stop, num_initial)
+        while len(batch):
+            for pos in batch:
+                yield Msg("checkpoint")
+                yield from bps.mv(motor, pos)
+                ret = yield from bps.trigger_and_read(devices)
+                # Model the setpoints, so that relative_set_wrapper applies.
+                positions.append(pos)
+                values.append(ret[target_field]["value"] if ret else 0.0)
+            num = batch_size if max_points is None else min(batch_size, max_points - len(positions))
+            if num <= 0:
+                break
+            batch = plan_patterns.refine_points(
+                positions,
+                values,
+                num=num,
+                min_step=min_step,
+                max_step=max_step,
+                tolerance=tolerance,
+                focus=focus,
+            )
+            # Start each sweep from the end nearest the motor.
+            if len(batch) and abs(batch[-1] - positions[-1]) < abs(batch[0] - positions[-1]):
+                batch = batch[::-1]
+        if focus == "peak" and positions:
+            yield from bps.mv(motor, _parabolic_peak(positions, values))
+
+    return (yield from batch_adaptive_core())
+
+
+def _parabolic_peak(positions, values) -> float:
+    # The vertex of the parabola through the highest point and its neighbors,
+    # or the highest point itself if it is at the edge of the data.
+    x = np.asarray(positions, dtype=float)
+    y = np.asarray(values, dtype=float)
+    order = np.argsort(x)
+    x, y = x[order], y[order]
+    i = int(np.argmax(y))
+    if i == 0 or i == len(x) - 1:
+        return float(x[i])
+    a, b, _ = np.polyfit(x[i - 1 : i + 2], y[i - 1 : i + 2], 2)
+    if a >= 0:
+        return float(x[i])
+    return float(np.clip(-b / (2 * a), x[i - 1], x[i + 1]))
+
+
+def rel_batch_adaptive_scan(
+    detectors: Sequence[Readable],
+    target_field: str,
+    motor: NamedMovable,
+    start: float,
+    stop: float,
+    min_step: float,
+    max_step: float,
+    *,
+    num_initial: int = 5,
+    batch_size: int = 4,
+    tolerance: float = 0.01,
+    focus: str = "shape",
+    max_points: Optional[int] = None,
+    md: Optional[CustomPlanMetadata] = None,
+) -> MsgGenerator[str]:
+    """
+    Relative scan over one variable, refining where a model of the data is worst.
+
+    With ``focus='peak'`` the motor is left at the peak found; otherwise it
+    is returned to its initial position.
+
+    Parameters
+    ----------
+    detectors : list or tuple
+        list of 'readable' objects
+    target_field : string
+        data field whose output is the focus of the adaptive tuning
+    motor : object
+        any 'settable' object (motor, temp controller, etc.)
+    start : float
+        starting position of motor, relative to the current position.
+    stop : float
+        ending position of motor, relative to the current position.
+    min_step : float
+        smallest distance between points
+    max_step : float
+        largest distance between points
+    num_initial : int, optional
+        number of evenly spaced points in the first pass, default is 5
+    batch_size : int, optional
+        largest number of points measured per round, default is 4
+    tolerance : float, optional
+        acceptable interpolation error, relative to the range of
+        ``target_field``, default is 0.01
+    focus : {'shape', 'peak'}, optional
+        refine the whole curve ('shape', the default) or the maximum ('peak')
+    max_points : int, optional
+        stop after this many points
+    md : dict, optional
+        metadata
+
+    See Also
+    --------
+    :func:`bluesky.plans.batch_adaptive_scan`
+    """
+    _md = {"plan_name": "rel_batch_adaptive_scan"}
+    _md.update(md or {})
+    plan = batch_adaptive_scan(
+        detectors,
+        target_field,
+        motor,
+        start,
+        stop,
+        min_step,
+        max_step,
+        num_initial=num_initial,
+        batch_size=batch_size,
+        tolerance=tolerance,
+        focus=focus,
+        max_points=max_points,
+        md=_md,
+    )
+    plan = bpp.relative_set_wrapper(plan, [motor])
+    if focus != "peak":
+        plan = bpp.reset_positions_wrapper(plan, [motor])
+    return (yield from plan)
+
+
 def tune_centroid(
     detectors: Sequence[Readable],
     signal: str,
@@ -954,8 +1247,8 @@ def tune_centroid(
         "detectors": [det.name for det in detectors],
         "motors": [motor.name],
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
-            "motor": repr(motor),
+            "detectors": list(map(device_repr, detectors)),
+            "motor": device_repr(motor),
             "start": start,
             "stop": stop,
             "num": num,
@@ -1025,7 +1318,7 @@ def tune_centroid(
 
 def scan_nd(
     detectors: Sequence[Readable],
-    cycler: Cycler,
+    cycler: Union[Cycler, plan_patterns.Trajectory],
     *,
     per_step: Optional[PerStep] = None,
     md: Optional[CustomPlanMetadata] = None,
@@ -1036,8 +1329,12 @@ def scan_nd(
     Parameters
     ----------
     detectors : list or tuple
-    cycler : Cycler
-        cycler.Cycler object mapping movable interfaces to positions
+    cycler : Cycler or Trajectory
+        cycler.Cycler object mapping movable interfaces to positions, or a
+        :class:`bluesky.plan_patterns.Trajectory`, which is more compact for
+        long trajectories and is recorded in the metadata by its
+        :meth:`~bluesky.plan_patterns.Trajectory.describe` (spec, shape,
+        bounds and hash) instead of its repr
     per_step : callable, optional
         hook for customizing action of inner loop (messages per step).
         See docstring of :func:`bluesky.plan_stubs.one_nd_step` (the default)
@@ -1057,14 +1354,21 @@ def scan_nd(
     >>> scan_nd([sensor], cy)
     """
     _check_detectors_type_input(detectors)
+    if isinstance(cycler, plan_patterns.Trajectory):
+        # The repr of a long trajectory would be huge; describe it compactly.
+        num_points = cycler.num_points
+        cycler_md = cycler.describe()
+    else:
+        num_points = len(cycler)
+        cycler_md = repr(cycler)
     _md = {
         "detectors": [det.name for det in detectors],
         "motors": [motor.name for motor in cycler.keys],
-        "num_points": len(cycler),
-        "num_intervals": len(cycler) - 1,
+        "num_points": num_points,
+        "num_intervals": num_points - 1,
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
-            "cycler": repr(cycler),
+            "detectors": list(map(device_repr, detectors)),
+            "cycler": cycler_md,
             "per_step": repr(per_step),
         },
         "plan_name": "scan_nd",
@@ -1162,7 +1466,8 @@ def scan_nd(
     def inner_scan_nd():
         if predeclare:
             yield from bps.declare_stream(*motors, *detectors, name="primary")
-        for step in list(cycler):
+        # Produce the points one at a time rather than building a list.
+        for step in cycler:
             yield from per_step(detectors, step, pos_cache)
 
     return (yield from inner_scan_nd())
@@ -1246,12 +1551,12 @@ def scan(
             f"whole number. The given value was {num}."
         )
 
-    md_args = list(chain(*((repr(motor), start, stop) for motor, start, stop in partition(3, args))))
+    md_args = list(chain(*((device_repr(motor), start, stop) for motor, start, stop in partition(3, args))))
     motor_names = tuple(motor.name for motor, start, stop in partition(3, args))
     md = md or {}
     _md = {
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
+            "detectors": list(map(device_repr, detectors)),
             "num": num,
             "args": md_args,
             "per_step": repr(per_step),
@@ -1439,7 +1744,7 @@ def grid_scan(
     motor_names = []
     motors = []
     for i, (motor, start, stop, num, snake) in enumerate(chunk_args):
-        md_args.extend([repr(motor), start, stop, num])
+        md_args.extend([device_repr(motor), start, stop, num])
         if i > 0:
             # snake argument only shows up after the first motor
             md_args.append(snake)
@@ -1450,7 +1755,7 @@ def grid_scan(
         "extents": tuple([start, stop] for motor, start, stop, num, snake in chunk_args),
         "snaking": tuple(snake for motor, start, stop, num, snake in chunk_args),
         # 'num_points': inserted by scan_nd
-        "plan_args": {"detectors": list(map(repr, detectors)), "args": md_args, "per_step": repr(per_step)},
+        "plan_args": {"detectors": list(map(device_repr, detectors)), "args": md_args, "per_step": repr(per_step)},
         "plan_name": "grid_scan",
         "plan_pattern": "outer_product",
         "plan_pattern_args": dict(args=md_args),  # noqa: C408
@@ -1624,9 +1929,9 @@ def tweak(
         "detectors": [detector.name],
         "motors": [motor.name],
         "plan_args": {
-            "detector": repr(detector),
+            "detector": device_repr(detector),
             "target_field": target_field,
-            "motor": repr(motor),
+            "motor": device_repr(motor),
             "step": step,
         },
         "plan_name": "tweak",
@@ -1750,16 +2055,16 @@ def spiral_fermat(
         dr_y=dr_y,
         tilt=tilt,
     )
-    cyc = plan_patterns.spiral_fermat(**pattern_args)
+    cyc = plan_patterns.spiral_fermat_trajectory(**pattern_args)
 
     # Before including pattern_args in metadata, replace objects with reprs.
-    pattern_args["x_motor"] = repr(x_motor)
-    pattern_args["y_motor"] = repr(y_motor)
+    pattern_args["x_motor"] = device_repr(x_motor)
+    pattern_args["y_motor"] = device_repr(y_motor)
     _md = {
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
-            "x_motor": repr(x_motor),
-            "y_motor": repr(y_motor),
+            "detectors": list(map(device_repr, detectors)),
+            "x_motor": device_repr(x_motor),
+            "y_motor": device_repr(y_motor),
             "x_start": x_start,
             "y_start": y_start,
             "x_range": x_range,
@@ -1931,16 +2236,16 @@ def spiral(
         dr_y=dr_y,
         tilt=tilt,
     )
-    cyc = plan_patterns.spiral(**pattern_args)
+    cyc = plan_patterns.spiral_trajectory(**pattern_args)
 
     # Before including pattern_args in metadata, replace objects with reprs.
-    pattern_args["x_motor"] = repr(x_motor)
-    pattern_args["y_motor"] = repr(y_motor)
+    pattern_args["x_motor"] = device_repr(x_motor)
+    pattern_args["y_motor"] = device_repr(y_motor)
     _md = {
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
-            "x_motor": repr(x_motor),
-            "y_motor": repr(y_motor),
+            "detectors": list(map(device_repr, detectors)),
+            "x_motor": device_repr(x_motor),
+            "y_motor": device_repr(y_motor),
             "x_start": x_start,
             "y_start": y_start,
             "x_range": x_range,
@@ -2104,16 +2409,16 @@ def spiral_square(
         x_num=x_num,
         y_num=y_num,
     )
-    cyc = plan_patterns.spiral_square_pattern(**pattern_args)
+    cyc = plan_patterns.spiral_square_trajectory(**pattern_args)
 
     # Before including pattern_args in metadata, replace objects with reprs.
-    pattern_args["x_motor"] = repr(x_motor)
-    pattern_args["y_motor"] = repr(y_motor)
+    pattern_args["x_motor"] = device_repr(x_motor)
+    pattern_args["y_motor"] = device_repr(y_motor)
     _md = {
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
-            "x_motor": repr(x_motor),
-            "y_motor": repr(y_motor),
+            "detectors": list(map(device_repr, detectors)),
+            "x_motor": device_repr(x_motor),
+            "y_motor": device_repr(y_motor),
             "x_center": x_center,
             "y_center": y_center,
             "x_range": x_range,
@@ -2338,6 +2643,124 @@ def fly(
     return uid
 
 
+def fly_scan_nd(
+    detectors: Sequence[Any],
+    cycler: Union[Cycler, plan_patterns.Trajectory],
+    *,
+    detector_prepare_value: Any = None,
+    flush_period: Optional[float] = 1.0,
+    stream_name: str = "primary",
+    fallback: bool = True,
+    md: Optional[CustomPlanMetadata] = None,
+) -> MsgGenerator[str]:
+    """
+    Fly (continuously move) over an arbitrary N-dimensional trajectory.
+
+    Each motor is prepared with its full array of positions and each detector
+    with ``detector_prepare_value``; then all of them are kicked off together
+    and the detectors are collected every ``flush_period`` seconds until
+    every device reports completion.
+
+    If any motor is not Preparable and Flyable, or any detector is not
+    Preparable, Flyable and Collectable, the same trajectory is step-scanned
+    with :func:`scan_nd` instead (unless ``fallback`` is False).
+
+    Parameters
+    ----------
+    detectors : list or tuple
+        Preparable, Flyable and Collectable detectors. In fly mode they are
+        expected to record any positions needed to interpret the data, e.g.
+        from hardware-captured encoders.
+    cycler : Cycler or Trajectory
+        mapping of motors to positions, as for :func:`scan_nd`
+    detector_prepare_value : optional
+        passed to ``prepare()`` on each detector; by default, the number of
+        points in the trajectory
+    flush_period : float, optional
+        seconds between collections while the devices are flying; this bounds
+        how much data accumulates into each page of Events. If None, collect
+        only once all devices have completed.
+    stream_name : str, optional
+        name of the stream the detectors are collected into, 'primary' by
+        default
+    fallback : bool, optional
+        If True (default), step-scan when the devices cannot fly. If False,
+        raise a TypeError instead.
+    md : dict, optional
+        metadata
+
+    See Also
+    --------
+    :func:`bluesky.plans.fly`
+    :func:`bluesky.plans.scan_nd`
+    :func:`bluesky.plan_stubs.collect_while_completing`
+
+    Examples
+    --------
+    >>> from cycler import cycler
+    >>> fly_scan_nd([panda], cycler(stage_x, np.linspace(0, 1, 1000)))
+    """
+    _check_detectors_type_input(detectors)
+    motors = list(cycler.keys)
+    can_fly = all(isinstance(motor, Preparable) and isinstance(motor, Flyable) for motor in motors)
+    can_fly = can_fly and all(
+        isinstance(det, Preparable) and isinstance(det, Flyable) and isinstance(det, Collectable)
+        for det in detectors
+    )
+    _md: dict[str, Any] = {"plan_name": "fly_scan_nd", "scan_mode": "fly" if can_fly else "step"}
+    _md.update(md or {})
+    if not can_fly:
+        if not fallback:
+            raise TypeError(
+                "fly_scan_nd requires Preparable and Flyable motors, and Preparable, Flyable and "
+                "Collectable detectors. Pass fallback=True to step-scan instead."
+            )
+        return (yield from scan_nd(detectors, cycler, md=_md))
+
+    if isinstance(cycler, plan_patterns.Trajectory):
+        num_points = cycler.num_points
+        cycler_md = cycler.describe()
+    else:
+        num_points = len(cycler)
+        cycler_md = repr(cycler)
+    if detector_prepare_value is None:
+        detector_prepare_value = num_points
+    _md = {
+        "detectors": [det.name for det in detectors],
+        "motors": [motor.name for motor in motors],
+        "num_points": num_points,
+        "num_intervals": num_points - 1,
+        "plan_args": {
+            "detectors": list(map(device_repr, detectors)),
+            "cycler": cycler_md,
+            "detector_prepare_value": repr(detector_prepare_value),
+            "flush_period": flush_period,
+        },
+        "hints": {},
+        **_md,
+    }
+    positions = cycler.by_key()
+    flyers = [*motors, *detectors]
+
+    @bpp.stage_decorator(flyers)
+    @bpp.run_decorator(md=_md)
+    def inner_fly_scan_nd():
+        group = utils.short_uid("prepare")
+        for motor in motors:
+            yield from bps.prepare(motor, positions[motor], group=group)
+        for det in detectors:
+            yield from bps.prepare(det, detector_prepare_value, group=group)
+        yield from bps.wait(group=group)
+        yield from bps.declare_stream(*detectors, name=stream_name, collect=True)
+        yield from bps.kickoff_all(*flyers, wait=True)
+        # Emit what has been acquired so far without accumulating it here.
+        yield from bps.collect_while_completing(
+            flyers, detectors, flush_period=flush_period, stream_name=stream_name, return_payload=False
+        )
+
+    return (yield from inner_fly_scan_nd())
+
+
 def x2x_scan(
     detectors: Sequence[Readable],
     motor1: NamedMovable,
@@ -2382,7 +2805,7 @@ def x2x_scan(
     _md = {
         "plan_name": "x2x_scan",
         "plan_args": {
-            "detectors": list(map(repr, detectors)),
+            "detectors": list(map(device_repr, detectors)),
             "motor1": motor1.name,
             "motor2": motor2.name,
             "start": start,
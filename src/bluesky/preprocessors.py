@@ -73,30 +73,94 @@ def plan_mutator(plan, msg_proc):
     See Also
     --------
     :func:`bluesky.plans.msg_mutator`
+    :func:`bluesky.preprocessors.fused_plan_mutator`
     """
+    return (yield from _fused_plan_mutator(plan, (msg_proc,)))
+
+
+def fused_plan_mutator(plan, msg_procs):
+    """
+    Alter the contents of a plan with several message processors in one pass.
+
+    This is equivalent to nesting :func:`plan_mutator` once per function in
+    ``msg_procs`` --- the first one innermost --- but every message goes
+    through a single generator layer, no matter how many processors are
+    stacked.
+
+    Parameters
+    ----------
+    plan : generator
+        a generator that yields messages (`Msg` objects)
+    msg_procs : iterable of callables
+        Functions with the same signature and return value as the ``msg_proc``
+        argument of :func:`plan_mutator`. Messages yielded by ``plan`` are
+        passed to them in order. Messages inserted by one of them are passed
+        to that one again (except for the message it replaced, which passes
+        through it unaltered) and then to the ones after it, but never to the
+        ones before it, just as with nested :func:`plan_mutator` calls.
+
+    Yields
+    ------
+    msg : Msg
+        messages from `plan`, altered by `msg_procs`
+
+    See Also
+    --------
+    :func:`bluesky.preprocessors.plan_mutator`
+    """
+    return (yield from _fused_plan_mutator(plan, tuple(msg_procs)))
+
+
+def _fused_plan_mutator(plan, msg_procs):
     # internal stacks
-    msgs_seen = dict()  # noqa: C408
+    # Each generator on the stack is paired with the index of the first
+    # msg_proc its messages go through: 0 for the plan itself, k for
+    # generators returned by msg_procs[k].
     plan_stack = deque()
     result_stack = deque()
     tail_cache = dict()  # noqa: C408
     tail_result_cache = dict()  # noqa: C408
+    # For each msg_proc, the messages it is currently replacing, so that they
+    # pass through unaltered when its head generator yields them. Entries are
+    # dropped once the head and tail generators are done, so this does not
+    # grow with the length of the plan.
+    msgs_seen = [dict() for _ in msg_procs]  # noqa: C408
+    # {id(head or tail generator): (index of msg_proc, msg it replaces)}
+    replaced_msgs = dict()  # noqa: C408
     exception = None
+    ret = None
 
     parent_plan = plan
     ret_value = None
     # seed initial conditions
-    plan_stack.append(plan)
+    plan_stack.append((plan, 0))
     result_stack.append(None)
 
+    def retire(gen, run_tail=True):
+        # Forget about a generator that is done and return the tail generator
+        # to run after it (if any) together with its index.
+        tail_gen = tail_cache.pop(id(gen), None)
+        if not run_tail:
+            tail_gen = None
+        entry = replaced_msgs.pop(id(gen), None)
+        if entry is None:
+            return None, None
+        index, replaced = entry
+        if tail_gen is not None:
+            replaced_msgs[id(tail_gen)] = entry
+        else:
+            msgs_seen[index].pop(id(replaced), None)
+        return tail_gen, index
+
     while True:
         # get last result
         if exception is not None:
             # if we have a stashed exception, pass it along
             try:
-                msg = plan_stack[-1].throw(exception)
+                msg = plan_stack[-1][0].throw(exception)
             except StopIteration as e:
                 # discard the exhausted generator
-                exhausted_gen = plan_stack.pop()
+                exhausted_gen, _ = plan_stack.pop()
                 # if this is the parent plan, capture it's return value
                 if exhausted_gen is parent_plan:
                     ret_value = e.value
@@ -110,14 +174,13 @@ def plan_mutator(plan, msg_proc):
 
                 result_stack.append(ret)
 
-                if id(exhausted_gen) in tail_cache:
-                    gen = tail_cache.pop(id(exhausted_gen))
-                    if gen is not None:
-                        plan_stack.append(gen)
-                        saved_result = result_stack.pop()
-                        tail_result_cache[id(gen)] = saved_result
-                        # must use None to prime generator
-                        result_stack.append(None)
+                gen, index = retire(exhausted_gen)
+                if gen is not None:
+                    plan_stack.append((gen, index))
+                    saved_result = result_stack.pop()
+                    tail_result_cache[id(gen)] = saved_result
+                    # must use None to prime generator
+                    result_stack.append(None)
 
                 if plan_stack:
                     continue
@@ -126,7 +189,8 @@ def plan_mutator(plan, msg_proc):
             except Exception as e:
                 # if we catch an exception,
                 # the current top plan is dead so pop it
-                plan_stack.pop()
+                failed_gen, _ = plan_stack.pop()
+                retire(failed_gen, run_tail=False)
                 if plan_stack:
                     # stash the exception and go to the top
                     exception = e
@@ -138,10 +202,10 @@ def plan_mutator(plan, msg_proc):
         else:
             ret = result_stack.pop()
             try:
-                msg = plan_stack[-1].send(ret)
+                msg = plan_stack[-1][0].send(ret)
             except StopIteration as e:
                 # discard the exhausted generator
-                exhausted_gen = plan_stack.pop()
+                exhausted_gen, _ = plan_stack.pop()
                 # if this is the parent plan, capture it's return value
                 if exhausted_gen is parent_plan:
                     ret_value = e.value
@@ -155,14 +219,13 @@ def plan_mutator(plan, msg_proc):
 
                 result_stack.append(ret)
 
-                if id(exhausted_gen) in tail_cache:
-                    gen = tail_cache.pop(id(exhausted_gen))
-                    if gen is not None:
-                        plan_stack.append(gen)
-                        saved_result = result_stack.pop()
-                        tail_result_cache[id(gen)] = saved_result
-                        # must use None to prime generator
-                        result_stack.append(None)
+                gen, index = retire(exhausted_gen)
+                if gen is not None:
+                    plan_stack.append((gen, index))
+                    saved_result = result_stack.pop()
+                    tail_result_cache[id(gen)] = saved_result
+                    # must use None to prime generator
+                    result_stack.append(None)
 
                 if plan_stack:
                     continue
@@ -175,11 +238,10 @@ def plan_mutator(plan, msg_proc):
                 # b) an exception that came out of the run engine via ophyd
 
                 # in either case the current plan is dead so pop it
-                failed_gen = plan_stack.pop()
-                if id(failed_gen) in tail_cache:
-                    gen = tail_cache.pop(id(failed_gen))
-                    if gen is not None:
-                        plan_stack.append(gen)
+                failed_gen, _ = plan_stack.pop()
+                gen, index = retire(failed_gen)
+                if gen is not None:
+                    plan_stack.append((gen, index))
                 # if there is at least
                 if plan_stack:
                     exception = ex
@@ -189,24 +251,31 @@ def plan_mutator(plan, msg_proc):
         # if inserting / mutating, put new generator on the stack
         # and replace the current msg with the first element from the
         # new generator
-        if id(msg) not in msgs_seen:
-            # Use the id as a hash, and hold a reference to the msg so that
-            # it cannot be garbage collected until the plan is complete.
-            msgs_seen[id(msg)] = msg
-
-            new_gen, tail_gen = msg_proc(msg)
+        new_gen = None
+        for index in range(plan_stack[-1][1], len(msg_procs)):
+            seen = msgs_seen[index]
+            if id(msg) in seen:
+                continue
+            new_gen, tail_gen = msg_procs[index](msg)
             # mild correctness check
             if tail_gen is not None and new_gen is None:
                 new_gen = single_gen(msg)
             if new_gen is not None:
+                # Use the id as a hash, and hold a reference to the msg so
+                # that it cannot be garbage collected (and its id reused)
+                # while it is being replaced.
+                seen[id(msg)] = msg
+                replaced_msgs[id(new_gen)] = (index, msg)
                 # stash the new generator
-                plan_stack.append(new_gen)
+                plan_stack.append((new_gen, index))
                 # put in a result value to prime it
                 result_stack.append(None)
                 # stash the tail generator
                 tail_cache[id(new_gen)] = tail_gen
-                # go to the top of the loop
-                continue
+                break
+        if new_gen is not None:
+            # go to the top of the loop
+            continue
 
         try:
             # yield out the 'current message' and collect the return
@@ -214,7 +283,7 @@ def plan_mutator(plan, msg_proc):
         except GeneratorExit:
             # special case GeneratorExit.  We must clean up all of our plans
             # and exit with out yielding anything else.
-            for p in plan_stack:
+            for p, _ in plan_stack:
                 p.close()
             raise
         except Exception as ex:
@@ -338,10 +407,15 @@ def print_summary_wrapper(plan):
             print("{:=^80}".format(" Close Run "))
         elif cmd == "set":
             print(f"{msg.obj.name} -> {msg.args[0]}")
+        elif cmd == "set_many":
+            for obj, value in zip(msg.args[::2], msg.args[1::2]):
+                print(f"{obj.name} -> {value}")
         elif cmd == "create":
             read_cache = []
         elif cmd == "read":
             read_cache.append(msg.obj.name)
+        elif cmd == "read_many":
+            read_cache.extend(obj.name for obj in msg.args)
         elif cmd == "save":
             print(f"  Read {read_cache}")
         return msg
@@ -833,6 +907,11 @@ def monitor_during_wrapper(plan, signals):
     --------
     :func:`bluesky.plans.fly_during_wrapper`
     """
+    return (yield from fused_plan_mutator(plan, _monitor_during_msg_procs(signals)))
+
+
+def _monitor_during_msg_procs(signals):
+    # The msg_procs applied by monitor_during_wrapper, innermost first.
     monitor_msgs = [Msg("monitor", sig, name=sig.name + "_monitor") for sig in signals]
     unmonitor_msgs = [Msg("unmonitor", sig) for sig in signals]
 
@@ -857,10 +936,7 @@ def monitor_during_wrapper(plan, signals):
         else:
             return None, None
 
-    # Apply nested mutations.
-    plan1 = plan_mutator(plan, insert_after_open)
-    plan2 = plan_mutator(plan1, insert_before_close)
-    return (yield from plan2)
+    return [insert_after_open, insert_before_close]
 
 
 def fly_during_wrapper(plan, flyers):
@@ -887,6 +963,11 @@ def fly_during_wrapper(plan, flyers):
     --------
     :func:`bluesky.plans.fly`
     """
+    return (yield from fused_plan_mutator(plan, _fly_during_msg_procs(flyers)))
+
+
+def _fly_during_msg_procs(flyers):
+    # The msg_procs applied by fly_during_wrapper, innermost first.
     grp1 = _short_uid("flyers-kickoff")
     grp2 = _short_uid("flyers-complete")
     kickoff_msgs = [Msg("kickoff", flyer, group=grp1) for flyer in flyers]
@@ -919,10 +1000,56 @@ def fly_during_wrapper(plan, flyers):
         else:
             return None, None
 
-    # Apply nested mutations.
-    plan1 = plan_mutator(plan, insert_after_open)
-    plan2 = plan_mutator(plan1, insert_before_close)
-    return (yield from plan2)
+    return [insert_after_open, insert_before_close]
+
+
+def stage_once_wrapper(plan):
+    """
+    Stage each device at most once, leaving it staged until the plan ends.
+
+    Repeated 'stage' messages for a device that is already staged, and all
+    'unstage' messages, are dropped (the RunEngine is sent None in reply).
+    Every device staged along the way is unstaged when the plan ends. This
+    lets several plans that each stage the same devices run back to back
+    with one staging.
+
+    Parameters
+    ----------
+    plan : iterable or iterator
+        a generator, list, or similar containing `Msg` objects
+
+    Yields
+    ------
+    msg : Msg
+        messages from plan with redundant 'stage' and all 'unstage' messages
+        dropped, and 'unstage' messages appended
+
+    See Also
+    --------
+    :func:`bluesky.preprocessors.stage_wrapper`
+    :meth:`bluesky.run_engine.RunEngine.run_many`
+    """
+    devices_staged = []
+
+    def drop_restaging(msg):
+        if msg.command == "stage":
+            if msg.obj in devices_staged:
+                return Msg("null")
+            devices_staged.append(msg.obj)
+        elif msg.command == "stage_all":
+            objs = [obj for obj in msg.args if obj not in devices_staged]
+            if not objs:
+                return Msg("null")
+            devices_staged.extend(objs)
+            return msg._replace(args=tuple(objs))
+        elif msg.command in ("unstage", "unstage_all"):
+            return Msg("null")
+        return msg
+
+    def unstage_devices():
+        yield from unstage_all(*reversed(devices_staged))
+
+    return (yield from finalize_wrapper(msg_mutator(plan, drop_restaging), unstage_devices()))
 
 
 def lazily_stage_wrapper(plan):
@@ -951,18 +1078,30 @@ def lazily_stage_wrapper(plan):
     devices_staged = []
 
     def inner(msg):
-        if msg.command in COMMANDS and msg.obj not in devices_staged:
-            root = root_ancestor(msg.obj)
+        if msg.command == "read_many":
+            objs = [obj for obj in msg.args if obj not in devices_staged]
+        elif msg.command == "set_many":
+            objs = [obj for obj in msg.args[::2] if obj not in devices_staged]
+        elif msg.command in COMMANDS and msg.obj not in devices_staged:
+            objs = [msg.obj]
+        else:
+            objs = []
+        if objs:
 
             def new_gen():
-                # Here we insert a 'stage' message
-                ret = yield Msg("stage", root)
-                # and cache the result
-                if ret is None:
-                    # The generator may be being list-ified.
-                    # This is a hack to make that possible.
-                    ret = [root]
-                devices_staged.extend(ret)
+                for obj in objs:
+                    # An earlier object may have staged this one already.
+                    if obj in devices_staged:
+                        continue
+                    root = root_ancestor(obj)
+                    # Here we insert a 'stage' message
+                    ret = yield Msg("stage", root)
+                    # and cache the result
+                    if ret is None:
+                        # The generator may be being list-ified.
+                        # This is a hack to make that possible.
+                        ret = [root]
+                    devices_staged.extend(ret)
                 # and then proceed with our regularly scheduled programming
                 yield msg
 
@@ -976,7 +1115,7 @@ def lazily_stage_wrapper(plan):
     return (yield from finalize_wrapper(plan_mutator(plan, inner), inner_unstage_all()))
 
 
-def stage_wrapper(plan, devices):
+def stage_wrapper(plan, devices, *, concurrent=False):
     """
     'Stage' devices (i.e., prepare them for use, 'arm' them) and then unstage.
 
@@ -986,6 +1125,9 @@ def stage_wrapper(plan, devices):
         a generator, list, or similar containing `Msg` objects
     devices : collection
         list of devices to stage immediately on entrance and unstage on exit
+    concurrent : boolean, optional
+        If True, stage and unstage the devices concurrently with single
+        'stage_all' and 'unstage_all' messages. False by default.
 
     Yields
     ------
@@ -1001,10 +1143,10 @@ def stage_wrapper(plan, devices):
     devices = separate_devices(root_ancestor(device) for device in devices)
 
     def stage_devices():
-        yield from stage_all(*devices)
+        yield from stage_all(*devices, concurrent=concurrent)
 
     def unstage_devices():
-        yield from unstage_all(*reversed(devices))
+        yield from unstage_all(*reversed(devices), concurrent=concurrent)
 
     def inner():
         yield from stage_devices()
@@ -1130,10 +1272,30 @@ def relative_set_wrapper(plan, devices=None):
             abs_pos = initial_positions[msg.obj] + rel_pos
             new_msg = msg._replace(args=(abs_pos,))
             return new_msg
+        elif msg.command == "set_many":
+            args = []
+            for obj, pos in zip(msg.args[::2], msg.args[1::2]):
+                args.extend((obj, initial_positions[obj] + pos if obj in initial_positions else pos))
+            return msg._replace(args=tuple(args))
         else:
             return msg
 
     def insert_reads(msg):
+        if msg.command == "set_many":
+            unseen = [
+                obj
+                for obj in msg.args[::2]
+                if ((devices is None) or (obj in devices)) and obj not in initial_positions
+            ]
+            if not unseen:
+                return None, None
+            return (
+                pchain(
+                    *(__read_and_stash_a_motor(obj, initial_positions, coupled_parents) for obj in unseen),
+                    single_gen(msg),
+                ),
+                None,
+            )
         eligible = (devices is None) or (msg.obj in devices)
         seen = msg.obj in initial_positions
         if (msg.command == "set") and eligible and not seen:
@@ -1175,6 +1337,21 @@ def reset_positions_wrapper(plan, devices=None):
         coupled_parents = set()
 
     def insert_reads(msg):
+        if msg.command == "set_many":
+            unseen = [
+                obj
+                for obj in msg.args[::2]
+                if (devices is None or obj in devices) and obj not in initial_positions
+            ]
+            if not unseen:
+                return None, None
+            return (
+                pchain(
+                    *(__read_and_stash_a_motor(obj, initial_positions, coupled_parents) for obj in unseen),
+                    single_gen(msg),
+                ),
+                None,
+            )
         eligible = devices is None or msg.obj in devices
         seen = msg.obj in initial_positions
         if (msg.command == "set") and eligible and not seen:
@@ -1222,6 +1399,15 @@ def baseline_wrapper(plan, devices, name="baseline"):
         messages from plan, with 'set' messages inserted
     """
 
+    if not devices:
+        # no-op
+        return (yield from plan)
+    else:
+        return (yield from plan_mutator(plan, _baseline_msg_proc(devices, name)))
+
+
+def _baseline_msg_proc(devices, name="baseline"):
+    # The msg_proc applied by baseline_wrapper.
     def head():
         yield from declare_stream(*devices, name=name)
         yield from trigger_and_read(devices, name=name)
@@ -1245,11 +1431,7 @@ def baseline_wrapper(plan, devices, name="baseline"):
 
         return None, None
 
-    if not devices:
-        # no-op
-        return (yield from plan)
-    else:
-        return (yield from plan_mutator(plan, insert_baseline))
+    return insert_baseline
 
 
 # Make generator function decorator for each generator instance wrapper.
@@ -1261,6 +1443,7 @@ reset_positions_decorator = make_decorator(reset_positions_wrapper)
 # finalize_decorator is custom-made since it takes a plan as its
 # argument. See its docstring for details why.
 lazily_stage_decorator = make_decorator(lazily_stage_wrapper)
+stage_once_decorator = make_decorator(stage_once_wrapper)
 stage_decorator = make_decorator(stage_wrapper)
 fly_during_decorator = make_decorator(fly_during_wrapper)
 monitor_during_decorator = make_decorator(monitor_during_wrapper)
@@ -1284,12 +1467,14 @@ class SupplementalData:
     * kick off "flyable" devices listed in its ``flyers`` attribute at the
       beginning of each run and collect their data at the end
 
-    Internally, it uses the plan preprocessors:
+    Internally, it applies the same insertions as the plan preprocessors
 
     * :func:`baseline_wrapper`
     * :func:`monitor_during_wrapper`
     * :func:`fly_during_wrapper`
 
+    fused into a single pass with :func:`fused_plan_mutator`.
+
     Parameters
     ----------
     baseline : list
@@ -1393,10 +1578,21 @@ class SupplementalData:
         # - Complete and collect flyers.
         # - Stop monitoring.
         # - Take baseline readings.
-        plan = fly_during_wrapper(plan, self.flyers)
-        plan = monitor_during_wrapper(plan, self.monitors)
-        plan = baseline_wrapper(plan, self.baseline)
-        return (yield from plan)
+        #
+        # The three preprocessors are fused into a single pass over the plan
+        # rather than nesting fly_during_wrapper, monitor_during_wrapper and
+        # baseline_wrapper, which would put six generator layers between the
+        # plan and the RunEngine.
+        msg_procs = []
+        if self.flyers:
+            msg_procs.extend(_fly_during_msg_procs(self.flyers))
+        if self.monitors:
+            msg_procs.extend(_monitor_during_msg_procs(self.monitors))
+        if self.baseline:
+            msg_procs.append(_baseline_msg_proc(self.baseline))
+        if not msg_procs:
+            return (yield from ensure_generator(plan))
+        return (yield from fused_plan_mutator(plan, msg_procs))
 
 
 def set_run_key_wrapper(plan, run):
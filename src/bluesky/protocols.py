@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import AsyncIterator, Awaitable, Iterator
+from collections.abc import AsyncIterator, Awaitable, Hashable, Iterator
 from typing import (
     Any,
     Callable,
@@ -208,6 +208,20 @@ class Configurable(Protocol[T]):
         ...
 
 
+@runtime_checkable
+class HasCacheToken(Protocol):
+    @abstractmethod
+    def cache_token(self) -> Hashable:
+        """Return a token that changes whenever the output of ``describe`` or
+        ``describe_configuration`` may have changed.
+
+        Used by :class:`bluesky.bundlers.DescribeCache` to decide whether
+        results cached during an earlier run can be reused. This should be
+        cheap to call and must be a standard function, not an ``async`` one.
+        """
+        ...
+
+
 @runtime_checkable
 class Triggerable(Protocol):
     @abstractmethod
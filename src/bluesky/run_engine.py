@@ -6,6 +6,7 @@ import inspect
 import json
 import sys
 import threading
+import time as ttime
 import typing
 import weakref
 from collections import ChainMap, defaultdict, deque
@@ -25,8 +26,9 @@ from bluesky._vendor.super_state_machine.errors import TransitionError
 from bluesky._vendor.super_state_machine.extras import PropertyMachine
 from bluesky._vendor.super_state_machine.machines import StateMachine
 
-from .bundlers import RunBundler, maybe_await
+from .bundlers import DescribeCache, RunBundler, maybe_await
 from .log import ComposableLogAdapter, logger, msg_logger, state_logger
+from .preprocessors import stage_once_wrapper
 from .protocols import (
     Flyable,
     Locatable,
@@ -44,6 +46,7 @@ from .protocols import (
 )
 from .tracing import tracer
 from .utils import (
+    AggregateStatus,
     AsyncInput,
     CallbackRegistry,
     DefaultDuringTask,
@@ -79,12 +82,39 @@ except ImportError:
     del Task
 
 
+def _same_target(a, b) -> bool:
+    # Compare set() arguments, treating values that cannot be compared
+    # unambiguously (e.g. arrays) as different.
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
 class _RunEnginePanic(Exception): ...
 
 
 class WaitForTimeoutError(TimeoutError): ...
 
 
+def _split_by_generation(objs):
+    """Group objs so that every object comes after its ancestors among objs.
+
+    Returns a list of lists; objects with no ancestors among objs come first.
+    """
+    members = set(objs)
+    generations = defaultdict(list)
+    for obj in dict.fromkeys(objs):
+        depth = 0
+        ancestor = getattr(obj, "parent", None)
+        while ancestor is not None:
+            if ancestor in members:
+                depth += 1
+            ancestor = getattr(ancestor, "parent", None)
+        generations[depth].append(obj)
+    return [generations[depth] for depth in sorted(generations)]
+
+
 @dataclass
 class RunEngineResult:
     """
@@ -302,6 +332,23 @@ class RunEngine:
         False by default. Set to True to generate an extra event stream
         that records any interruptions (pauses, suspensions).
 
+    max_msg_cache_size
+        Maximum number of messages cached since the last checkpoint for
+        rewinding on resume; None (the default) means no limit. When a plan
+        exceeds it, the cache is dropped and the plan cannot be resumed until
+        its next 'checkpoint', as if it had sent a 'clear_checkpoint'. See
+        :meth:`RunEngine.msg_cache_report`.
+
+    max_concurrent_stage
+        Maximum number of objects staged or unstaged at once by 'stage_all'
+        and 'unstage_all' messages; None (the default) means no limit.
+
+    describe_cache
+        None by default, in which case every run calls ``describe`` and
+        ``describe_configuration`` on each device it uses. Set to a
+        `bluesky.bundlers.DescribeCache` to reuse their output from earlier
+        runs. ``read_configuration`` is called in every run regardless.
+
     state
         {'idle', 'running', 'paused'}
 
@@ -369,6 +416,8 @@ class RunEngine:
         "unsubscribe",
         "stage",
         "unstage",
+        "stage_all",
+        "unstage_all",
         "monitor",
         "unmonitor",
         "open_run",
@@ -483,10 +532,14 @@ class RunEngine:
         self.scan_id_source = scan_id_source
 
         self.max_depth = None
+        self._extra_call_depth = 0  # frames between the user and __call__, e.g. run_many
         self.msg_hook = None
         self.state_hook = None
         self.waiting_hook = None
         self.record_interruptions = False
+        self.describe_cache: typing.Optional[DescribeCache] = None
+        self.max_concurrent_stage: typing.Optional[int] = None
+        self.max_msg_cache_size: typing.Optional[int] = None
         self.pause_msg = PAUSE_MSG
         self.NO_PLAN_RETURN = object()
 
@@ -503,8 +556,10 @@ class RunEngine:
         self._exception = None  # stored and then raised in the _run loop
         self._interrupted = False  # True if paused, aborted, or failed
         self._staged: set[typing.Any] = set()  # objects staged, not yet unstaged
+        self._staged_concurrently: set[typing.Any] = set()  # subset of the above staged by 'stage_all'
         self._objs_seen: set[typing.Any] = set()  # all objects seen
         self._movable_objs_touched: set[typing.Any] = set()  # objects we moved at any point
+        self._set_targets: dict[typing.Any, typing.Any] = {}  # obj -> (args, status) of its 'set_many' in progress
         self._run_start_uids: list[typing.Any] = list()  # run start uids generated by __call__  # noqa: C408
         self._suspenders: set[typing.Any] = set()  # set holding suspenders
         self._groups: defaultdict[typing.Any, set[typing.Any]] = defaultdict(set)  # sets of Events to wait for
@@ -516,6 +571,7 @@ class RunEngine:
             set()
         )  # group ids that have been passed to _wait_and_move_on
         self._msg_cache: deque[typing.Any] = deque()  # history of processed msgs for rewinding
+        self._msg_cache_overflowed: bool = False  # msg cache dropped for exceeding max_msg_cache_size
         self._rewindable_flag: bool = True  # if the RE is allowed to replay msgs
         self._plan_stack: deque[typing.Any] = deque()  # stack of generators to work off of
         self._response_stack: deque[typing.Any] = deque()  # resps to send into the plans
@@ -532,6 +588,7 @@ class RunEngine:
             "save": self._save,
             "drop": self._drop,
             "read": self._read,
+            "read_many": self._read_many,
             "locate": self._locate,
             "monitor": self._monitor,
             "unmonitor": self._unmonitor,
@@ -539,6 +596,7 @@ class RunEngine:
             "RE_class": self._RE_class,
             "stop": self._stop,
             "set": self._set,
+            "set_many": self._set_many,
             "trigger": self._trigger,
             "sleep": self._sleep,
             "wait": self._wait,
@@ -555,6 +613,8 @@ class RunEngine:
             "configure": self._configure,
             "stage": self._stage,
             "unstage": self._unstage,
+            "stage_all": self._stage_all,
+            "unstage_all": self._unstage_all,
             "subscribe": self._subscribe,
             "unsubscribe": self._unsubscribe,
             "open_run": self._open_run,
@@ -724,11 +784,14 @@ class RunEngine:
         "Clean up for a new __call__ (which may encompass multiple runs)."
         self._metadata_per_call.clear()
         self._staged.clear()
+        self._staged_concurrently.clear()
         self._objs_seen.clear()
         self._movable_objs_touched.clear()
+        self._set_targets.clear()
         self._deferred_pause_requested = False
         self._plan_stack = deque()
         self._msg_cache = deque()
+        self._msg_cache_overflowed = False
         self._response_stack = deque()
         self._exception = None
         self._run_start_uids.clear()
@@ -762,6 +825,28 @@ class RunEngine:
         "i.e., can the plan in progress by rewound"
         return self._msg_cache is not None
 
+    def msg_cache_report(self):
+        """
+        Report on the messages cached for rewinding since the last checkpoint.
+
+        Returns
+        -------
+        report : dict
+            with the number of cached ``messages``, the ``max_messages``
+            allowed (``max_msg_cache_size``), their approximate size in bytes
+            as ``nbytes`` (not counting the objects they refer to) and whether
+            the cache ``overflowed`` since the last checkpoint.
+        """
+        cache = list(self._msg_cache or ())
+        return {
+            "messages": len(cache),
+            "max_messages": self.max_msg_cache_size,
+            "nbytes": sum(
+                sys.getsizeof(msg) + sys.getsizeof(msg.args) + sys.getsizeof(msg.kwargs) for msg in cache
+            ),
+            "overflowed": self._msg_cache_overflowed,
+        }
+
     @property
     def ignore_callback_exceptions(self):
         return self.dispatcher.ignore_exceptions
@@ -913,7 +998,7 @@ class RunEngine:
         # Check that the RE is not being called from inside a function.
         if self.max_depth is not None:
             frame = inspect.currentframe()
-            depth = len(inspect.getouterframes(frame))
+            depth = len(inspect.getouterframes(frame)) - self._extra_call_depth
             if depth > self.max_depth:
                 text = MAX_DEPTH_EXCEEDED_ERR_MSG.format(self.max_depth, depth)
                 raise RuntimeError(text)
@@ -984,6 +1069,85 @@ class RunEngine:
         else:
             return tuple(self._run_start_uids)
 
+    def run_many(
+        self,
+        plans: typing.Iterable[typing.Iterable[Msg]],
+        subs: typing.Optional[Subscribers] = None,
+        /,
+        *,
+        keep_staged: bool = False,
+        reuse_describe: bool = False,
+        **metadata_kw: typing.Any,
+    ) -> typing.Union[RunEngineResult, tuple[str, ...]]:
+        """Execute several plans back to back in one call.
+
+        Each plan still produces its own runs, with their own start and stop
+        documents, but the setup and teardown of a call of the RunEngine
+        (subscriptions, signal handlers, the event loop task, ...) is done
+        once for all of them rather than once per plan, which matters for
+        many short plans.
+
+        Parameters
+        ----------
+        plans : iterable (positional only)
+            plans (generators, or iterables of ``Msg``) to run in order; it
+            is consumed lazily, so it can itself be a generator
+        subs : callable, list, or dict, optional (positional only)
+            Temporary subscriptions, as for :meth:`__call__`.
+        keep_staged : bool, optional
+            If True, a device is staged by the first plan that stages it and
+            stays staged until the last plan has run (see
+            :func:`bluesky.preprocessors.stage_once_wrapper`): every 'unstage'
+            in the plans is dropped and the devices are unstaged only when the
+            whole batch ends. False by default, so each plan stages and
+            unstages its devices as it would in a call of its own. Only use
+            it for devices that need not be staged afresh for each run (not,
+            e.g., ones that start a new file on staging).
+        reuse_describe : bool, optional
+            If True and ``RE.describe_cache`` is None, use a
+            :class:`~bluesky.bundlers.DescribeCache` across the plans, so
+            that each device is described only once. False by default. Only
+            use it if no plan changes the keys or shapes a device reports;
+            configuration values are read again in every run either way.
+        **metadata_kw :
+            metadata recorded with every run, as for :meth:`__call__`
+
+        Returns
+        -------
+        uids : tuple
+            list of uids (i.e. RunStart Document uids) of all of the runs
+            if :attr:`RunEngine._call_returns_result` is ``False``
+        result : :class:`RunEngineResult`
+            if :attr:`RunEngine._call_returns_result` is ``True``, with the
+            return value of the last plan
+
+        Notes
+        -----
+        As with a single call, an exception in any plan ends the whole batch,
+        and a pause or suspension applies to the plan being executed.
+        """
+
+        def batch():
+            previous_cache = self.describe_cache
+            if reuse_describe and previous_cache is None:
+                self.describe_cache = DescribeCache()
+            try:
+                ret = None
+                for plan in plans:
+                    ret = yield from ensure_generator(plan)
+                return ret
+            finally:
+                self.describe_cache = previous_cache
+
+        plan = batch()
+        if keep_staged:
+            plan = stage_once_wrapper(plan)
+        self._extra_call_depth = 1
+        try:
+            return self(plan, subs, **metadata_kw)
+        finally:
+            self._extra_call_depth = 0
+
     def resume(self):
         """Resume a paused plan from the last checkpoint.
 
@@ -1454,6 +1618,8 @@ class RunEngine:
 
     async def _stop_movable_objects(self, *, success=True):
         "Call obj.stop() for all objects we have moved. Log any exceptions."
+        # Stopped objects may not have reached their targets.
+        self._set_targets.clear()
         for obj in self._movable_objs_touched:
             if isinstance(obj, Stoppable):
                 try:
@@ -1659,6 +1825,8 @@ class RunEngine:
                     ):
                         # We have a checkpoint.
                         self._msg_cache.append(msg)
+                        if self.max_msg_cache_size is not None and len(self._msg_cache) > self.max_msg_cache_size:
+                            await self._overflow_msg_cache()
 
                     # try to look up the coroutine to execute the command
                     if (
@@ -1770,12 +1938,23 @@ class RunEngine:
                 # collection. We swallow errors.
                 await current_run.backstop_collect()
             # in case we were interrupted between 'stage' and 'unstage'
+            staged_concurrently = [obj for obj in self._staged if obj in self._staged_concurrently]
             for obj in list(self._staged):
+                if obj in self._staged_concurrently:
+                    continue
                 try:
                     obj.unstage()
                 except Exception:
                     self.log.exception("Failed to unstage %r.", obj)
                 self._staged.remove(obj)
+            results = await self._call_stage_method_concurrently(
+                staged_concurrently, "unstage", return_exceptions=True
+            )
+            for obj, ret in results.items():
+                if isinstance(ret, Exception):
+                    self.log.error("Failed to unstage %r.", obj, exc_info=ret)
+                self._staged.discard(obj)
+                self._staged_concurrently.discard(obj)
 
             sys.stdout.flush()
             # Emit RunStop if necessary.
@@ -1875,6 +2054,7 @@ class RunEngine:
             self.emit_sync,
             self.log,
             strict_pre_declare=self._require_stream_declaration,
+            describe_cache=self.describe_cache,
         )
 
         new_uid = await current_run.open_run(msg)
@@ -1992,6 +2172,39 @@ class RunEngine:
 
         return ret
 
+    async def _read_many(self, msg):
+        """
+        Read several objects concurrently and add the readings to the open
+        event bundle.
+
+        Expected message object is:
+
+            Msg('read_many', None, obj1, ..., objn)
+
+        The ``read()`` of every object is awaited concurrently. Once all of
+        them have returned, the readings are added to the bundle together, in
+        the order the objects were given. Returns a list of the readings in
+        that same order.
+        """
+        objs = [check_supports(obj, Readable) for obj in msg.args]
+        self._objs_seen.update(objs)
+        readings = await asyncio.gather(*[maybe_await(obj.read()) for obj in objs])
+
+        for obj, ret in zip(objs, readings):
+            if ret is None:
+                raise RuntimeError(
+                    f"The read of {obj.name} returned None. "
+                    "This is a bug in your object implementation, "
+                    "`read` must return a dictionary."
+                )
+        run_key = msg.run
+        if (
+            current_run := self._run_bundlers.get(run_key, key_absence_sentinel := object())
+        ) is not key_absence_sentinel:
+            await current_run.read_many(msg, objs, readings)
+
+        return readings
+
     async def _locate(self, msg: Msg):
         """
         Locate some Movables and return their locations.
@@ -2233,11 +2446,72 @@ class RunEngine:
         group = kwargs.pop("group", None)
         self._movable_objs_touched.add(obj)
         ret = obj.set(*msg.args, **kwargs)
+        if self._set_targets:
+            # This move supersedes any 'set_many' move of obj in progress.
+            self._set_targets.pop(obj, None)
 
         self._add_status_to_group(obj=obj, status_object=ret, group=group, action="set")
 
         return ret
 
+    @tracer.start_as_current_span(f"{_SPAN_NAME_PREFIX} set_many")
+    async def _set_many(self, msg):
+        """
+        Set several devices at once and return one status for all of them.
+
+        Expected message object is
+
+            Msg('set_many', None, obj1, value1, ..., objn, valuen, group=None)
+
+        Each ``obj.set(value)`` is called in turn, except for objects that are
+        still moving to the same value because of an earlier 'set_many' that
+        has not been superseded by a 'set' or stopped: those are not set
+        again, and the move in progress is included in the returned status
+        instead. Once a move is done, the object is set again even if the
+        value is the same, since it may have been moved by other means since.
+        The group waits on a single
+        :class:`~bluesky.utils.AggregateStatus`, while the waiting hook is
+        given the individual status objects.
+        """
+        _set_span_msg_attributes(trace.get_current_span(), msg)
+        group = msg.kwargs.get("group", None)
+        if len(msg.args) % 2:
+            raise ValueError("set_many expects pairs of objects and values")
+        statuses = []
+        for obj, value in zip(msg.args[::2], msg.args[1::2]):
+            obj = check_supports(obj, Movable)
+            last = self._set_targets.get(obj)
+            if last is not None and not last[1].done and _same_target(last[0], (value,)):
+                statuses.append(last[1])
+                continue
+            self._movable_objs_touched.add(obj)
+            ret = obj.set(value)
+            self._track_set_target(obj, (value,), ret)
+            statuses.append(ret)
+
+        ret = AggregateStatus(statuses)
+        self._add_status_to_group(obj=None, status_object=ret, group=group, action="set_many", tracked=statuses)
+
+        return ret
+
+    def _track_set_target(self, obj, args, status):
+        "Remember the target of a 'set_many' move of obj until its status completes."
+        self._set_targets[obj] = (args, status)
+
+        def forget():
+            if self._set_targets.get(obj, (None, None))[1] is status:
+                del self._set_targets[obj]
+
+        def on_done(status):
+            # Status callbacks may run in any thread; only touch
+            # _set_targets from the event loop.
+            try:
+                self._loop.call_soon_threadsafe(forget)
+            except RuntimeError:  # the loop is closed
+                pass
+
+        status.add_callback(on_done)
+
     async def _trigger(self, msg):
         """
         Trigger a device and cache the returned status object.
@@ -2434,6 +2708,10 @@ class RunEngine:
             if current_run.bundling:
                 raise IllegalMessageSequence("Cannot 'checkpoint' after 'create' and before 'save'. Aborting!")
 
+        if self._msg_cache_overflowed:
+            # The plan is resumable again from this checkpoint onward.
+            self._msg_cache = deque()
+            self._msg_cache_overflowed = False
         await self._reset_checkpoint_state_coro()
 
         if self._deferred_pause_requested:
@@ -2466,10 +2744,23 @@ class RunEngine:
         """
         # clear message cache
         self._msg_cache = None
+        self._msg_cache_overflowed = False
         # clear stashed
         for current_run in self._run_bundlers.values():
             await current_run.clear_checkpoint(msg)
 
+    async def _overflow_msg_cache(self):
+        "Drop the message cache after it has grown past max_msg_cache_size."
+        self.log.warning(
+            "More than %d messages were cached since the last checkpoint. "
+            "The plan cannot be resumed until it reaches its next checkpoint.",
+            self.max_msg_cache_size,
+        )
+        self._msg_cache = None
+        self._msg_cache_overflowed = True
+        for current_run in self._run_bundlers.values():
+            await current_run.clear_checkpoint(Msg("clear_checkpoint"))
+
     async def _rewindable(self, msg):
         """Set rewindable state of RunEngine
 
@@ -2506,11 +2797,22 @@ class RunEngine:
         _, obj, args, kwargs, _ = msg
 
         old, new = obj.configure(*args, **kwargs)
+        if self.describe_cache is not None:
+            self.describe_cache.invalidate(obj)
         if current_run:
             await current_run.configure(msg)
         return old, new
 
-    def _add_status_to_group(self, obj: typing.Any, status_object: Status, group: str, action: str) -> None:
+    def _add_status_to_group(
+        self,
+        obj: typing.Any,
+        status_object: Status,
+        group: str,
+        action: str,
+        tracked: typing.Optional[typing.Iterable[Status]] = None,
+    ) -> None:
+        # ``tracked``, if given, are the status objects passed to the waiting
+        # hook in place of ``status_object``.
         fut = self._loop.create_future()
         pardon_failures = self._pardon_failures
 
@@ -2525,7 +2827,10 @@ class RunEngine:
             status_object.finished_cb = done_callback  # type: ignore
 
         self._groups[group].add(lambda: fut)
-        self._status_objs[group].add(status_object)
+        if tracked is None:
+            self._status_objs[group].add(status_object)
+        else:
+            self._status_objs[group].update(tracked)
 
     async def _stage(self, msg):
         """Instruct the RunEngine to stage the object
@@ -2565,6 +2870,7 @@ class RunEngine:
         ret = obj.unstage()
         # use `discard()` to ignore objects that are not in the staged set.
         self._staged.discard(obj)
+        self._staged_concurrently.discard(obj)
         await self._reset_checkpoint_state_coro()
 
         if not isinstance(ret, Status):
@@ -2574,6 +2880,89 @@ class RunEngine:
 
         return ret
 
+    async def _stage_all(self, msg):
+        """Instruct the RunEngine to stage several objects concurrently
+
+        Expected message object is:
+
+            Msg('stage_all', None, obj1, ..., objn, group=None)
+
+        No object is staged before those of its ancestors that are also in
+        the message. Returns a list of what each object's ``stage`` returned.
+        """
+        group = msg.kwargs.get("group", None)
+        objs = [obj for obj in msg.args if isinstance(obj, Stageable)]
+        # add first in case of failure below
+        self._staged.update(objs)
+        self._staged_concurrently.update(objs)
+        await self._reset_checkpoint_state_coro()
+
+        results = await self._call_stage_method_concurrently(objs, "stage")
+        for obj, ret in results.items():
+            if isinstance(ret, Status):
+                self._add_status_to_group(obj=obj, status_object=ret, group=group, action="stage")
+        return [results.get(obj, []) for obj in msg.args]
+
+    async def _unstage_all(self, msg):
+        """Instruct the RunEngine to unstage several objects concurrently
+
+        Expected message object is:
+
+            Msg('unstage_all', None, obj1, ..., objn, group=None)
+
+        No object is unstaged before its descendants that are also in the
+        message. Returns a list of what each object's ``unstage`` returned.
+        """
+        group = msg.kwargs.get("group", None)
+        objs = [obj for obj in msg.args if isinstance(obj, Stageable)]
+
+        results = await self._call_stage_method_concurrently(objs, "unstage")
+        for obj, ret in results.items():
+            # use `discard()` to ignore objects that are not in the staged set.
+            self._staged.discard(obj)
+            self._staged_concurrently.discard(obj)
+            if isinstance(ret, Status):
+                self._add_status_to_group(obj=obj, status_object=ret, group=group, action="unstage")
+        await self._reset_checkpoint_state_coro()
+        return [results.get(obj, []) for obj in msg.args]
+
+    async def _call_stage_method_concurrently(self, objs, method, return_exceptions=False):
+        """Call ``obj.stage()`` or ``obj.unstage()`` for all objs concurrently.
+
+        Objects are split into generations by ancestry: parents are staged
+        before their children and unstaged after them. Within a generation the
+        blocking calls are made from worker threads, at most
+        ``max_concurrent_stage`` at a time. Returns a dict mapping each object to the return value (or,
+        if return_exceptions is True, the exception) of the call.
+        """
+        limit = self.max_concurrent_stage or max(len(objs), 1)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def call(obj):
+            func = getattr(obj, method)
+            async with semaphore:
+                start = ttime.monotonic()
+                if inspect.iscoroutinefunction(inspect.unwrap(func)):
+                    # e.g. ophyd-async, which returns a Status at once but
+                    # must be called from the thread running the event loop
+                    ret = func()
+                else:
+                    ret = await self._loop.run_in_executor(None, func)
+                self.log.debug("Called %s() on %r in %.3f s.", method, obj, ttime.monotonic() - start)
+                return ret
+
+        generations = _split_by_generation(objs)
+        if method == "unstage":
+            generations.reverse()
+        results = {}
+        start = ttime.monotonic()
+        for generation in generations:
+            rets = await asyncio.gather(*[call(obj) for obj in generation], return_exceptions=return_exceptions)
+            results.update(zip(generation, rets))
+        if objs:
+            self.log.info("Called %s() on %d objects in %.3f s.", method, len(objs), ttime.monotonic() - start)
+        return results
+
     async def _stop(self, msg):
         """
         Stop a device.
@@ -2583,6 +2972,7 @@ class RunEngine:
             Msg('stop', obj)
         """
         obj = check_supports(msg.obj, Stoppable)
+        self._set_targets.pop(obj, None)
         return await maybe_await(obj.stop())  # nominally, this returns None
 
     async def _subscribe(self, msg):
@@ -1,4 +1,9 @@
-from collections.abc import Generator, Sequence
+import asyncio
+import inspect
+import math
+from collections.abc import Generator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from itertools import dropwhile
 from time import time
 from typing import (
@@ -21,7 +26,7 @@ from .protocols import Checkable, Readable, Reading
 END = "end"
 
 
-def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2):
+def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2, label_points=False):
     """Plot the raster path for this plan
 
     Parameters
@@ -40,6 +45,11 @@ def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2):
 
     lw : float, optional
         Width of lines drawn between points
+
+    label_points : bool, optional
+        If True, label each point with its index in the order the points were
+        given to the plan: taken from the 'point_order' metadata recorded by
+        plans run with ``optimize_path``, or else the order they are visited.
     """
     import matplotlib.pyplot as plt
     from matplotlib import collections as mcollections
@@ -51,13 +61,21 @@ def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2):
 
     cur_x = cur_y = None
     traj = []
+    point_order = None
     for msg in plan:
         cmd = msg.command
-        if cmd == "set":
-            if msg.obj.name == x_motor:
-                cur_x = msg.args[0]
-            if msg.obj.name == y_motor:
-                cur_y = msg.args[0]
+        if cmd == "open_run" and point_order is None:
+            point_order = msg.kwargs.get("point_order")
+        elif cmd in ("set", "set_many"):
+            if cmd == "set":
+                moves = [(msg.obj, msg.args[0])]
+            else:
+                moves = zip(msg.args[::2], msg.args[1::2])
+            for obj, value in moves:
+                if obj.name == x_motor:
+                    cur_x = value
+                if obj.name == y_motor:
+                    cur_y = value
         elif cmd == "save":
             traj.append((cur_x, cur_y))
 
@@ -72,7 +90,12 @@ def plot_raster_path(plan, x_motor, y_motor, ax=None, probe_size=None, lw=2):
 
         read_points = mcollections.PatchCollection(circles, match_original=True)
         ax.add_collection(read_points)
-    return {"path": path, "events": read_points}
+    ret = {"path": path, "events": read_points}
+    if label_points:
+        if point_order is None:
+            point_order = range(len(traj))
+        ret["labels"] = [ax.annotate(str(index), point) for index, point in zip(point_order, traj)]
+    return ret
 
 
 def summarize_plan(plan):
@@ -100,26 +123,467 @@ def check_limits(plan):
     call_in_bluesky_event_loop(check_limits_async(plan))
 
 
-async def check_limits_async(plan):
+async def check_limits_async(plan, *, max_concurrent=16, cache=None):
     """
     Check that a plan will not move devices outside of their limits.
 
+    See :func:`check_limits_many_async` for the parameters; the first
+    violation in the plan is raised.
+
     Parameters
     ----------
     plan : iterable
         Must yield `Msg` objects
     """
-    ignore = []
-    for msg in plan:
-        obj = msg.obj
-        if msg.command == "set" and obj not in ignore:
-            if isinstance(obj, Checkable):
-                await maybe_await(obj.check_value(msg.args[0]))
+    (error,) = await check_limits_many_async([plan], max_concurrent=max_concurrent, cache=cache)
+    if error is not None:
+        raise error
+
+
+def check_limits_many(plans, *, max_concurrent=16, cache=None):
+    """Run check_limits_many_async in the RE"""
+    if in_bluesky_event_loop():
+        raise RuntimeError(
+            "Can't call check_limits_many() from within RE, use await check_limits_many_async() instead"
+        )
+    return call_in_bluesky_event_loop(check_limits_many_async(plans, max_concurrent=max_concurrent, cache=cache))
+
+
+async def check_limits_many_async(plans, *, max_concurrent=16, cache=None):
+    """
+    Check that several plans, e.g. a queue, will not move devices outside of
+    their limits.
+
+    All the (device, setpoint) pairs are first collected from the plans, so
+    each distinct pair is checked only once however many plans and points
+    use it. The checks then run concurrently, at most ``max_concurrent`` at a
+    time; devices with a synchronous ``check_value`` are checked in a pool of
+    threads.
+
+    Parameters
+    ----------
+    plans : iterable
+        Plans, each of which must yield `Msg` objects
+    max_concurrent : int, optional
+        Maximum number of checks in progress at once.
+    cache : dict, optional
+        Results of previous checks, keyed on (device, setpoint); it is
+        updated with the new results. Pass the same dict to validate a queue
+        again after changing it, so that only new setpoints are checked.
+
+    Returns
+    -------
+    errors : list
+        For each plan, the exception raised by the check of its first
+        out-of-limits setpoint, or None if all of its setpoints are valid.
+    """
+    if cache is None:
+        cache = {}
+    local = {}  # results for unhashable setpoints, e.g. arrays, which are not cached
+    ignore = set()
+    pending = {}
+    keys_per_plan = []
+    for plan in plans:
+        keys = []
+        for msg in plan:
+            if msg.command == "set":
+                moves = [(msg.obj, msg.args[0])]
+            elif msg.command == "set_many":
+                moves = list(zip(msg.args[::2], msg.args[1::2]))
             else:
-                warn(  # noqa: B028
-                    f"{obj.name} has no check_value() method to check if {msg.args[0]} is within its limits."
-                )
-                ignore.append(obj)
+                continue
+            for obj, value in moves:
+                if obj in ignore:
+                    continue
+                if not isinstance(obj, Checkable):
+                    warn(  # noqa: B028
+                        f"{obj.name} has no check_value() method to check if {value} is within its limits."
+                    )
+                    ignore.add(obj)
+                    continue
+                key = (obj, value)
+                try:
+                    hash(key)
+                except TypeError:
+                    key = (obj, id(value))
+                    results = local
+                else:
+                    results = cache
+                keys.append((key, results))
+                if key not in results and key not in pending:
+                    pending[key] = (obj, value, results)
+        keys_per_plan.append(keys)
+
+    if pending:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrent)
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+
+            async def check(key, obj, value, results):
+                async with semaphore:
+                    try:
+                        if inspect.iscoroutinefunction(obj.check_value):
+                            await obj.check_value(value)
+                        else:
+                            ret = await loop.run_in_executor(executor, obj.check_value, value)
+                            await maybe_await(ret)
+                    except Exception as err:
+                        results[key] = err
+                    else:
+                        results[key] = None
+
+            await asyncio.gather(*(check(key, *args) for key, args in pending.items()))
+
+    return [
+        next((results[key] for key, results in keys if results[key] is not None), None) for keys in keys_per_plan
+    ]
+
+
+class MotionModel:
+    """Timing model of a movable device, used by :func:`estimate_duration`.
+
+    A move of distance ``d`` follows a trapezoidal velocity profile: the
+    device accelerates to ``velocity``, cruises and decelerates, and then
+    settles for ``settle_time``. Short moves that never reach ``velocity``
+    follow a triangular profile.
+
+    Parameters
+    ----------
+    velocity : float
+        Maximum speed, in motor units per second.
+    acceleration : float, optional
+        Acceleration and deceleration, in motor units per second squared. If
+        None (default), the device reaches ``velocity`` instantly.
+    settle_time : float, optional
+        Time after the motion stops before the move is reported done.
+    overhead : float, optional
+        Fixed time added to every move, e.g. for communication.
+    """
+
+    def __init__(self, velocity, acceleration=None, settle_time=0.0, overhead=0.0):
+        if velocity <= 0:
+            raise ValueError(f"velocity must be positive, not {velocity}")
+        if acceleration is not None and acceleration <= 0:
+            raise ValueError(f"acceleration must be positive, not {acceleration}")
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.settle_time = settle_time
+        self.overhead = overhead
+
+    def move_time(self, distance):
+        """Return the time spent in motion to travel ``distance``."""
+        distance = abs(distance)
+        v, a = self.velocity, self.acceleration
+        if a is None:
+            return distance / v
+        if distance >= v * v / a:
+            return distance / v + v / a
+        return 2 * math.sqrt(distance / a)
+
+    def __repr__(self):
+        return (
+            f"MotionModel(velocity={self.velocity!r}, acceleration={self.acceleration!r}, "
+            f"settle_time={self.settle_time!r}, overhead={self.overhead!r})"
+        )
+
+
+class ExposureModel:
+    """Timing model of a triggerable device, used by :func:`estimate_duration`.
+
+    Parameters
+    ----------
+    exposure_time : float
+        Time spent acquiring after each trigger.
+    readout_time : float, optional
+        Time after the exposure before the trigger is reported done.
+    overhead : float, optional
+        Fixed time added to every trigger, e.g. for communication.
+    """
+
+    def __init__(self, exposure_time, readout_time=0.0, overhead=0.0):
+        self.exposure_time = exposure_time
+        self.readout_time = readout_time
+        self.overhead = overhead
+
+    def __repr__(self):
+        return (
+            f"ExposureModel(exposure_time={self.exposure_time!r}, readout_time={self.readout_time!r}, "
+            f"overhead={self.overhead!r})"
+        )
+
+
+@dataclass
+class DurationEstimate:
+    """
+    The result of :func:`estimate_duration`
+
+    Attributes
+    ----------
+    total_time : float
+        Estimated wall-clock duration of the plan, in seconds.
+    breakdown : dict
+        Time the plan spends blocked, by stage: 'motion', 'settle',
+        'exposure', 'readout', 'sleep' and 'overhead'. The values add up
+        to ``total_time``.
+    num_messages : int
+        Number of messages the plan yielded.
+    num_steps : int
+        Number of events (``save`` messages).
+    step_time : float
+        Mean time between consecutive events of the same run; the first event
+        of a run is counted from 'open_run'.
+    dead_time_per_step : float
+        Mean part of ``step_time`` not spent exposing.
+    run_times : list
+        Duration of each run, from 'open_run' to 'close_run'.
+    unmodelled : set
+        Names of devices that were moved or triggered but have no model at
+        all; these are assumed to finish instantly.
+    """
+
+    total_time: float = 0.0
+    breakdown: dict = field(default_factory=dict)
+    num_messages: int = 0
+    num_steps: int = 0
+    step_time: float = 0.0
+    dead_time_per_step: float = 0.0
+    run_times: list = field(default_factory=list)
+    unmodelled: set = field(default_factory=set)
+
+    def __str__(self):
+        lines = [
+            f"Estimated duration: {self.total_time:.3f} s "
+            f"({self.num_messages} messages, {len(self.run_times)} runs, {self.num_steps} steps)"
+        ]
+        if self.num_steps:
+            lines.append(f"  per step: {self.step_time:.4f} s, of which dead time {self.dead_time_per_step:.4f} s")
+        for stage, t in self.breakdown.items():
+            share = t / self.total_time if self.total_time else 0.0
+            lines.append(f"  {stage:<9} {t:12.3f} s {share:7.1%}")
+        if self.unmodelled:
+            lines.append(f"  no timing model for: {', '.join(sorted(self.unmodelled))}")
+        return "\n".join(lines)
+
+
+_STAGES = ("motion", "settle", "exposure", "readout", "sleep", "overhead")
+
+
+class _VirtualClock:
+    # Executes plans against a virtual clock: statuses are (end, phases)
+    # tuples, and only the last one to finish is kept per group, since that
+    # is the one a 'wait' blocks on.
+
+    def __init__(self, models, initial_positions, message_overhead, run_overhead):
+        self.motion = {}
+        self.exposure = {}
+        for key, value in (models or {}).items():
+            name = getattr(key, "name", key)
+            for model in value if isinstance(value, (tuple, list)) else (value,):
+                if isinstance(model, MotionModel):
+                    self.motion[name] = model
+                elif isinstance(model, ExposureModel):
+                    self.exposure[name] = model
+                else:
+                    raise TypeError(f"Expected a MotionModel or ExposureModel for {name!r}, not {model!r}")
+        self.positions = {getattr(k, "name", k): v for k, v in (initial_positions or {}).items()}
+        self.message_overhead = message_overhead
+        self.run_overhead = run_overhead
+        self.now = 0.0
+        self.breakdown = dict.fromkeys(_STAGES, 0.0)
+        self.groups = {}
+        self.unmodelled = set()
+        self.run_start = None
+        self.run_times = []
+        self.last_save = None
+        self.last_exposure = 0.0
+        self.step_time = 0.0
+        self.step_exposure = 0.0
+        self.num_steps = 0
+        self.handlers = {
+            "set": self.set,
+            "set_many": self.set_many,
+            "trigger": self.trigger,
+            "wait": self.wait,
+            "sleep": self.sleep,
+            "save": self.save,
+            "open_run": self.open_run,
+            "close_run": self.close_run,
+            "locate": self.locate,
+        }
+
+    def add_status(self, group, start, phases):
+        end = phases[-1][1] if phases else start
+        current = self.groups.get(group)
+        if current is None or end > current[0]:
+            self.groups[group] = (end, phases)
+
+    def move(self, obj, target, group):
+        name = obj.name
+        model = self.motion.get(name)
+        start = self.positions.get(name)
+        self.positions[name] = target
+        if model is None:
+            if name not in self.exposure:
+                self.unmodelled.add(name)
+            return
+        t0 = self.now + model.overhead
+        try:
+            t1 = t0 + (model.move_time(target - start) if start is not None else 0.0)
+        except TypeError:
+            # non-numeric target, e.g. an enum
+            t1 = t0
+        t2 = t1 + model.settle_time
+        self.add_status(group, self.now, ((self.now, t0, "overhead"), (t0, t1, "motion"), (t1, t2, "settle")))
+
+    def set(self, msg):
+        self.move(msg.obj, msg.args[0], msg.kwargs.get("group"))
+
+    def set_many(self, msg):
+        group = msg.kwargs.get("group")
+        for obj, target in zip(msg.args[::2], msg.args[1::2]):
+            self.move(obj, target, group)
+
+    def trigger(self, msg):
+        name = msg.obj.name
+        model = self.exposure.get(name)
+        if model is None:
+            if name not in self.motion:
+                self.unmodelled.add(name)
+            return
+        t0 = self.now + model.overhead
+        t1 = t0 + model.exposure_time
+        t2 = t1 + model.readout_time
+        group = msg.kwargs.get("group")
+        self.add_status(group, self.now, ((self.now, t0, "overhead"), (t0, t1, "exposure"), (t1, t2, "readout")))
+
+    def wait(self, msg):
+        status = self.groups.pop(msg.kwargs.get("group"), None)
+        if status is None or status[0] <= self.now:
+            return
+        now, breakdown = self.now, self.breakdown
+        for t0, t1, stage in status[1]:
+            if t1 > now:
+                breakdown[stage] += t1 - max(t0, now)
+        self.now = status[0]
+
+    def sleep(self, msg):
+        self.advance(msg.args[0], "sleep")
+
+    def advance(self, duration, stage):
+        self.now += duration
+        self.breakdown[stage] += duration
+
+    def save(self, msg):
+        exposure = self.breakdown["exposure"]
+        if self.last_save is not None:
+            self.step_time += self.now - self.last_save
+            self.step_exposure += exposure - self.last_exposure
+            self.num_steps += 1
+        self.last_save = self.now
+        self.last_exposure = exposure
+
+    def open_run(self, msg):
+        self.advance(self.run_overhead, "overhead")
+        self.run_start = self.last_save = self.now
+        self.last_exposure = self.breakdown["exposure"]
+
+    def close_run(self, msg):
+        if self.run_start is not None:
+            self.run_times.append(self.now - self.run_start)
+        self.run_start = self.last_save = None
+
+    def locate(self, msg):
+        position = self.positions.get(msg.obj.name)
+        if position is None:
+            return None
+        return {"setpoint": position, "readback": position}
+
+    def run(self, plan):
+        handlers = self.handlers
+        overhead = self.message_overhead
+        num_messages = 0
+        response = None
+        plan = iter(plan)
+        # plain iterables of messages, e.g. lists, cannot receive responses
+        send = getattr(plan, "send", None) or (lambda _: next(plan))
+        while True:
+            try:
+                msg = send(response)
+            except StopIteration:
+                break
+            num_messages += 1
+            if overhead:
+                self.advance(overhead, "overhead")
+            handler = handlers.get(msg.command)
+            response = handler(msg) if handler is not None else None
+        num_steps = self.num_steps
+        return DurationEstimate(
+            total_time=self.now,
+            breakdown=self.breakdown,
+            num_messages=num_messages,
+            num_steps=num_steps,
+            step_time=self.step_time / num_steps if num_steps else 0.0,
+            dead_time_per_step=(self.step_time - self.step_exposure) / num_steps if num_steps else 0.0,
+            run_times=self.run_times,
+            unmodelled=self.unmodelled,
+        )
+
+
+def estimate_duration(
+    plan,
+    models: Optional[Mapping[Any, Union[MotionModel, ExposureModel, Sequence]]] = None,
+    *,
+    initial_positions: Optional[Mapping[Any, Any]] = None,
+    message_overhead: float = 0.0,
+    run_overhead: float = 0.0,
+) -> DurationEstimate:
+    """
+    Estimate how long a plan will take, without executing it.
+
+    The plan is run against a virtual clock: each 'set' and 'trigger' starts
+    a simulated status which finishes according to the device's timing model,
+    and 'wait' advances the clock to the end of the slowest status in its
+    group. 'sleep' advances the clock by its duration. No event loop and no
+    hardware are involved, so this is fast even for plans with millions of
+    messages.
+
+    Like :func:`summarize_plan`, this cannot follow plans whose messages
+    depend on readings. 'locate' messages are answered with the virtual
+    position of the device, so relative plans work when
+    ``initial_positions`` is given; every other message receives None.
+
+    Parameters
+    ----------
+    plan : iterable
+        Must yield `Msg` objects
+    models : dict, optional
+        Maps devices (or their names) to a :class:`MotionModel`, an
+        :class:`ExposureModel`, or a sequence of both. Devices without a model
+        finish instantly and are listed in the ``unmodelled`` attribute of
+        the result.
+    initial_positions : dict, optional
+        Maps devices (or their names) to their position before the plan
+        starts. The first move of a device with no initial position is
+        assumed to involve no travel.
+    message_overhead : float, optional
+        Time the RunEngine spends processing each message.
+    run_overhead : float, optional
+        Time spent opening each run, e.g. for metadata and staging.
+
+    Returns
+    -------
+    estimate : DurationEstimate
+
+    Examples
+    --------
+    >>> estimate = estimate_duration(
+    ...     scan([det], motor, -1, 1, 100),
+    ...     {motor: MotionModel(velocity=0.5, acceleration=2, settle_time=0.05), det: ExposureModel(0.1)},
+    ...     initial_positions={motor: 0},
+    ... )
+    >>> print(estimate)
+    """
+    return _VirtualClock(models, initial_positions, message_overhead, run_overhead).run(plan)
 
 
 class RunEngineSimulator:
@@ -157,6 +621,9 @@ class RunEngineSimulator:
         self.callbacks: dict[int, tuple[Callable[[str, dict], None], str]] = {}
         self.next_callback_token: int = 0
         self.return_value: Any = None
+        # (command, obj name) -> the handlers that could match, in order of precedence
+        self._handler_index: dict[tuple[Any, Optional[str]], tuple[_MessageHandler, ...]] = {}
+        self._indexed_handlers: list[_MessageHandler] = []
 
     def add_handler_for_callback_subscribes(self):
         """Add a handler that registers all the callbacks from subscribe messages so we can call them later.
@@ -165,10 +632,12 @@ class RunEngineSimulator:
         """
         self.message_handlers.append(
             _MessageHandler(
-                lambda msg: msg.command == "subscribe",
+                None,
                 lambda msg: self._add_callback(msg.args),
+                commands=frozenset(["subscribe"]),
             )
         )
+        self._handler_index.clear()
 
     def add_handler(
         self,
@@ -203,15 +672,13 @@ class RunEngineSimulator:
         self.message_handlers.insert(
             cast(int, index if index != END else len(self.message_handlers)),
             _MessageHandler(
-                lambda msg: msg.command in commands
-                and (
-                    msg_filter is None
-                    or (callable(msg_filter) and msg_filter(msg))
-                    or (msg.obj and msg.obj.name == msg_filter)
-                ),
+                msg_filter if callable(msg_filter) else None,
                 handler,
+                commands=frozenset(commands),
+                obj_name=msg_filter if isinstance(msg_filter, str) else None,
             ),
         )
+        self._handler_index.clear()
 
     def add_read_handler_for(self, obj: Readable, value: Optional[Any]):
         """
@@ -385,6 +852,9 @@ class RunEngineSimulator:
         list[Msg]
             list of the messages generated by the plan
         """
+        if self._indexed_handlers != self.message_handlers:
+            # message_handlers was modified directly
+            self._handler_index.clear()
         messages = []
         send_value = None
         try:
@@ -392,15 +862,32 @@ class RunEngineSimulator:
                 send_value = None
                 messages.append(msg)
                 LOGGER.debug("<%s", msg)
-                if handler := next((h for h in self.message_handlers if h.predicate(msg)), None):
+                if handler := self._find_handler(msg):
                     send_value = handler.runnable(msg)
 
                 if send_value:
-                    LOGGER.debug(f">send {send_value}")
+                    LOGGER.debug(">send %s", send_value)
         except StopIteration as e:
             self.return_value = e.value
         return messages
 
+    def _find_handler(self, msg: Msg) -> Optional["_MessageHandler"]:
+        # The first handler in message_handlers that matches the message. The
+        # command and obj name checks are resolved once per (command, name)
+        # pair, so that only handlers with a predicate are tested per message.
+        key = (msg.command, getattr(msg.obj, "name", None))
+        candidates = self._handler_index.get(key)
+        if candidates is None:
+            if not self._handler_index:
+                self._indexed_handlers = list(self.message_handlers)
+            candidates = self._handler_index[key] = tuple(
+                h for h in self.message_handlers if h.could_match(msg.command, key[1])
+            )
+        for h in candidates:
+            if h.predicate is None or h.predicate(msg):
+                return h
+        return None
+
     def _add_callback(self, msg_args):
         self.callbacks[self.next_callback_token] = msg_args
         self.next_callback_token += 1
@@ -429,6 +916,22 @@ def assert_message_and_return_remaining(
 
 
 class _MessageHandler:
-    def __init__(self, p: Callable[[Msg], bool], r: Callable[[Msg], object]):
+    def __init__(
+        self,
+        p: Optional[Callable[[Msg], bool]],
+        r: Callable[[Msg], object],
+        commands: Optional[frozenset] = None,
+        obj_name: Optional[str] = None,
+    ):
+        # A message matches if its command is in commands (any if None), its
+        # obj has the name obj_name (any if None) and the predicate p is true
+        # (always if None).
         self.predicate = p
         self.runnable = r
+        self.commands = commands
+        self.obj_name = obj_name
+
+    def could_match(self, command, obj_name: Optional[str]) -> bool:
+        return (self.commands is None or command in self.commands) and (
+            self.obj_name is None or self.obj_name == obj_name
+        )
@@ -1,3 +1,4 @@
+import threading
 import time as ttime
 import warnings
 from datetime import datetime
@@ -9,7 +10,7 @@ from event_model import RunRouter
 import bluesky.plan_stubs as bps
 import bluesky.preprocessors as bpp
 from bluesky.callbacks.best_effort import BestEffortCallback
-from bluesky.plans import grid_scan, scan
+from bluesky.plans import count, grid_scan, scan
 from bluesky.preprocessors import SupplementalData
 from bluesky.tests.utils import DocCollector
 from bluesky.utils import new_uid
@@ -333,3 +334,55 @@ def test_many_motors(RE, hw):
     assert not bec._live_grids
     assert not bec._live_scatters
     assert bec._table is not None
+
+
+def test_refresh_rate(RE, hw, capsys):
+    det, motor = hw.det, hw.motor
+    expected = BestEffortCallback()
+    RE.subscribe(expected)
+    RE(scan([det], motor, -5, 5, 11))
+    expected_output = capsys.readouterr().out
+    RE.unsubscribe(0)
+
+    bec = BestEffortCallback(refresh_rate=10)
+    RE.subscribe(bec)
+    RE(scan([det], motor, -5, 5, 11))
+    worker = bec._worker
+    bec.flush()
+    if worker is not None:
+        worker.join(5)
+        assert not worker.is_alive()
+    assert bec._worker is None
+    assert not bec._queue
+
+    # the table matches, apart from the timestamps
+    def strip_times(text):
+        return [line.split("|")[3:] for line in text.splitlines() if line.startswith("|")]
+
+    assert strip_times(capsys.readouterr().out) == strip_times(expected_output)
+    assert bec.peaks["max"]["det"] == expected.peaks["max"]["det"]
+    (live_plot,) = bec._live_plots[next(iter(bec._live_plots))].values()
+    assert live_plot._min_frame_interval == 0.1
+    assert len(live_plot.y_data) == 11
+
+
+def test_refresh_rate_worker_ends_after_flush_takes_stop(RE, hw):
+    bec = BestEffortCallback(refresh_rate=2)
+    bec.disable_plots()
+    bec._worker = threading.current_thread()  # keep __call__ from starting the worker
+    RE(count([hw.det]), bec)
+    assert bec.flush() == "stop"
+
+    # A worker that finds the queue empty after the 'stop' has been taken ends.
+    worker = threading.Thread(target=bec._process_queue)
+    worker.start()
+    worker.join(5)
+    assert not worker.is_alive()
+    assert bec._worker is None
+
+
+def test_refresh_rate_needs_thread_safe_backend(monkeypatch):
+    monkeypatch.setattr("bluesky.callbacks.best_effort._backend_is_non_interactive", lambda: False)
+    with pytest.warns(UserWarning, match="refresh_rate is ignored"):
+        bec = BestEffortCallback(refresh_rate=10)
+    assert bec._refresh_rate is None
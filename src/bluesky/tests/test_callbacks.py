@@ -1,5 +1,6 @@
 import time
 from collections import defaultdict
+from datetime import datetime
 from enum import Enum
 from io import StringIO
 from itertools import permutations
@@ -8,7 +9,7 @@ from unittest.mock import MagicMock
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
-from event_model import DocumentNames, compose_run
+from event_model import DocumentNames, compose_run, pack_event_page
 
 import bluesky.plans as bp
 import bluesky.preprocessors as bpp
@@ -362,6 +363,39 @@ def test_live_fit(RE, hw):
         assert np.allclose(cb.result.values[k], v, atol=1e-6)
 
 
+@pytest.mark.parametrize("warm_start, background", [(True, False), (False, True), (True, True)])
+def test_live_fit_warm_start_and_background(RE, hw, warm_start, background):
+    try:
+        import lmfit
+    except ImportError:
+        raise pytest.skip("requires lmfit")  # noqa: B904
+
+    def gaussian(x, A, sigma, x0):
+        return A * np.exp(-((x - x0) ** 2) / (2 * sigma**2))
+
+    model = lmfit.Model(gaussian)
+    init_guess = {"A": 2, "sigma": lmfit.Parameter("sigma", 3, min=0), "x0": -0.2}
+    cb = LiveFit(
+        model, "det", {"x": "motor"}, init_guess, update_every=5, warm_start=warm_start, background=background
+    )
+    for _ in range(2):
+        RE(scan([hw.det], hw.motor, -1, 1, 50), cb)
+        # the final fit is on all of the data, whatever happened in between
+        assert len(cb.result.data) == 50
+        assert isinstance(cb.ydata, np.ndarray)
+        expected = {"A": 1, "sigma": 1, "x0": 0}
+        for k, v in expected.items():
+            assert np.allclose(cb.result.values[k], v, atol=1e-6)
+        if warm_start and not background:
+            # started from an earlier fit, not from init_guess
+            assert cb.result.init_values["A"] != 2
+
+    deadline = time.monotonic() + 5
+    while cb._fit_worker is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cb._fit_worker is None
+
+
 def test_live_fit_multidim(RE, hw):
     try:
         import lmfit
@@ -442,6 +476,47 @@ def test_interrupted_with_callbacks(RE, int_meth, stop_num, msg_num):
     assert len(RE.msg_hook.msgs) == msg_num
 
 
+def test_live_plot_throttle(RE, hw):
+    lplot = LivePlot("det", "motor", max_fps=1e-3)
+    RE(scan([hw.det], hw.motor, -1, 1, 50), lplot)
+    # the first event and the end of the run are drawn, the rest is merged
+    assert lplot.frame_stats["updates"] == 50
+    assert lplot.frame_stats["redraws"] == 2
+    assert lplot.frame_stats["dropped"] == 48
+    x, y = lplot.current_line.get_data()
+    assert isinstance(lplot.x_data, np.ndarray)
+    assert np.array_equal(x, np.linspace(-1, 1, 50))
+    assert np.array_equal(y, lplot.y_data)
+
+    lplot = LivePlot("det", "motor", max_fps=None)
+    RE(scan([hw.det], hw.motor, -1, 1, 5), lplot)
+    assert lplot.frame_stats == {"updates": 5, "redraws": 5, "dropped": 0, "draw_time": pytest.approx(0, abs=1)}
+
+
+def test_live_plot_decimation():
+    from bluesky.callbacks.mpl_plotting import _envelope
+
+    x = np.arange(100_000.0)
+    y = np.sin(x / 1000)
+    y[12345] = 10
+    y[54321] = np.nan
+    dx, dy = _envelope(x, y, 1000)
+    assert len(dx) <= 1000
+    assert np.all(np.diff(dx) > 0)
+    assert 12345 in dx and dy.max() == 10
+    assert dy.min() == pytest.approx(-1, abs=1e-4)
+    dx, dy = _envelope(x[:500], y[:500], 1000)
+    assert len(dx) == 500
+
+    lplot = LivePlot("det", max_display_points=100)
+    lplot("start", {"time": 0, "uid": "abc", "scan_id": 1})
+    for i in range(1000):
+        lplot("event", {"data": {"det": float(i % 7)}, "seq_num": i + 1, "time": i})
+    lplot._redraw()
+    assert len(lplot.x_data) == 1000
+    assert len(lplot.current_line.get_xdata()) <= 100
+
+
 def test_live_grid(RE, hw):
     hw.motor1.delay = 0
     hw.motor2.delay = 0
@@ -452,6 +527,34 @@ def test_live_grid(RE, hw):
         RE(grid_scan([hw.det4], hw.motor1, -3, 3, 6, hw.motor2, -5, 5, 10, False), LiveRaster((6, 10), "det4"))
 
 
+def test_live_grid_blit_and_limits():
+    grid = LiveGrid((3, 4), "det", max_fps=None)
+    grid("start", {"time": 0, "uid": "abcdef", "scan_id": 1})
+    blits = []
+    grid.ax.figure.canvas.blit = blits.append
+    values = [5, 3, 4, 4, 9, 1, 1, 1, 1, 1, 1, 1]
+    for seq_num, value in enumerate(values, start=1):
+        grid("event", {"data": {"det": value}, "seq_num": seq_num, "time": seq_num})
+        if seq_num > 1:
+            assert grid.im.get_clim() == (min(values[:seq_num]), max(values[:seq_num]))
+    # full redraws only when the color limits change
+    assert len(blits) == len(values) - 4
+    assert grid.frame_stats["redraws"] == len(values)
+    assert grid.im.get_animated()
+
+    # overwriting an extreme value rescans the image
+    grid.update((1, 0), 0)
+    assert grid._data_limits == (0, 5)
+    grid.update((0, 0), 2)
+    assert grid._data_limits == (0, 4)
+    grid._flush()
+    assert grid.im.get_clim() == (0, 4)
+
+    grid("stop", {"time": 1, "uid": "stop", "run_start": "abcdef", "exit_status": "success"})
+    assert not grid.im.get_animated()
+    np.testing.assert_array_equal(grid.im.get_array(), [[2, 3, 4, 4], [0, 1, 1, 1], [1, 1, 1, 1]])
+
+
 def test_live_grid_title(RE, hw):
     hw.motor1.delay = 0
     hw.motor2.delay = 0
@@ -590,6 +693,76 @@ def test_broken_table():
         assert ln.strip() == "failed to format row"
 
 
+@pytest.mark.parametrize("batch_output", [False, True])
+def test_table_event_page(batch_output):
+    start_doc, descriptor_factory, *_ = compose_run()
+    desc, compose_event, _ = descriptor_factory(
+        name="primary",
+        data_keys={
+            "x": {"dtype": "integer", "source": "", "shape": []},
+            "y": {"dtype": "number", "source": "", "shape": []},
+            "ok": {"dtype": "boolean", "source": "", "shape": [], "external": "FILESTORE:"},
+            "status": {"dtype": "string", "source": "", "shape": []},
+        },
+    )
+    events = [
+        compose_event(
+            data={"x": i, "y": i / 3, "ok": bool(i % 2), "status": TableTestEnum.OK},
+            timestamps=dict.fromkeys(("x", "y", "ok", "status"), 0),
+            filled={"ok": i != 3},
+        )
+        for i in range(7)
+    ]
+    events[4]["data"]["y"] = "aardvark"
+    for i, event in enumerate(events):
+        event["time"] = 1746210217 + i * 0.4
+
+    def table_lines(*docs, **kwargs):
+        calls = []
+        table = LiveTable(["x", "y", "ok", "status"], print_header_interval=3, out=calls.append, **kwargs)
+        for name, doc in [("start", start_doc), ("descriptor", desc), *docs]:
+            table(name, doc)
+        return calls, table._rows
+
+    expected, _ = table_lines(*(("event", event) for event in events))
+    calls, rows = table_lines(("event_page", pack_event_page(*events)), batch_output=batch_output)
+    assert rows == expected
+    if batch_output:
+        # the rows (and repeated headers) of the page are printed in one call
+        assert calls[4:] == ["\n".join(expected[4:])]
+    else:
+        assert calls == expected
+    assert expected[10].endswith("|          3 |      1.000 |            |         OK |")
+    assert expected[11].strip() == "failed to format row"
+    assert expected[6:9] == expected[1:4]  # header repeated every 3 rows
+
+
+def test_table_learns_plain_types_per_instance():
+    start_doc, descriptor_factory, *_ = compose_run()
+    desc, compose_event, _ = descriptor_factory(
+        name="primary", data_keys={"x": {"dtype": "number", "source": "", "shape": []}}
+    )
+    learning, other = LiveTable(["x"], out=lambda line: None), LiveTable(["x"], out=lambda line: None)
+    for table in (learning, other):
+        table("start", start_doc)
+        table("descriptor", desc)
+    learning("event", compose_event(data={"x": np.float64(1.5)}, timestamps={"x": 0}))
+    assert np.float64 in learning._plain_types
+    assert np.float64 not in other._plain_types
+
+
+def test_table_time_format():
+    table = LiveTable([])
+    for timestamp in [
+        1746210217.0,
+        1746210217.25,
+        1746210217.9999996,
+        1746210218.0000004,
+        *np.random.uniform(0, 2e9, 100),
+    ]:
+        assert table._format_time(timestamp) == str(datetime.fromtimestamp(timestamp).time())
+
+
 def test_callback_safe():
     @make_callback_safe
     def test_function(to_fail):
@@ -632,6 +632,35 @@ def test_clear_checkpoint(RE):
     assert RE.state == "idle"
 
 
+def test_max_msg_cache_size(RE):
+    RE.max_msg_cache_size = 3
+    reports = []
+
+    def plan():
+        yield Msg("checkpoint")
+        yield Msg("null")
+        yield Msg("null")
+        reports.append(RE.msg_cache_report())
+        yield Msg("null")
+        yield Msg("null")
+        reports.append(RE.msg_cache_report())
+        assert not RE.resumable
+        yield Msg("checkpoint")
+        assert RE.resumable
+        yield Msg("null")
+        reports.append(RE.msg_cache_report())
+
+    RE(plan())
+    assert [(r["messages"], r["overflowed"]) for r in reports] == [(2, False), (0, True), (1, False)]
+    assert reports[0]["max_messages"] == 3
+    assert reports[0]["nbytes"] > 0
+
+    # Pausing after an overflow behaves as if there were no checkpoint.
+    with pytest.raises(RunEngineInterrupted):
+        RE([Msg("checkpoint")] + [Msg("null")] * 4 + [Msg("pause"), "lies"])
+    assert RE.state == "idle"
+
+
 def test_interruption_exception(RE):
     with pytest.raises(RunEngineInterrupted):
         RE([Msg("checkpoint"), Msg("pause")])
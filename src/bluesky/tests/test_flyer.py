@@ -3,6 +3,7 @@ from collections import defaultdict
 from time import time
 
 import pytest
+from cycler import cycler
 from event_model.documents.event import PartialEvent
 from ophyd import Component as Cpt
 from ophyd import Device
@@ -20,7 +21,7 @@ from bluesky.plan_stubs import (
     open_run,
     wait,
 )
-from bluesky.plans import count, fly
+from bluesky.plans import count, fly, fly_scan_nd
 from bluesky.protocols import Preparable
 from bluesky.run_engine import IllegalMessageSequence
 from bluesky.tests import requires_ophyd
@@ -623,3 +624,88 @@ def test_kickoff_seperately_complete_all(RE):
     assert flyer2.call_counts["kickoff"] == 1
     assert flyer1.call_counts["complete"] == 1
     assert flyer2.call_counts["complete"] == 1
+
+
+class TrajectoryMotor:
+    """Motor that is prepared with its whole trajectory, then flies it."""
+
+    def __init__(self, name):
+        self.name = name
+        self.parent = None
+        self.positions = None
+
+    def prepare(self, value):
+        self.positions = list(value)
+        return NullStatus()
+
+    def kickoff(self):
+        return NullStatus()
+
+    def complete(self):
+        return NullStatus()
+
+
+class PointsDetector:
+    """Detector that is prepared with a number of points, then collects them."""
+
+    def __init__(self, name):
+        self.name = name
+        self.parent = None
+        self.num_points = None
+
+    def prepare(self, value):
+        self.num_points = value
+        return NullStatus()
+
+    def kickoff(self):
+        return NullStatus()
+
+    def complete(self):
+        return NullStatus()
+
+    def describe_collect(self):
+        return {self.name: {"dtype": "number", "shape": [], "source": self.name}}
+
+    def collect(self):
+        for i in range(self.num_points):
+            yield PartialEvent(data={self.name: i}, timestamps={self.name: time()}, time=time())
+
+
+def test_fly_scan_nd(RE):
+    motor = TrajectoryMotor("motor")
+    det = PointsDetector("det")
+    docs = DocCollector()
+
+    RE(fly_scan_nd([det], cycler(motor, [1, 2, 3])), docs.insert)
+
+    assert motor.positions == [1, 2, 3]
+    assert det.num_points == 3
+    (start,) = docs.start
+    assert start["plan_name"] == "fly_scan_nd"
+    assert start["scan_mode"] == "fly"
+    assert start["num_points"] == 3
+    ((desc,),) = docs.descriptor.values()
+    assert desc["name"] == "primary"
+    (page,) = docs.event[desc["uid"]]
+    assert page["data"]["det"] == [0, 1, 2]
+
+    # The data is emitted, not also returned to the plan.
+    collects = []
+    RE.msg_hook = lambda msg: collects.append(msg) if msg.command == "collect" else None
+    RE(fly_scan_nd([det], cycler(motor, [1, 2, 3])))
+    assert collects and all(msg.kwargs["return_payload"] is False for msg in collects)
+
+
+def test_fly_scan_nd_falls_back_to_step_scan(RE, hw):
+    docs = DocCollector()
+
+    RE(fly_scan_nd([hw.det], cycler(hw.motor, [1, 2, 3])), docs.insert)
+
+    (start,) = docs.start
+    assert start["plan_name"] == "fly_scan_nd"
+    assert start["scan_mode"] == "step"
+    ((desc,),) = docs.descriptor.values()
+    assert len(docs.event[desc["uid"]]) == 3
+
+    with pytest.raises(TypeError):
+        RE(fly_scan_nd([hw.det], cycler(hw.motor, [1, 2, 3]), fallback=False))
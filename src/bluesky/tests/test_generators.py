@@ -7,6 +7,7 @@ import pytest
 from bluesky import Msg
 from bluesky.preprocessors import (
     finalize_wrapper,
+    fused_plan_mutator,
     msg_mutator,
     pchain,
     plan_mutator,
@@ -382,6 +383,67 @@ def test_insert_after():
     EchoRE(plan_mutator(target(), insert_after))
 
 
+def _insert_around(command, label):
+    # A msg_proc that inserts messages before and after `command`.
+    def insert(msg):
+        if msg.command == command:
+
+            def pre():
+                yield Msg(f"pre_{label}", None)
+                return (yield msg)
+
+            def post():
+                yield Msg(f"post_{label}", None)
+
+            return pre(), post()
+        return None, None
+
+    return insert
+
+
+def test_fused_plan_mutator_matches_nested():
+    def target():
+        yield Msg("a", None)
+        ret = yield Msg("TARGET", None)
+        assert ret.command == "TARGET"
+        yield Msg("b", None)
+        return "done"
+
+    msg_procs = [
+        _insert_around("TARGET", "x"),
+        _insert_around("pre_x", "y"),
+        _insert_around("TARGET", "z"),
+    ]
+    nested = target()
+    for msg_proc in msg_procs:
+        nested = plan_mutator(nested, msg_proc)
+    expected = [msg.command for msg in EchoRE(nested)]
+    assert expected == [
+        "a",
+        "pre_y",
+        "pre_x",
+        "post_y",
+        "pre_z",
+        "TARGET",
+        "post_z",
+        "post_x",
+        "b",
+    ]
+
+    def outer():
+        ret = yield from fused_plan_mutator(target(), msg_procs)
+        assert ret == "done"
+
+    assert [msg.command for msg in EchoRE(outer())] == expected
+
+
+def test_plan_mutator_repeated_msg():
+    # The same Msg object yielded twice is processed both times.
+    msg = Msg("TARGET", None)
+    msgs = EchoRE(plan_mutator(ensure_generator([msg, msg]), _insert_around("TARGET", "x")))
+    assert [m.command for m in msgs] == ["pre_x", "TARGET", "post_x"] * 2
+
+
 def test_base_exception():
     class SnowFlake(Exception): ...
 
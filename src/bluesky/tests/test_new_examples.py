@@ -2,6 +2,7 @@ import asyncio
 import threading
 import time as ttime
 from collections import defaultdict
+from functools import partial
 from types import SimpleNamespace
 
 import pytest
@@ -33,11 +34,13 @@ from bluesky.plan_stubs import (
     pause,
     rd,
     read,
+    read_many,
     rel_set,
     remove_suspender,
     repeat,
     repeater,
     save,
+    set_many,
     sleep,
     stage,
     stage_all,
@@ -241,6 +244,175 @@ def test_locatable_message_multiple_objects(RE, hw):
     ]
 
 
+class AsyncReadable:
+    value = 1.0
+
+    def __init__(self, name):
+        self.name = name
+        self.parent = None
+
+    def describe(self) -> dict[str, Descriptor]:
+        return {self.name: dict(source="dummy", dtype="number", shape=[])}  # noqa: C408
+
+    async def read(self) -> dict[str, Reading]:
+        # Grab the original value
+        value = AsyncReadable.value
+        # Let any other coros get a look in
+        await asyncio.sleep(0)
+        # Increment the next value and return the original value
+        AsyncReadable.value += 1
+        return {self.name: dict(value=value, timestamp=0.0)}  # noqa: C408
+
+
+def test_read_many(RE):
+    one = AsyncReadable("one")
+    two = AsyncReadable("two")
+    AsyncReadable.value = 1.0
+    docs = defaultdict(list)
+    rds = []
+
+    def plan():
+        yield from open_run()
+        yield from create()
+        rds.append((yield from read_many(two, one)))
+        yield from save()
+        yield from close_run()
+
+    RE(plan(), lambda name, doc: docs[name].append(doc))
+    # Check they happened at the same time, so have the same value
+    assert rds == [
+        [
+            {"two": {"value": 1.0, "timestamp": 0.0}},
+            {"one": {"value": 1.0, "timestamp": 0.0}},
+        ]
+    ]
+    (descriptor,) = docs["descriptor"]
+    # The Descriptor is ordered as the objects were given
+    assert list(descriptor["object_keys"]) == ["two", "one"]
+    (event,) = docs["event"]
+    assert event["data"] == {"one": 1.0, "two": 1.0}
+
+
+def test_set_many_skips_moves_in_progress(RE, hw, monkeypatch):
+    from ophyd.sim import SynAxis
+
+    slow = SynAxis(name="slow", delay=0.2)
+    calls = []
+
+    def recording_set(motor, set, value):
+        calls.append((motor.name, value))
+        return set(value)
+
+    for motor in (hw.motor1, slow):
+        monkeypatch.setattr(motor, "set", partial(recording_set, motor, motor.set))
+    statuses = []
+
+    def plan():
+        first = yield from set_many(slow, 1, hw.motor1, 2)
+        statuses.append((yield from set_many(slow, 1, hw.motor1, 3, wait=True)))
+        assert first.done
+        # The move is done, so the same target is set again: the motor may
+        # have been moved by other means since.
+        slow.set(5).wait()
+        statuses.append((yield from set_many(slow, 1, wait=True)))
+
+    RE(plan())
+    assert calls == [("slow", 1), ("motor1", 2), ("motor1", 3), ("slow", 5), ("slow", 1)]
+    assert [len(status.statuses) for status in statuses] == [2, 1]
+    assert all(status.success for status in statuses)
+    assert (slow.position, hw.motor1.position) == (1, 3)
+
+
+def test_set_many_after_set(RE, hw):
+    from ophyd.sim import SynAxis
+
+    slow = SynAxis(name="slow", delay=0.2)
+    statuses = []
+
+    def plan():
+        statuses.append((yield from set_many(slow, 1)))
+        yield from abs_set(slow, 5)
+        statuses.append((yield from set_many(slow, 1, wait=True)))
+
+    RE(plan())
+    first, second = statuses
+    assert second.statuses[0] is not first.statuses[0]
+    assert RE._set_targets == {}
+
+
+def test_set_many_after_stop(RE, hw):
+    from ophyd.sim import SynAxis
+
+    slow = SynAxis(name="slow", delay=0.2)
+    statuses = []
+
+    def plan():
+        statuses.append((yield from set_many(slow, 1)))
+        yield from stop(slow)
+        statuses.append((yield from set_many(slow, 1, wait=True)))
+
+    RE(plan())
+    first, second = statuses
+    assert second.statuses[0] is not first.statuses[0]
+    assert slow.position == 1
+
+
+def test_concurrent_per_step_relative_scan(RE, hw):
+    hw.motor.set(5)
+    docs = defaultdict(list)
+    per_step = partial(one_nd_step, concurrent=True)
+    msgs = list(rel_scan([hw.det], hw.motor, 1, 2, 2, per_step=per_step))
+    assert [msg.command for msg in msgs].count("set_many") == 2
+
+    RE(rel_scan([hw.det], hw.motor, 1, 2, 2, per_step=per_step), lambda name, doc: docs[name].append(doc))
+    assert [event["data"]["motor"] for event in docs["event"]] == [6, 7]
+    assert hw.motor.position == 5
+
+
+def test_read_many_collision_adds_nothing(RE):
+    one = AsyncReadable("one")
+    other_one = AsyncReadable("one")
+
+    def plan():
+        yield from open_run()
+        yield from create()
+        try:
+            yield from read_many(one, other_one)
+        except ValueError:
+            pass
+        # The failed read_many left the bundle empty, so 'one' can be read
+        yield from read(one)
+        yield from save()
+        yield from close_run()
+
+    events = []
+    RE(plan(), lambda name, doc: events.append(doc) if name == "event" else None)
+    (event,) = events
+    assert list(event["data"]) == ["one"]
+
+
+def test_trigger_and_read_concurrent_reads(RE, hw):
+    msgs = list(trigger_and_read([hw.det, hw.motor], concurrent_reads=True))
+    assert [msg.command for msg in msgs] == ["trigger", "trigger", "wait", "create", "read_many", "save"]
+    assert msgs[4] == Msg("read_many", None, hw.det, hw.motor)
+
+    events = defaultdict(list)
+
+    def plan(concurrent_reads):
+        yield from open_run()
+        ret = yield from trigger_and_read([hw.det, hw.motor], concurrent_reads=concurrent_reads)
+        assert set(ret) == {"det", "motor", "motor_setpoint"}
+        yield from close_run()
+
+    for concurrent_reads in (False, True):
+        RE(plan(concurrent_reads), lambda name, doc, key=concurrent_reads: events[key].append((name, doc)))
+    (_, sequential), (_, concurrent) = (
+        next(item for item in events[key] if item[0] == "descriptor") for key in (False, True)
+    )
+    assert sequential["object_keys"] == concurrent["object_keys"]
+    assert sequential["data_keys"] == concurrent["data_keys"]
+
+
 def test_rd_locatable(RE, hw):
     class Jittery(Readable, Locatable):
         def describe(self) -> dict[str, Descriptor]:
@@ -417,6 +589,23 @@ def test_lazily_stage(hw: SimpleNamespace):
     assert len(groups) == 1  # All unstage messages are in the same group
 
 
+def test_lazily_stage_read_many(hw: SimpleNamespace):
+    det1, det2 = hw.det1, hw.det2
+
+    def plan():
+        yield from [Msg("read", det1), Msg("read_many", None, det1, det2)]
+
+    processed_plan = list(lazily_stage_wrapper(plan()))
+    assert [(msg.command, msg.obj) for msg in processed_plan] == [
+        ("stage", det1),
+        ("read", det1),
+        ("stage", det2),
+        ("read_many", None),
+        ("unstage", det2),
+        ("unstage", det1),
+    ]
+
+
 def test_subs():
     def cb(name, doc):
         pass
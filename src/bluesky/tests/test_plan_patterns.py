@@ -3,13 +3,25 @@ import itertools
 import numpy as np
 import numpy.testing as npt
 import pytest
+from cycler import cycler
 
 from bluesky.plan_patterns import (
     OuterProductArgsPattern,
+    Trajectory,
     chunk_outer_product_args,
     classify_outer_product_args_pattern,
+    optimize_path,
     outer_product,
+    refine_points,
+    snake_trajectories,
+    spiral,
+    spiral_fermat,
+    spiral_fermat_trajectory,
+    spiral_square_pattern,
+    spiral_square_trajectory,
+    spiral_trajectory,
 )
+from bluesky.utils import snake_cyclers
 
 
 @pytest.mark.parametrize(
@@ -427,3 +439,109 @@ def test_outer_product(hw, args):
             positions_expected[name],
             err_msg=f"Expected and actual positions for the motor '{name}' don't match",
         )
+
+
+@pytest.mark.parametrize(
+    "pattern, trajectory, args, kwargs",
+    [
+        (spiral, spiral_trajectory, (0.5, -0.2, 2, 1, 0.07, 3.5), {"dr_y": 0.1, "tilt": 0.3}),
+        (spiral_fermat, spiral_fermat_trajectory, (0.5, -0.2, 2, 1, 0.07, 2.5), {"dr_y": 0.1, "tilt": 0.3}),
+        (spiral_square_pattern, spiral_square_trajectory, (1, 2, 3, 1, 7, 10), {}),
+        (spiral_square_pattern, spiral_square_trajectory, (0, 0, 1, 2, 2, 9), {}),
+    ],
+)
+def test_trajectory_matches_cycler(hw, pattern, trajectory, args, kwargs):
+    cyc = pattern(hw.motor1, hw.motor2, *args, **kwargs)
+    traj = trajectory(hw.motor1, hw.motor2, *args, **kwargs)
+    assert isinstance(traj, Trajectory)
+    assert len(traj) == len(cyc)
+    assert traj.keys == [hw.motor1, hw.motor2]
+    assert list(traj) == list(cyc)
+
+
+def test_trajectory_products(hw):
+    a = cycler(hw.motor, [1, 2, 3])
+    b = cycler(hw.motor1, [4, 5]) + cycler(hw.motor2, [6, 7])
+    c = cycler(hw.motor3, [8, 9, 10])
+
+    traj = Trajectory.from_cycler(a) * Trajectory.from_cycler(b)
+    assert list(traj) == list(a * b)
+    assert list(Trajectory.from_cycler(b) + cycler(hw.motor3, [0, 1])) == list(b + cycler(hw.motor3, [0, 1]))
+
+    snaking = [False, True, True]
+    traj = snake_trajectories([Trajectory.from_cycler(x) for x in (a, b, c)], snaking)
+    assert list(traj) == list(snake_cyclers([a, b, c], snaking))
+    assert list(traj.to_cycler()) == list(traj)
+
+    with pytest.raises(ValueError):
+        Trajectory({hw.motor1: [1, 2], hw.motor2: [1, 2, 3]})
+    with pytest.raises(ValueError):
+        Trajectory.from_cycler(a) + Trajectory.from_cycler(b)
+
+
+def test_trajectory_iterates_in_chunks(hw):
+    traj = Trajectory({hw.motor1: np.arange(10), hw.motor2: np.arange(10) * 2})
+    traj.chunk_size = 3
+    assert list(traj) == [{hw.motor1: i, hw.motor2: 2 * i} for i in range(10)]
+
+
+def test_trajectory_describe(hw):
+    traj = spiral_fermat_trajectory(hw.motor1, hw.motor2, 0, 0, 1, 1, 0.1, 1.0)
+    description = traj.describe()
+    assert description["spec"]["pattern"] == "spiral_fermat"
+    assert description["spec"]["args"]["dr"] == 0.1
+    assert description["shape"] == [len(traj)]
+    assert description["num_points"] == len(traj)
+    assert description["motors"] == ["motor1", "motor2"]
+    assert description["bounds"]["motor1"] == [min(traj.by_key()[hw.motor1]), max(traj.by_key()[hw.motor1])]
+    assert description["hash"] == spiral_fermat_trajectory(hw.motor1, hw.motor2, 0, 0, 1, 1, 0.1, 1.0).hash
+    assert description["hash"] != spiral_fermat_trajectory(hw.motor1, hw.motor2, 0, 0, 1, 1, 0.2, 1.0).hash
+
+    grid = Trajectory({hw.motor1: [1, 2, 3]}, spec={"pattern": "a"}) * Trajectory(
+        {hw.motor2: [4, 5]}, spec={"pattern": "b"}
+    )
+    assert grid.shape == (3, 2)
+    assert grid.describe()["spec"] == {"pattern": "outer_product", "parts": [{"pattern": "a"}, {"pattern": "b"}]}
+    with pytest.raises(ValueError):
+        Trajectory({hw.motor1: [1, 2, 3]}, shape=(2, 2))
+
+
+def test_optimize_path():
+    rng = np.random.default_rng(0)
+    positions = {"x": rng.uniform(0, 10, 200), "y": rng.uniform(0, 10, 200)}
+
+    def move_time(order, velocities):
+        steps = np.column_stack([np.diff(positions[k][order]) / velocities[k] for k in positions])
+        return np.abs(steps).max(axis=1).sum()
+
+    order = optimize_path(positions)
+    assert order[0] == 0
+    assert sorted(order) == list(range(200))
+    unit = {"x": 1, "y": 1}
+    assert move_time(order, unit) < move_time(np.arange(200), unit) / 3
+
+    # A slow motor changes which order is best.
+    slow_y = {"x": 1, "y": 0.01}
+    weighted = optimize_path(positions, slow_y)
+    assert move_time(weighted, slow_y) < move_time(order, slow_y)
+
+    assert list(optimize_path({"x": [3, 1]})) == [0, 1]
+
+
+def test_refine_points():
+    x = np.linspace(-5, 5, 11)
+    y = np.exp(-(x**2) / 2)
+    new = refine_points(x, y, num=3, min_step=0.01)
+    assert len(new) == 3
+    # the largest errors of linear interpolation are at the peak
+    assert {-0.5, 0.5} <= set(new)
+    assert set(new) <= set(x[:-1] + 0.5)
+    # intervals wider than max_step are split first
+    assert list(refine_points([0, 1, 5], [0, 1, 2], num=1, min_step=0.01, max_step=2)) == [3]
+    # converged: a straight line needs no refinement
+    assert len(refine_points(x, 2 * x, num=3, min_step=0.01)) == 0
+    # nor does anything finer than min_step
+    assert len(refine_points(x, y, num=3, min_step=1)) == 0
+
+    peak = refine_points(x, y + 0.5 * (x > 3), num=1, min_step=0.01, focus="peak")
+    assert abs(peak[0]) < 1
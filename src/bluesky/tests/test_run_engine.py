@@ -486,6 +486,70 @@ def test_stage_and_unstage_status_objects(RE):
     assert 2 <= stop - start < 3
 
 
+class SlowStageable:
+    """Blocks for a while in stage/unstage and records the order of the calls."""
+
+    def __init__(self, name, log, parent=None, delay=0.2):
+        self.name = name
+        self.parent = parent
+        self._log = log
+        self._delay = delay
+
+    def stage(self):
+        self._log.append(("stage", self.name))
+        ttime.sleep(self._delay)
+        return [self]
+
+    def unstage(self):
+        self._log.append(("unstage", self.name))
+        ttime.sleep(self._delay)
+        return [self]
+
+
+def test_stage_all_concurrent(RE):
+    from bluesky.plan_stubs import stage_all, unstage_all
+
+    log = []
+    devices = [SlowStageable(f"d{i}", log) for i in range(5)]
+
+    def plan():
+        yield from stage_all(*devices, concurrent=True)
+        assert RE._staged == set(devices)
+        yield from unstage_all(*devices, concurrent=True)
+        assert not RE._staged
+
+    start = ttime.monotonic()
+    RE(plan())
+    # 10 calls of 0.2 s each, made 5 at a time
+    assert ttime.monotonic() - start < 1.5
+    assert sorted(log) == sorted([("stage", d.name) for d in devices] + [("unstage", d.name) for d in devices])
+
+
+def test_stage_all_parent_child_order_and_limit(RE):
+    log = []
+    parent = SlowStageable("parent", log, delay=0.05)
+    child = SlowStageable("child", log, parent=parent, delay=0.05)
+    other = SlowStageable("other", log, delay=0.05)
+
+    RE.max_concurrent_stage = 1
+    RE([Msg("stage_all", None, child, other, parent), Msg("unstage_all", None, parent, other, child)])
+    stage_order = [name for action, name in log if action == "stage"]
+    unstage_order = [name for action, name in log if action == "unstage"]
+    assert stage_order.index("parent") < stage_order.index("child")
+    assert unstage_order.index("child") < unstage_order.index("parent")
+
+
+def test_stage_all_unstaged_on_abort(RE):
+    log = []
+    devices = [SlowStageable(f"d{i}", log, delay=0.01) for i in range(3)]
+
+    with pytest.raises(RunEngineInterrupted):
+        RE([Msg("stage_all", None, *devices), Msg("pause")])
+    RE.abort()
+    assert sorted(name for action, name in log if action == "unstage") == ["d0", "d1", "d2"]
+    assert not RE._staged
+
+
 def test_bad_call_args(RE):
     with pytest.raises(Exception):  # noqa: B017
         RE(53)
@@ -1650,6 +1714,27 @@ def test_filled(RE, hw, db):
     RE(count([hw.img]), collect)
     (event,) = collector
     assert event["filled"] == {"img": False}
+    collector.clear()
+
+    # The filled template is shared by the stream, not by its Events.
+    RE(count([hw.img], num=2), collect)
+    first, second = collector
+    assert first["filled"] == second["filled"] == {"img": False}
+    assert first["filled"] is not second["filled"]
+
+
+def test_colliding_data_keys(RE, hw):
+    def plan():
+        yield Msg("open_run")
+        yield Msg("create", name="primary")
+        yield Msg("read", hw.det)
+        yield Msg("read", hw.motor)
+        yield Msg("read", hw.det)
+        yield Msg("save")
+        yield Msg("close_run")
+
+    with pytest.raises(ValueError, match="collide"):
+        RE(plan())
 
 
 def test_double_call(RE):
@@ -2220,6 +2305,139 @@ def test_configure_multiple_descritpors(RE):
     assert stop["num_events"]["primary"] == 2
 
 
+class CountingConfigurable:
+    """A readable, configurable object that counts describe/configuration calls."""
+
+    def __init__(self, name):
+        self.name = name
+        self.parent = None
+        self.calls = defaultdict(int)
+        self.exposure = 1.0
+        self.token = 0
+
+    def describe(self):
+        self.calls["describe"] += 1
+        return {self.name: {"source": "dummy", "dtype": "number", "shape": []}}
+
+    def read(self):
+        return {self.name: {"value": 0.0, "timestamp": 0.0}}
+
+    def describe_configuration(self):
+        self.calls["describe_configuration"] += 1
+        return {f"{self.name}_exposure": {"source": "dummy", "dtype": "number", "shape": []}}
+
+    def read_configuration(self):
+        self.calls["read_configuration"] += 1
+        return {f"{self.name}_exposure": {"value": self.exposure, "timestamp": 0.0}}
+
+    def configure(self, exposure):
+        old = self.read_configuration()
+        self.exposure = exposure
+        return old, self.read_configuration()
+
+
+def test_describe_cache_across_runs(RE):
+    from bluesky.bundlers import DescribeCache
+
+    det = CountingConfigurable("det")
+    descriptors = []
+    RE.describe_cache = DescribeCache()
+
+    def collect(name, doc):
+        if name == "descriptor":
+            descriptors.append(doc)
+
+    RE(count([det]), collect)
+    RE(count([det]), collect)
+    assert det.calls == {"describe": 1, "describe_configuration": 1, "read_configuration": 2}
+    assert descriptors[0]["data_keys"] == descriptors[1]["data_keys"]
+    assert descriptors[0]["data_keys"] is not descriptors[1]["data_keys"]
+
+    # Configuration values are read again in every run, however they changed.
+    det.exposure = 3.0
+    RE(count([det]), collect)
+    assert descriptors[-1]["configuration"]["det"]["data"] == {"det_exposure": 3.0}
+    assert det.calls["describe_configuration"] == 1
+
+    # A 'configure' message invalidates the cached output for that object.
+    RE(configure(det, 2.0))
+    RE(count([det]), collect)
+    assert det.calls["describe_configuration"] == 2
+    assert descriptors[-1]["configuration"]["det"]["data"] == {"det_exposure": 2.0}
+
+    # So does clearing the cache.
+    RE.describe_cache.clear()
+    RE(count([det]), collect)
+    assert det.calls["describe"] == 3
+
+
+def test_describe_cache_token(RE):
+    from bluesky.bundlers import DescribeCache
+    from bluesky.protocols import HasCacheToken
+
+    class TokenConfigurable(CountingConfigurable):
+        def cache_token(self):
+            return self.token
+
+    det = TokenConfigurable("det")
+    assert isinstance(det, HasCacheToken)
+    RE.describe_cache = DescribeCache()
+
+    RE(count([det]))
+    RE(count([det]))
+    assert det.calls["describe"] == 1
+
+    # The device reports that it changed outside of a 'configure' message.
+    det.token += 1
+    RE(count([det]))
+    assert det.calls["describe"] == 2
+
+
+class CountingStageable(CountingConfigurable):
+    def stage(self):
+        self.calls["stage"] += 1
+        return [self]
+
+    def unstage(self):
+        self.calls["unstage"] += 1
+        return [self]
+
+
+def test_run_many(RE):
+    det = CountingStageable("det")
+    docs = defaultdict(list)
+
+    uids = RE.run_many((count([det], 2) for _ in range(3)), lambda name, doc: docs[name].append(doc), batch="a")
+    if RE._call_returns_result:
+        uids = uids.run_start_uids
+    assert len(uids) == len(docs["start"]) == len(docs["stop"]) == 3
+    assert [start["batch"] for start in docs["start"]] == ["a"] * 3
+    assert all(stop["exit_status"] == "success" for stop in docs["stop"])
+    assert len(docs["event"]) == 6
+    assert det.calls["stage"] == det.calls["unstage"] == 3
+    assert det.calls["describe"] == 3
+    assert RE.describe_cache is None
+
+    RE.run_many([count([det]), count([det])], keep_staged=True, reuse_describe=True)
+    assert det.calls["stage"] == det.calls["unstage"] == 4
+    assert det.calls["describe"] == 4
+    assert RE.describe_cache is None
+
+
+def test_run_many_records_configuration_set_between_runs(RE, hw):
+    def plan(sigma):
+        yield from abs_set(hw.det.sigma, sigma, wait=True)
+        return (yield from count([hw.det]))
+
+    descriptors = []
+    RE.run_many(
+        [plan(1.0), plan(7.0)],
+        lambda name, doc: descriptors.append(doc) if name == "descriptor" else None,
+        reuse_describe=True,
+    )
+    assert [d["configuration"]["det"]["data"]["det_sigma"] for d in descriptors] == [1.0, 7.0]
+
+
 def test_sync_scan_id_source(RE):
     def sync_scan_source(md: dict) -> int:
         return 314159
@@ -487,6 +487,38 @@ def test_tune_centroid(RE, hw):
         RE(scan5)
 
 
+def test_batch_adaptive_scan(RE, hw):
+    actual_traj = []
+    col = collector("motor", actual_traj)
+    RE(bp.batch_adaptive_scan([hw.det], "det", hw.motor, -5, 5, 0.01, 1, batch_size=4), {"event": col})
+    assert actual_traj[:5] == [-5, -2.5, 0, 2.5, 5]
+    assert all(-5 <= x <= 5 for x in actual_traj)
+    assert min(np.diff(sorted(actual_traj))) >= 0.01
+    assert max(np.diff(sorted(actual_traj))) <= 1
+    # far fewer points than a uniform scan at the finest spacing used
+    assert len(actual_traj) < 10 / min(np.diff(sorted(actual_traj))) / 2
+
+    finer_traj = []
+    col = collector("motor", finer_traj)
+    RE(bp.batch_adaptive_scan([hw.det], "det", hw.motor, -5, 5, 0.01, 1, tolerance=0.001), {"event": col})
+    assert len(finer_traj) > len(actual_traj)
+
+    with pytest.raises(ValueError):
+        RE(bp.batch_adaptive_scan([hw.det], "det", hw.motor, -5, 5, 0.01, 1, focus="valley"))
+
+
+def test_rel_batch_adaptive_scan_peak(RE, hw):
+    hw.motor.set(1)
+    actual_traj = []
+    col = collector("motor", actual_traj)
+    plan = bp.rel_batch_adaptive_scan([hw.det], "det", hw.motor, -4, 3, 0.01, 1, focus="peak", max_points=40)
+    RE(plan, {"event": col})
+    assert actual_traj[0] == -3
+    assert len(actual_traj) <= 40
+    # SynGauss 'det' peaks at motor = 0; the motor is left at the peak
+    assert abs(hw.motor.position) < 0.02
+
+
 def test_count(RE, hw):
     det = hw.det
     motor = hw.motor
@@ -748,3 +780,32 @@ def test_rel_spiral_square(RE, hw):
     plan = bp.rel_spiral_square([det], motor1, motor2, x_range=3, y_range=4, x_num=3 * 2 + 1, y_num=4 * 2 + 1)
 
     approx_multi_traj_checker(RE, plan, square_spiral_data, decimal=2)
+
+
+def test_scan_nd_trajectory_metadata(RE, hw):
+    from bluesky.plan_patterns import Trajectory
+
+    traj = Trajectory({hw.motor1: np.linspace(0, 1, 4)}) * Trajectory({hw.motor2: [1.0, 2.0]})
+    docs = []
+    RE(bp.scan_nd([hw.det], traj), lambda name, doc: docs.append((name, doc)))
+    start = docs[0][1]
+    assert start["num_points"] == 8
+    assert start["plan_args"]["cycler"] == traj.describe()
+    assert start["plan_args"]["cycler"]["shape"] == [4, 2]
+    events = [doc for name, doc in docs if name == "event"]
+    assert [(ev["data"]["motor1"], ev["data"]["motor2"]) for ev in events] == [
+        (step[hw.motor1], step[hw.motor2]) for step in traj
+    ]
+
+
+def test_list_scan_optimize_path(RE, hw):
+    docs = []
+    RE(
+        bp.list_scan([hw.det], hw.motor1, [0, 5, 1, 4, 2], hw.motor2, [0, 5, 1, 4, 2], optimize_path=True),
+        lambda name, doc: docs.append((name, doc)),
+    )
+    start = docs[0][1]
+    assert start["point_order"] == [0, 2, 4, 3, 1]
+    assert start["num_points"] == 5
+    events = [doc for name, doc in docs if name == "event"]
+    assert [ev["data"]["motor1"] for ev in events] == [0, 1, 2, 4, 5]
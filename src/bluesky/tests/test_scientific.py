@@ -134,3 +134,31 @@ def test_peak_statistics_with_derivatives(RE):
     assert len(ps.derivative_stats.x) == num_points - 1
     assert len(ps.derivative_stats.y) == num_points - 1
     assert np.allclose(np.diff(ps.y_data), ps.derivative_stats.y, atol=1e-10)
+
+
+def test_peak_statistics_snapshot(RE):
+    """running statistics match a full computation at every step"""
+    ps = PeakStats("motor", "det")
+    assert ps.snapshot() is None
+    snapshots = []
+
+    def check(name, doc):
+        if name == "event":
+            snapshots.append((ps.snapshot(full=False), ps.snapshot()))
+
+    RE(scan([det], motor, -5, 3, 41), {"all": [ps, check]})
+    assert not ps._events
+    for quick, full in snapshots:
+        assert quick.min == full.min
+        assert quick.max == full.max
+        assert np.isclose(quick.com, full.com)
+        assert quick.cen is None
+    assert snapshots[-1][1].cen == ps.cen
+    assert np.array_equal(snapshots[-1][1].crossings, ps.crossings)
+
+    # the maximum follows the scan up to the peak
+    assert snapshots[0][0].max[0] == -5
+    assert snapshots[-1][0].max[0] == 0
+
+    ps.reset()
+    assert ps.snapshot() is None
@@ -1,3 +1,5 @@
+import threading
+import time as ttime
 import uuid
 from collections.abc import Generator
 from functools import partial
@@ -14,9 +16,13 @@ from bluesky import Msg
 from bluesky.plans import grid_scan, scan
 from bluesky.simulators import (
     END,
+    ExposureModel,
+    MotionModel,
     RunEngineSimulator,
     assert_message_and_return_remaining,
     check_limits,
+    check_limits_many,
+    estimate_duration,
     plot_raster_path,
     print_summary,
     print_summary_wrapper,
@@ -79,6 +85,63 @@ def test_check_limits(RE, hw):
     check_limits(scan([det], motor, -1, 1, 3))
 
 
+class LimitedMotor:
+    def __init__(self, name, limits, delay=0.0):
+        self.name = name
+        self.parent = None
+        self.limits = limits
+        self.delay = delay
+        self.checked = []
+        self.in_progress = self.max_in_progress = 0
+        self._lock = threading.Lock()
+
+    def set(self, value): ...
+
+    def check_value(self, value):
+        with self._lock:
+            self.checked.append(value)
+            self.in_progress += 1
+            self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        ttime.sleep(self.delay)
+        with self._lock:
+            self.in_progress -= 1
+        low, high = self.limits
+        if not low <= value <= high:
+            raise ValueError(f"{self.name}: {value} outside of {self.limits}")
+
+
+class AsyncLimitedMotor(LimitedMotor):
+    async def check_value(self, value):
+        LimitedMotor.check_value(self, value)
+
+
+def test_check_limits_many(RE, hw):
+    motor = LimitedMotor("motor", (-5, 5), delay=0.05)
+    amotor = AsyncLimitedMotor("amotor", (0, 1))
+    plans = [
+        scan([hw.det], motor, -2, 2, 5),
+        scan([hw.det], motor, -2, 2, amotor, 0, 1, 5),
+        bp.list_scan([hw.det], motor, [1, 2, 6, 7]),
+        bp.list_scan([hw.det], amotor, [0.5, 2]),
+    ]
+    cache = {}
+    errors = check_limits_many(plans, max_concurrent=4, cache=cache)
+    assert errors[:2] == [None, None]
+    assert "motor: 6 outside" in str(errors[2])
+    assert "amotor: 2 outside" in str(errors[3])
+    # every distinct setpoint is checked once, several at a time
+    assert sorted(motor.checked) == [-2, -1, 0, 1, 2, 6, 7]
+    assert 1 < motor.max_in_progress <= 4
+    assert sorted(amotor.checked) == [0, 0.25, 0.5, 0.75, 1, 2]
+
+    with pytest.raises(ValueError, match="motor: 6 outside"):
+        check_limits(bp.list_scan([hw.det], motor, [1, 2, 6, 7]))
+    motor.checked.clear()
+    plans = [scan([hw.det], motor, -2, 2, 5), bp.list_scan([hw.det], motor, [1, 2, 6, 7])]
+    assert check_limits_many(plans, cache=cache)[1] is errors[2]
+    assert motor.checked == []
+
+
 def test_check_limits_needs_RE():
     with pytest.raises(RuntimeError) as ctx:
         check_limits([])
@@ -93,6 +156,48 @@ def test_plot_raster_path(hw):
     plot_raster_path(plan, "motor1", "motor2", probe_size=0.3)
 
 
+def test_plot_raster_path_point_order(hw):
+    plan = bp.list_scan([hw.det], hw.motor1, [0, 5, 1, 4, 2], hw.motor2, [0, 5, 1, 4, 2], optimize_path=True)
+    ret = plot_raster_path(plan, "motor1", "motor2", label_points=True)
+    assert [label.get_text() for label in ret["labels"]] == ["0", "2", "4", "3", "1"]
+    assert [label.xy for label in ret["labels"]] == [(0, 0), (1, 1), (2, 2), (4, 4), (5, 5)]
+
+
+def test_motion_model():
+    model = MotionModel(velocity=2, acceleration=4)
+    # trapezoidal: 1 s to accelerate and decelerate, then cruise
+    assert isclose(model.move_time(-10), 10 / 2 + 2 / 4)
+    # triangular: never reaches full speed
+    assert isclose(model.move_time(0.25), 2 * (0.25 / 4) ** 0.5)
+    assert MotionModel(velocity=2).move_time(3) == 1.5
+    with pytest.raises(ValueError):
+        MotionModel(velocity=0)
+
+
+def test_estimate_duration(hw):
+    det, motor = hw.det, hw.motor
+    models = {motor: MotionModel(velocity=1, settle_time=0.1), "det": ExposureModel(0.5)}
+    estimate = estimate_duration(scan([det], motor, -1, 1, 5), models, initial_positions={motor: 0})
+    # travel 1 + 4 * 0.5, settle 5 * 0.1, expose 5 * 0.5
+    assert isclose(estimate.total_time, 6.0)
+    assert isclose(estimate.breakdown["motion"], 3.0)
+    assert isclose(estimate.breakdown["settle"], 0.5)
+    assert isclose(estimate.breakdown["exposure"], 2.5)
+    assert sum(estimate.breakdown.values()) == pytest.approx(estimate.total_time)
+    assert estimate.num_steps == 5
+    assert isclose(estimate.step_time, 1.2)
+    assert isclose(estimate.dead_time_per_step, 0.7)
+    assert estimate.run_times == pytest.approx([6.0])
+    assert not estimate.unmodelled
+    assert "6.000 s" in str(estimate)
+
+    plan = [Msg("sleep", None, 2)] * 3 + [Msg("trigger", det, group="g"), Msg("wait", group="g")]
+    estimate = estimate_duration(plan, message_overhead=0.01)
+    assert isclose(estimate.total_time, 6.05)
+    assert isclose(estimate.breakdown["sleep"], 6)
+    assert estimate.unmodelled == {"det"}
+
+
 def test_simulator_simulates_simple_plan():
     def simple_plan() -> Generator[Msg, Any, Any]:
         yield from bps.null()
@@ -141,6 +246,33 @@ def test_simulator_add_handler_append_with_index(hw, insert_order, expected):
     assert result == expected
 
 
+def test_simulator_handler_precedence(hw):
+    def plan():
+        values = []
+        for obj in (hw.det, hw.det1, hw.motor):
+            reading = yield Msg("read", obj)
+            values.append(reading)
+        return values
+
+    sim = RunEngineSimulator()
+    sim.add_handler("read", lambda msg: "any")
+    sim.add_handler(["read", "trigger"], lambda msg: "det1", "det1")
+    sim.add_handler("read", lambda msg: "callable", lambda msg: msg.obj is hw.motor)
+    sim.add_handler("read", lambda msg: "last", index=END)
+    sim.simulate_plan(plan())
+    assert sim.return_value == ["any", "det1", "callable"]
+
+    # handlers added between simulations take effect
+    sim.add_handler("read", lambda msg: "det", "det")
+    sim.simulate_plan(plan())
+    assert sim.return_value == ["det", "det1", "callable"]
+
+    # as does modifying the list of handlers directly
+    del sim.message_handlers[:2]
+    sim.simulate_plan(plan())
+    assert sim.return_value == ["any", "det1", "any"]
+
+
 def test_simulator_add_read_handler_for(hw):
     def trigger_and_return_position():
         yield from bps.trigger(hw.ab_det)
@@ -2,6 +2,7 @@ import math
 
 import numpy as np
 import pytest
+from event_model import DocumentNames
 
 from bluesky.callbacks import CallbackCounter
 from bluesky.callbacks.stream import LiveDispatcher
@@ -137,3 +138,94 @@ def test_average_stream(RE, hw):
     assert evt["data"]["motor_setpoint"] == -0.5  # mean of range(-5, 5)
     assert start_uid in d.stop
     assert d.stop[start_uid]["num_events"] == {"primary": 1}
+
+
+def test_event_page_stream():
+    from event_model import compose_run, pack_event_page, unpack_event_page
+    from jsonschema.exceptions import ValidationError
+
+    run = compose_run()
+    desc = run.compose_descriptor(
+        name="primary",
+        data_keys={key: {"source": "", "dtype": "number", "shape": []} for key in ("det", "motor")},
+    )
+
+    def make_events():
+        # NegativeStream modifies the Events it receives, so make new ones
+        return [
+            desc.compose_event(data={"det": -float(i), "motor": float(i)}, timestamps={"det": 0, "motor": 0})
+            for i in range(6)
+        ]
+
+    def emitted(*docs):
+        ss = NegativeStream()
+        names, events = [], []
+
+        def collect(name, doc):
+            names.append(name)
+            if name == "event":
+                events.append(doc)
+            elif name == "event_page":
+                events.extend(unpack_event_page(doc))
+
+        ss.subscribe(collect)
+        for name, doc in [("start", run.start_doc), ("descriptor", desc.descriptor_doc), *docs]:
+            ss(name, doc)
+        return names, events
+
+    names, expected = emitted(*(("event", event) for event in make_events()))
+    assert names == ["start", "descriptor"] + ["event"] * 6
+    events = make_events()
+    names, received = emitted(
+        ("event_page", pack_event_page(*events[:4])), ("event_page", pack_event_page(*events[4:]))
+    )
+    # each EventPage in gives one EventPage out
+    assert names == ["start", "descriptor", "event_page", "event_page"]
+    assert [evt["data"] for evt in received] == [evt["data"] for evt in expected]
+    assert [evt["seq_num"] for evt in received] == list(range(1, 7))
+    assert len({evt["uid"] for evt in received}) == 6
+    assert len({evt["descriptor"] for evt in received}) == 1
+
+    # new data keys get a new descriptor, emitted before the events using it
+    class GrowingStream(LiveDispatcher):
+        def event(self, doc):
+            if doc["data"]["motor"] >= 2:
+                doc = dict(doc, data=dict(doc["data"], extra=1.0))
+            return super().event(doc)
+
+    ss = GrowingStream()
+    names = []
+    ss.subscribe(lambda name, doc: names.append((name, doc.get("seq_num"))))
+    for name, doc in [("start", run.start_doc), ("descriptor", desc.descriptor_doc)]:
+        ss(name, doc)
+    ss("event_page", pack_event_page(*make_events()))
+    assert names[2:] == [("event_page", [1, 2]), ("descriptor", None), ("event_page", [3, 4, 5, 6])]
+
+    # Events are still validated when their keys change
+    class BadStream(LiveDispatcher):
+        def event(self, doc):
+            if doc["data"]["motor"] >= 1:
+                doc = dict(doc, unexpected=True)
+            return super().event(doc)
+
+    ss = BadStream()
+    events = make_events()
+    for name, doc in [("start", run.start_doc), ("descriptor", desc.descriptor_doc), ("event", events[0])]:
+        ss(name, doc)
+    with pytest.raises(ValidationError):
+        ss("event", events[1])
+
+
+def test_emit_override_sees_every_document(RE, hw):
+    class RecordingStream(NegativeStream):
+        def __init__(self):
+            super().__init__()
+            self.names = []
+
+        def emit(self, name, doc):
+            self.names.append(DocumentNames(name).value)
+            super().emit(name, doc)
+
+    ss = RecordingStream()
+    RE(stepscan(hw.det, hw.motor), {"all": ss})
+    assert ss.names == ["start", "descriptor"] + ["event"] * 10 + ["stop"]
@@ -1,5 +1,6 @@
 import asyncio
 import operator
+import threading
 import time
 import warnings
 from functools import reduce
@@ -15,15 +16,20 @@ from bluesky.plan_stubs import complete_all, mv
 from bluesky.preprocessors import pchain
 from bluesky.run_engine import WaitForTimeoutError
 from bluesky.utils import (
+    AggregateStatus,
     AsyncInput,
     CallbackRegistry,
+    CompiledPlan,
+    DeviceMetadataCache,
     Msg,
     ensure_generator,
     is_movable,
     is_plan,
     merge_cycler,
     plan,
+    short_uid,
     truncate_json_overflow,
+    use_device_metadata_cache,
     warn_if_msg_args_or_kwargs,
 )
 
@@ -680,3 +686,168 @@ def test_truncate_json_overflow():
     data = {"nan": float("nan")}
     truncated_data = truncate_json_overflow(data)
     assert orjson.loads(orjson.dumps(truncated_data, option=orjson.OPT_STRICT_INTEGER))["nan"] is None
+
+
+def test_compiled_plan(RE, hw):
+    from bluesky.plans import scan
+
+    docs = []
+    RE(scan([hw.det], hw.motor, -1, 1, 5), lambda name, doc: docs.append(name))
+
+    compiled = CompiledPlan(scan, [hw.det], hw.motor, -1, 1, 5)
+    assert len(compiled) == len(list(scan([hw.det], hw.motor, -1, 1, 5)))
+    for _ in range(2):
+        compiled_docs = []
+        RE(compiled, lambda name, doc, compiled_docs=compiled_docs: compiled_docs.append((name, doc)))
+        assert [name for name, doc in compiled_docs] == docs
+
+    # Each execution records the responses to the messages on its own.
+    first, second = iter(compiled), iter(compiled)
+    RE(first)
+    RE(second)
+    open_run = [msg.command for msg in compiled.msgs].index("open_run")
+    assert first.responses[open_run] != second.responses[open_run]
+
+
+def test_compiled_plan_falls_back_on_exception(RE, hw):
+    from bluesky.plan_stubs import null
+    from bluesky.preprocessors import finalize_wrapper
+
+    class Boom(Exception): ...
+
+    async def boom(msg):
+        raise Boom
+
+    RE.register_command("boom", boom)
+    seen = []
+    RE.msg_hook = lambda msg: seen.append(msg.command)
+
+    def cleanup():
+        yield Msg("cleanup")
+
+    RE.register_command("cleanup", RE._null)
+
+    def plan_with_cleanup():
+        yield from null()
+        yield Msg("boom")
+        yield from null()
+
+    compiled = CompiledPlan(lambda: finalize_wrapper(plan_with_cleanup(), cleanup()))
+    assert [msg.command for msg in compiled.msgs] == ["null", "boom", "null", "cleanup"]
+    with pytest.raises(Boom):
+        RE(compiled)
+    assert seen == ["null", "boom", "cleanup"]
+
+
+def test_compiled_plan_fallback_checks_messages(RE, hw):
+    from bluesky.plan_stubs import abs_set, wait
+
+    class Boom(Exception): ...
+
+    async def boom(msg):
+        raise Boom
+
+    RE.register_command("boom", boom)
+    seen = []
+    RE.msg_hook = lambda msg: seen.append(msg)
+
+    def plan():
+        group = short_uid("move")  # a new group name each time the plan is made
+        yield from abs_set(hw.motor, 1, group=group)
+        try:
+            yield Msg("boom")
+        finally:
+            yield from wait(group=group)
+
+    with pytest.raises(Boom):
+        RE(CompiledPlan(plan))
+    # The fallback generator waits on the group the compiled plan used.
+    set_msg, _, wait_msg = seen
+    assert wait_msg.kwargs["group"] == set_msg.kwargs["group"]
+
+    # Messages that differ in their arguments are caught.
+    positions = iter([1, 2])
+
+    def moving_target():
+        yield from abs_set(hw.motor, next(positions))
+        yield Msg("boom")
+
+    with pytest.raises(RuntimeError, match="depends on responses"):
+        RE(CompiledPlan(moving_target))
+
+
+def test_compiled_plan_response_dependent(hw):
+    def dynamic():
+        reading = yield Msg("read", hw.det)
+        if reading["det"]["value"] > 0:
+            yield Msg("null")
+
+    with pytest.raises(ValueError):
+        CompiledPlan(dynamic)
+
+
+def test_aggregate_status():
+    from ophyd import StatusBase
+
+    first, second = StatusBase(), StatusBase()
+    status = AggregateStatus([first, second])
+    called = threading.Event()
+    status.add_callback(lambda st: called.set())
+    first.set_finished()
+    first.wait()
+    assert not status.done
+    second.set_finished()
+    assert status.exception(timeout=1) is None
+    assert called.wait(timeout=1)
+    assert status.success
+    assert AggregateStatus([]).success
+
+    failing = StatusBase()
+    status = AggregateStatus([StatusBase(), failing])
+    failing.set_exception(ValueError("boom"))
+    assert isinstance(status.exception(timeout=1), ValueError)
+    assert status.done and not status.success
+
+
+def test_device_metadata_cache(RE, hw):
+    import bluesky.plans as bp
+
+    calls = []
+
+    class SlowRepr:
+        name = "slow"
+        parent = None
+        token = 0
+
+        def __repr__(self):
+            calls.append(self.name)
+            return f"SlowRepr(name={self.name!r})"
+
+        def cache_token(self):
+            return self.token
+
+    cache = DeviceMetadataCache()
+    obj = SlowRepr()
+    assert cache.repr(obj) == cache.repr(obj) == "SlowRepr(name='slow')"
+    assert calls == ["slow"]
+    obj.name = "renamed"
+    assert cache.repr(obj) == "SlowRepr(name='renamed')"
+    obj.token = 1
+    cache.repr(obj)
+    assert calls == ["slow", "renamed", "renamed"]
+    cache.invalidate(obj)
+    assert obj not in cache
+
+    starts = []
+    previous = use_device_metadata_cache(cache)
+    try:
+        for _ in range(2):
+            RE(
+                bp.scan([hw.det], hw.motor, 0, 1, 2),
+                lambda name, doc: starts.append(doc) if name == "start" else None,
+            )
+        assert hw.motor in cache and hw.det in cache
+        assert starts[0]["plan_args"] == starts[1]["plan_args"]
+        assert starts[0]["plan_args"]["detectors"] == [repr(hw.det)]
+    finally:
+        use_device_metadata_cache(previous)
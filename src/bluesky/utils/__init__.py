@@ -41,6 +41,7 @@ from typing_extensions import TypeIs
 from bluesky._vendor.super_state_machine.errors import TransitionError
 from bluesky.protocols import (
     Asset,
+    HasCacheToken,
     HasHints,
     HasParent,
     Hints,
@@ -161,6 +162,70 @@ class PlanHalt(GeneratorExit):
 class RampFail(RuntimeError): ...
 
 
+class AggregateStatus:
+    """
+    A Status that completes when all of the given Status objects complete.
+
+    It fails as soon as any of them fails, with that one's exception.
+
+    Parameters
+    ----------
+    statuses : iterable
+        Status objects to aggregate. If empty, the AggregateStatus is done
+        (and successful) immediately.
+    """
+
+    def __init__(self, statuses: Iterable[Any]):
+        self.statuses = tuple(statuses)
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._callbacks: list[Callable[[Any], None]] = []
+        self._exception: Optional[BaseException] = None
+        self._remaining = len(self.statuses)
+        if not self.statuses:
+            self._event.set()
+        for status in self.statuses:
+            status.add_callback(self._status_finished)
+
+    def _status_finished(self, status):
+        with self._lock:
+            if self._event.is_set():
+                return
+            if status.success:
+                self._remaining -= 1
+                if self._remaining:
+                    return
+            else:
+                self._exception = status.exception(timeout=0) or FailedStatus(status)
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def add_callback(self, callback: Callable[[Any], None]) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def exception(self, timeout: Optional[float] = 0.0) -> Optional[BaseException]:
+        if not self._event.wait(timeout):
+            raise TimeoutError(f"{self!r} is not done after {timeout} seconds")
+        return self._exception
+
+    @property
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def success(self) -> bool:
+        return self.done and self._exception is None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(done={self.done}, success={self.success}, statuses={len(self.statuses)})"
+
+
 PLAN_TYPES: tuple[type, ...] = (types.GeneratorType,)
 try:
     from types import CoroutineType
@@ -682,29 +747,50 @@ def snake_cyclers(cyclers: list[Cycler], snake_booleans: list[bool]) -> Cycler:
         return reduce(operator.mul, cyclers)
 
     lengths = [len(c) for c in cyclers]
-    total_length = np.prod(lengths)
     new_cyclers = []
 
-    for i, (c, snake) in enumerate(zip(cyclers, snake_booleans)):
-        num_tiles = np.prod(lengths[:i])
-        num_repeats = np.prod(lengths[i + 1 :])
-
+    for c, indices in zip(cyclers, snake_indices(lengths, snake_booleans)):
         for k, v in c._transpose().items():
-            # Ensure the value is a NumPy array before using np.tile
-            v_ndarray = np.array(v)
-
-            if snake:
-                v_ndarray = np.concatenate([v_ndarray, v_ndarray[::-1]])  # Snake back-and-forth
-
-            # Use np.tile and np.repeat
-            v2 = np.tile(np.repeat(v_ndarray, num_repeats), int(num_tiles))
-            expanded = v2[:total_length]
-            new_cyclers.append(cycler(k, expanded))
+            # Ensure the value is a NumPy array before indexing
+            new_cyclers.append(cycler(k, np.array(v)[indices]))
 
     # Reduce by adding all the new cyclers
     return reduce(operator.add, new_cyclers)
 
 
+def snake_indices(lengths: list[int], snake_booleans: list[bool]) -> list[np.ndarray]:
+    """
+    Index arrays for combining axes with a 'snaking' back-and-forth order.
+
+    This is the vectorized core of :func:`snake_cyclers`: indexing the
+    positions of the i-th axis with the i-th array gives its positions at every
+    point of the combined trajectory.
+
+    Parameters
+    ----------
+    lengths : List[int]
+        The number of points along each axis, slowest first.
+    snake_booleans : List[bool]
+        Whether each axis should 'snake' (True) or not (False).
+
+    Returns
+    -------
+    indices : List[np.ndarray]
+        One integer array per axis, each with ``prod(lengths)`` entries.
+    """
+    total_length = int(np.prod(lengths))
+    indices = []
+    for i, (length, snake) in enumerate(zip(lengths, snake_booleans)):
+        num_tiles = int(np.prod(lengths[:i]))
+        num_repeats = int(np.prod(lengths[i + 1 :]))
+        base = np.arange(length)
+        if snake:
+            base = np.concatenate([base, base[::-1]])  # Snake back-and-forth
+        # Use np.tile and np.repeat
+        indices.append(np.tile(np.repeat(base, num_repeats), num_tiles)[:total_length])
+    return indices
+
+
 def first_key_heuristic(device):
     """
     Get the fully-qualified data key for the first entry in describe().
@@ -1216,6 +1302,106 @@ def expiring_function(func, loop, *args, **kwargs):
     return dummy
 
 
+class _TokenCache:
+    # Base for caches of per-object results kept across runs. The entries for
+    # an object are dropped whenever _token(obj) changes: by default, for
+    # objects implementing HasCacheToken, when their cache_token() changes.
+
+    def __init__(self) -> None:
+        self._entries: dict[Any, dict[str, Any]] = {}  # {obj: {entry name: cached value}}
+        self._tokens: dict[Any, Any] = {}  # {obj: _token(obj) when its entries were cached}
+
+    def _token(self, obj) -> Any:
+        return obj.cache_token() if isinstance(obj, HasCacheToken) else None
+
+    def _current_entries(self, obj) -> dict[str, Any]:
+        # The entries for obj, after dropping them if its token has changed.
+        token = self._token(obj)
+        if obj in self._tokens and self._tokens[obj] != token:
+            self.invalidate(obj)
+        self._tokens[obj] = token
+        return self._entries.get(obj, {})
+
+    def _store(self, obj, name: str, value):
+        self._entries.setdefault(obj, {})[name] = value
+
+    def invalidate(self, obj):
+        """Drop everything cached for obj."""
+        self._entries.pop(obj, None)
+        self._tokens.pop(obj, None)
+
+    def clear(self):
+        """Drop everything cached for all objects."""
+        self._entries.clear()
+        self._tokens.clear()
+
+    def __contains__(self, obj):
+        return obj in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DeviceMetadataCache(_TokenCache):
+    """
+    Cache of the repr of devices, kept across runs.
+
+    Plans record the repr of their detectors and motors in the 'plan_args'
+    metadata. For devices with large component trees this is slow, and it is
+    paid again on every run. Install an instance with
+    :func:`use_device_metadata_cache` to compute each repr once instead. A
+    device is ``repr``-ed again when its name changes, when its
+    :meth:`~bluesky.protocols.HasCacheToken.cache_token` changes, or after it
+    is passed to :meth:`invalidate`.
+    """
+
+    def _token(self, obj):
+        return getattr(obj, "name", None), super()._token(obj)
+
+    def repr(self, obj) -> str:
+        """Return ``repr(obj)``, computed at most once per device."""
+        entries = self._current_entries(obj)
+        if "repr" not in entries:
+            self._store(obj, "repr", repr(obj))
+        return self._entries[obj]["repr"]
+
+
+_device_metadata_cache: Optional[DeviceMetadataCache] = None
+
+
+def use_device_metadata_cache(cache: Optional[DeviceMetadataCache]) -> Optional[DeviceMetadataCache]:
+    """
+    Install a DeviceMetadataCache for the built-in plans to use.
+
+    Parameters
+    ----------
+    cache : DeviceMetadataCache or None
+        the cache to use, or None (the default) to call ``repr`` every time
+
+    Returns
+    -------
+    previous : DeviceMetadataCache or None
+        the cache that was installed before
+    """
+    global _device_metadata_cache
+    previous, _device_metadata_cache = _device_metadata_cache, cache
+    return previous
+
+
+def device_repr(obj) -> str:
+    """
+    Return ``repr(obj)`` for plan metadata, from the installed DeviceMetadataCache if any.
+
+    Objects that cannot be cached (unhashable ones) are always ``repr``-ed.
+    """
+    if _device_metadata_cache is None:
+        return repr(obj)
+    try:
+        return _device_metadata_cache.repr(obj)
+    except TypeError:
+        return repr(obj)
+
+
 def short_uid(label=None, truncate=6):
     "Return a readable but unique id like 'label-fjfi5a'"
     if label:
@@ -1615,6 +1801,10 @@ def merge_cycler(cyc):
     if len(co) == len(gb) == 0:
         return cyc
 
+    if not isinstance(cyc, Cycler):
+        # e.g. a bluesky.plan_patterns.Trajectory
+        cyc = cyc.to_cycler()
+
     input_data = cyc.by_key()
     output_data = [cycler(i, input_data[i]) for i in io | co]
 
@@ -1960,15 +2150,20 @@ async def maybe_await(ret: SyncOrAsync[T]) -> T:
 
 
 class Plan:
-    __slots__ = ("_iter", "_stack")
+    __slots__ = ("_iter", "_stack", "_name")
 
     def __init__(self, f, *args, **kwargs) -> None:
         self._iter = f(*args, **kwargs)
-        self._stack = traceback.format_stack()
-        self._stack = self._stack[:-2]
-        self._stack += [
-            f"RuntimeWarning: plan `{f.__name__}` was never iterated, did you mean to use `yield from`?"
-        ]
+        self._name = f.__name__
+        # Only record where the caller's stack frames are; formatting them
+        # (and reading the source lines) is deferred until the warning below
+        # is issued, which keeps creating plans cheap in deeply nested plans.
+        stack = []
+        frame: Optional[types.FrameType] = sys._getframe(2)
+        while frame is not None:
+            stack.append((frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+        self._stack = stack
 
     def __iter__(self):
         self._stack = None
@@ -1980,7 +2175,14 @@ class Plan:
 
     def __del__(self):
         if self._stack:
-            warning_message = "\n" + "".join(self._stack)
+            warning_message = "\n" + "".join(
+                [
+                    *traceback.StackSummary.from_list(
+                        [(code.co_filename, lineno, code.co_name, None) for code, lineno in reversed(self._stack)]
+                    ).format(),
+                    f"RuntimeWarning: plan `{self._name}` was never iterated, did you mean to use `yield from`?",
+                ]
+            )
             warnings.warn(warning_message, RuntimeWarning, stacklevel=1)
 
     def send(self, value):
@@ -2036,6 +2238,215 @@ def is_plan(bs_plan):
     return inspect.isgeneratorfunction(bs_plan) or getattr(bs_plan, "_is_plan_", False)
 
 
+class CompiledPlan:
+    """
+    A plan pre-expanded into a fixed sequence of messages.
+
+    Many plans (e.g. :func:`~bluesky.plans.scan` or
+    :func:`~bluesky.plans.grid_scan` with a fixed list of detectors) yield the
+    same messages whatever the RunEngine sends back to them. Such a plan can be
+    expanded once, ahead of time, and then executed any number of times
+    without going through its stack of generators and preprocessors: the
+    RunEngine steps through the message array directly. Each execution
+    (each ``iter(compiled)``) stores the response to each message in a slot
+    of its own ``responses`` list, so a compiled plan can be executed several
+    times at once, e.g. nested in itself.
+
+    The plan is expanded by sending ``None`` in response to every message, the
+    way :func:`~bluesky.simulators.summarize_plan` does. If the plan fails
+    while being expanded, it cannot be compiled and ``ValueError`` is raised.
+    It is up to the caller to only compile plans whose messages do not depend
+    on responses (e.g. not :func:`~bluesky.plans.adaptive_scan`) and which are
+    finite.
+
+    The whole plan is compiled or not at all: there is no fallback to a
+    generator for just the dynamic sections of a plan. To combine the two,
+    compile the static sections separately and ``yield from`` them in an
+    ordinary plan that contains the dynamic sections.
+
+    If an exception is thrown into the plan while it executes (e.g. a failed
+    status, or a pause followed by a stop) a fresh generator is created with
+    ``plan_func(*args, **kwargs)``, fast-forwarded to the current message by
+    sending it the recorded responses, and the exception is thrown into it, so
+    that clean-up (``finalize_wrapper``, ``contingency_wrapper``, ...) runs
+    exactly as it would for the uncompiled plan. From there on, execution
+    continues with the generator. The messages the fresh generator yields
+    while it is fast-forwarded must equal the compiled ones, except that
+    group names may differ (they are often made with a new uid each time);
+    its later messages are given the group names of the compiled plan.
+
+    A compiled plan can be passed to the RunEngine, or embedded in a dynamic
+    plan with ``yield from``.
+
+    Parameters
+    ----------
+    plan_func : callable
+        returns a new plan (generator) each time it is called with
+        ``*args, **kwargs``; wrap plans built from other generator instances
+        in a function, e.g. ``lambda: finalize_wrapper(plan(), cleanup())``
+    args :
+        passed through to ``plan_func``
+    kwargs :
+        passed through to ``plan_func``
+
+    Attributes
+    ----------
+    msgs : tuple
+        the messages of the plan
+    return_value : any
+        the value returned by the plan when it was expanded
+
+    Examples
+    --------
+    >>> compiled = CompiledPlan(grid_scan, [det], motor1, -1, 1, 100, motor2, -1, 1, 100)
+    >>> RE(compiled)
+    >>> RE(compiled)  # run again, without re-expanding the plan
+    """
+
+    def __init__(self, plan_func, *args, **kwargs):
+        self._plan_func = plan_func
+        self._args = args
+        self._kwargs = kwargs
+        msgs = []
+        gen = ensure_generator(plan_func(*args, **kwargs))
+        try:
+            msg = next(gen)
+            while True:
+                msgs.append(msg)
+                msg = gen.send(None)
+        except StopIteration as e:
+            self.return_value = e.value
+        except Exception as e:
+            raise ValueError(
+                f"The plan {plan_func!r} could not be expanded without responses "
+                f"(it failed after {len(msgs)} messages), so it cannot be compiled."
+            ) from e
+        self.msgs = tuple(msgs)
+
+    def __len__(self):
+        return len(self.msgs)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._plan_func!r}, {len(self.msgs)} messages)"
+
+    def __iter__(self):
+        return _CompiledPlanIterator(self)
+
+    def _resume_as_generator(self, index, responses):
+        # Return a fresh generator suspended at the yield of msgs[index], and
+        # a mapping from its group names to those of the compiled messages.
+        gen = ensure_generator(self._plan_func(*self._args, **self._kwargs))
+        groups = {}
+        if index < 0:
+            return gen, groups
+        msg = gen.send(None)
+        for i in range(index + 1):
+            expected = self.msgs[i]
+            if not _same_msg(msg, expected, groups):
+                raise RuntimeError(
+                    f"The plan {self._plan_func!r} yielded {msg} where it was compiled to yield {expected}; "
+                    "it depends on responses and should not be compiled."
+                )
+            if i < index:
+                msg = gen.send(responses[i])
+        return gen, groups
+
+
+def _same_msg(msg, expected, groups):
+    # Compare two messages in full, except that group names only need to
+    # correspond one-to-one; the correspondence is recorded in groups.
+    if msg.command != expected.command or msg.obj is not expected.obj or msg.run != expected.run:
+        return False
+    if msg.kwargs.keys() != expected.kwargs.keys() or not _same_value(msg.args, expected.args):
+        return False
+    for key, value in msg.kwargs.items():
+        if key == "group" and value is not None and expected.kwargs[key] is not None:
+            if groups.setdefault(value, expected.kwargs[key]) != expected.kwargs[key]:
+                return False
+        elif not _same_value(value, expected.kwargs[key]):
+            return False
+    return True
+
+
+def _same_value(a, b):
+    # Equality that also copes with arrays, including arrays nested in
+    # sequences and mappings.
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    if isinstance(a, (tuple, list)) and isinstance(b, (tuple, list)):
+        return type(a) is type(b) and len(a) == len(b) and all(map(_same_value, a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same_value(a[key], b[key]) for key in a)
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+class _CompiledPlanIterator:
+    # Steps through the message array of a CompiledPlan, with the same
+    # send/throw/close interface as a generator so that the RunEngine,
+    # plan_mutator and 'yield from' can drive it directly.
+    __slots__ = ("_compiled", "_msgs", "responses", "_index", "_gen", "_groups")
+
+    def __init__(self, compiled):
+        self._compiled = compiled
+        self._msgs = compiled.msgs
+        self.responses = [None] * len(self._msgs)
+        self._index = -1
+        self._gen = None
+        self._groups = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, value):
+        if self._gen is not None:
+            return self._rename_groups(self._gen.send(value))
+        index = self._index
+        if index >= 0:
+            self.responses[index] = value
+        index += 1
+        self._index = index
+        if index >= len(self._msgs):
+            self._index = len(self._msgs)
+            raise StopIteration(self._compiled.return_value)
+        return self._msgs[index]
+
+    def throw(self, typ, val=None, tb=None):
+        if self._gen is None:
+            if self._index >= len(self._msgs):
+                # Exhausted, like a finished generator.
+                raise typ if val is None else val
+            # Fall back to the plan itself to handle the exception.
+            self._gen, self._groups = self._compiled._resume_as_generator(self._index, self.responses)
+        if val is None and tb is None:
+            return self._rename_groups(self._gen.throw(typ))
+        return self._rename_groups(self._gen.throw(typ, val, tb))
+
+    def _rename_groups(self, msg):
+        # Give messages from the fallback generator the group names that the
+        # messages already executed used.
+        group = msg.kwargs.get("group")
+        if group is not None and group in self._groups:
+            return msg._replace(kwargs={**msg.kwargs, "group": self._groups[group]})
+        return msg
+
+    def close(self):
+        if self._gen is not None:
+            self._gen.close()
+        self._index = len(self._msgs)
+
+
+# The RunEngine and ensure_generator can iterate a CompiledPlan directly.
+PLAN_TYPES = PLAN_TYPES + (_CompiledPlanIterator,)
+
+
 def truncate_json_overflow(data):
     """Truncate large numerical values to avoid overflow issues when serializing as JSON.
 